@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Decision Record Analytics
+Indexes decision records from any number of repositories into a local SQLite
+database, incrementally by size and mtime, and answers fleet-wide questions
+(phase durations, stalled phases, record growth) from indexed queries
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from pipeline_common import DEFAULT_CACHE_DIR, load_script
+
+
+DEFAULT_DB = DEFAULT_CACHE_DIR / "decision-analytics.sqlite"
+
+# Bump when the tables change; older databases are rebuilt from the records
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE records (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    repository TEXT,
+    issue INTEGER,
+    title TEXT,
+    current_phase TEXT,
+    completion INTEGER,
+    lines INTEGER NOT NULL,
+    words INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    indexed_at INTEGER NOT NULL
+);
+CREATE TABLE phases (
+    record_id INTEGER NOT NULL REFERENCES records(id) ON DELETE CASCADE,
+    phase TEXT NOT NULL,
+    status TEXT,
+    complete INTEGER NOT NULL,
+    started INTEGER,
+    completed INTEGER,
+    PRIMARY KEY (record_id, phase)
+) WITHOUT ROWID;
+CREATE TABLE record_growth (
+    record_id INTEGER NOT NULL REFERENCES records(id) ON DELETE CASCADE,
+    observed_at INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    lines INTEGER NOT NULL,
+    PRIMARY KEY (record_id, observed_at)
+) WITHOUT ROWID;
+CREATE INDEX records_by_repository ON records(repository);
+CREATE INDEX phases_by_state ON phases(complete, started);
+"""
+
+# "- **Started**: 2025-08-17T14:30:00-05:00"
+FIELD = re.compile(r'^\s*- \*\*([^*]+)\*\*: *(.*?)\s*$')
+ISSUE_NUMBER = re.compile(r'#?(\d+)')
+PERCENTAGE = re.compile(r'(\d+)\s*%')
+
+REPORTS = ("summary", "phases", "stalled", "growth", "repos")
+
+
+def parse_timestamp(value):
+    """Epoch seconds for an ISO date or datetime field, or None (placeholders, 'N/A', ...)"""
+    try:
+        parsed = datetime.fromisoformat(value.strip())
+    except (AttributeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+def parse_record(path, iter_sections):
+    """The record row and phase rows of one decision record, in a single pass"""
+    record = {"repository": None, "issue": None, "title": None, "current_phase": None,
+              "completion": None, "lines": 1, "words": 0}
+    phases = []
+
+    for section in iter_sections(path):
+        fields = {}
+        for line in section.lines:
+            record["lines"] += line.endswith("\n")
+            record["words"] += len(line.split())
+            if line.lstrip().startswith("- **"):
+                match = FIELD.match(line)
+                if match:
+                    fields.setdefault(match.group(1), match.group(2))
+
+        if "Issue Context" in section.header:
+            issue = ISSUE_NUMBER.search(fields.get("Issue", ""))
+            record["issue"] = int(issue.group(1)) if issue else None
+            record["repository"] = fields.get("Repository")
+            record["title"] = fields.get("Title")
+        elif "Current Status" in section.header:
+            completion = PERCENTAGE.search(fields.get("Completion", ""))
+            record["current_phase"] = fields.get("Phase")
+            record["completion"] = int(completion.group(1)) if completion else None
+        elif section.phase:
+            completed = parse_timestamp(fields.get("Completed"))
+            phases.append({
+                "phase": section.phase,
+                "status": fields.get("Status"),
+                "complete": int(section.complete or completed is not None),
+                "started": parse_timestamp(fields.get("Started")),
+                "completed": completed
+            })
+    return record, phases
+
+
+class AnalyticsIndex:
+    """SQLite index of decision records across repositories"""
+
+    def __init__(self, db_path=DEFAULT_DB):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(self.db_path)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA foreign_keys = ON")
+        self.db.execute("PRAGMA journal_mode = WAL")
+        if self.db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            with self.db:
+                for table in ("record_growth", "phases", "records"):
+                    self.db.execute(f"DROP TABLE IF EXISTS {table}")
+                self.db.executescript(SCHEMA)
+                self.db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self):
+        self.db.close()
+
+    def update(self, roots):
+        """Index new and changed records below ``roots`` and forget deleted ones.
+
+        Records whose size and mtime match the database are not opened.
+        """
+        manage = load_script("manage-decision-record")
+        start = time.perf_counter()
+        now = int(time.time())
+        counts = {"indexed": 0, "unchanged": 0, "skipped": 0, "removed": 0, "failed": 0}
+
+        with self.db:
+            for root in roots:
+                root = Path(root).resolve()
+                if root.is_file():
+                    paths, low, high = [root], str(root), f"{root}\0"
+                else:
+                    # Every path below root sorts between "root/" and "root0" ('0' follows '/')
+                    paths, low, high = manage.DecisionTree(root).records(), f"{root}/", f"{root}0"
+                known = {row["path"]: (row["id"], row["size"], row["mtime_ns"]) for row in self.db.execute(
+                    "SELECT id, path, size, mtime_ns FROM records WHERE path >= ? AND path < ?", (low, high))}
+
+                for path in paths:
+                    key = str(path)
+                    try:
+                        stat = path.stat()
+                    except OSError:  # deleted since the walk; its row is removed below
+                        counts["skipped"] += 1
+                        continue
+                    entry = known.pop(key, None)
+                    if entry and entry[1:] == (stat.st_size, stat.st_mtime_ns):
+                        counts["unchanged"] += 1
+                        continue
+                    try:
+                        record, phases = parse_record(path, manage.iter_sections)
+                    except (OSError, UnicodeDecodeError) as e:
+                        print(f"⚠️  {key}: {e}", file=sys.stderr)
+                        counts["failed"] += 1
+                        continue
+                    self._store(key, stat, record, phases, now)
+                    counts["indexed"] += 1
+
+                # Records under this root that no longer exist
+                for record_id, _, _ in known.values():
+                    self.db.execute("DELETE FROM records WHERE id = ?", (record_id,))
+                    counts["removed"] += 1
+
+        counts["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        return counts
+
+    def _store(self, path, stat, record, phases, now):
+        row = dict(record, path=path, size=stat.st_size, mtime_ns=stat.st_mtime_ns, indexed_at=now)
+        # Upsert, then look the id up: RETURNING needs SQLite 3.35, and lastrowid
+        # isn't set when the conflict turns the insert into an update
+        self.db.execute(
+            """INSERT INTO records (path, repository, issue, title, current_phase, completion,
+                                    lines, words, size, mtime_ns, indexed_at)
+               VALUES (:path, :repository, :issue, :title, :current_phase, :completion,
+                       :lines, :words, :size, :mtime_ns, :indexed_at)
+               ON CONFLICT(path) DO UPDATE SET
+                   repository = excluded.repository, issue = excluded.issue, title = excluded.title,
+                   current_phase = excluded.current_phase, completion = excluded.completion,
+                   lines = excluded.lines, words = excluded.words, size = excluded.size,
+                   mtime_ns = excluded.mtime_ns, indexed_at = excluded.indexed_at""", row)
+        record_id = self.db.execute("SELECT id FROM records WHERE path = ?", (path,)).fetchone()[0]
+        self.db.execute("DELETE FROM phases WHERE record_id = ?", (record_id,))
+        self.db.executemany(
+            """INSERT OR REPLACE INTO phases (record_id, phase, status, complete, started, completed)
+               VALUES (:record_id, :phase, :status, :complete, :started, :completed)""",
+            [dict(phase, record_id=record_id) for phase in phases])
+        self.db.execute("INSERT OR REPLACE INTO record_growth VALUES (?, ?, ?, ?)",
+                        (record_id, now, stat.st_size, record["lines"]))
+
+    def report(self, name, days=7, limit=20):
+        """Rows of one aggregate report (see REPORTS)"""
+        now = int(time.time())
+        queries = {
+            "summary": ("""SELECT COUNT(*) AS records, COUNT(DISTINCT repository) AS repositories,
+                                  ROUND(AVG(completion), 1) AS avg_completion,
+                                  SUM(size) AS total_bytes, SUM(lines) AS total_lines,
+                                  (SELECT COUNT(*) FROM phases WHERE complete = 0 AND started IS NOT NULL)
+                                      AS active_phases
+                           FROM records""", ()),
+            "phases": ("""SELECT phase, COUNT(*) AS records, SUM(complete) AS completed,
+                                 SUM(complete = 0 AND started IS NOT NULL) AS in_progress,
+                                 ROUND(AVG(completed - started) / 3600.0, 2) AS avg_hours,
+                                 ROUND(MAX(completed - started) / 3600.0, 2) AS max_hours,
+                                 ROUND(MAX(CASE WHEN complete = 0 THEN ? - started END) / 3600.0, 2)
+                                     AS oldest_open_hours
+                          FROM phases GROUP BY phase ORDER BY avg_hours DESC""", (now,)),
+            "stalled": ("""SELECT r.repository, r.issue, p.phase, p.status,
+                                  ROUND((? - p.started) / 3600.0, 2) AS open_hours, r.path
+                           FROM phases p JOIN records r ON r.id = p.record_id
+                           WHERE p.complete = 0 AND p.started IS NOT NULL AND p.started < ?
+                           ORDER BY p.started LIMIT ?""", (now, now - days * 86400, limit)),
+            "growth": ("""SELECT r.path, r.repository, r.issue, MIN(g.size) AS first_bytes, r.size AS bytes,
+                                 r.size - MIN(g.size) AS growth_bytes, COUNT(*) AS observations
+                          FROM record_growth g JOIN records r ON r.id = g.record_id
+                          GROUP BY g.record_id ORDER BY growth_bytes DESC, bytes DESC LIMIT ?""", (limit,)),
+            "repos": ("""SELECT repository, COUNT(*) AS records, ROUND(AVG(completion), 1) AS avg_completion,
+                                SUM(size) AS total_bytes
+                         FROM records GROUP BY repository ORDER BY records DESC""", ()),
+        }
+        sql, params = queries[name]
+        return [dict(row) for row in self.db.execute(sql, params)]
+
+
+def print_rows(rows):
+    if not rows:
+        print("No matching records")
+        return
+    columns = list(rows[0])
+    widths = [max(len(column), *(len(str(row[column])) for row in rows)) for column in columns]
+    print("  ".join(column.ljust(width) for column, width in zip(columns, widths)))
+    print("  ".join("-" * width for width in widths))
+    for row in rows:
+        print("  ".join(str(row[column]).ljust(width) for column, width in zip(columns, widths)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index decision records into SQLite and report on them")
+    parser.add_argument("--db", default=str(DEFAULT_DB),
+                       help="SQLite database (default: <cache dir>/decision-analytics.sqlite)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    index_parser = subparsers.add_parser("index", help="Index new and changed decision records")
+    index_parser.add_argument("roots", nargs="+", help="Decision record files or directories of them")
+
+    report_parser = subparsers.add_parser("report", help="Print an aggregate report")
+    report_parser.add_argument("report", choices=REPORTS, help="Report to print")
+    report_parser.add_argument("--days", type=float, default=7,
+                              help="Phases open longer than this count as stalled")
+    report_parser.add_argument("--limit", type=int, default=20,
+                              help="Maximum rows for the stalled and growth reports")
+    report_parser.add_argument("--output", choices=["text", "json"], default="text",
+                              help="Output format")
+
+    args = parser.parse_args()
+
+    index = AnalyticsIndex(args.db)
+    try:
+        if args.command == "index":
+            counts = index.update(args.roots)
+            print(f"✅ Indexed {counts['indexed']} record(s), {counts['unchanged']} unchanged, "
+                  f"{counts['removed']} removed, {counts['skipped']} skipped ({counts['elapsed_ms']:.1f} ms)")
+            sys.exit(0 if not counts["failed"] else 1)
+
+        rows = index.report(args.report, days=args.days, limit=args.limit)
+        if args.output == "json":
+            print(json.dumps(rows, indent=2))
+        else:
+            print(f"📊 {args.report.capitalize()} report")
+            print_rows(rows)
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+File Watcher
+Reports batches of changed files under a set of paths, using inotify where
+available and polling elsewhere; used by the --watch modes of the pipeline CLIs
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import fnmatch
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+
+# inotify event masks (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def _load_inotify():
+    """libc with inotify support, or None where it isn't available"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:
+        return None
+    return libc if hasattr(libc, "inotify_init1") else None
+
+
+class FileWatcher:
+    """Yields sets of changed files below ``paths``, one set per burst of edits.
+
+    ``paths`` may be files or directories (watched recursively). Only files
+    matching ``patterns`` are reported, and directories for which ``ignore_dir``
+    returns True are skipped. A burst ends once no further change has been
+    seen for ``debounce`` seconds.
+
+    Paths are resolved up front and changes are reported as resolved paths:
+    inotify hands out one watch per directory inode, so "configs" and
+    "/repo/configs" must map to the same watch and the same file names.
+    """
+
+    def __init__(self, paths, patterns=("*",), debounce=0.3, poll_interval=0.5,
+                 ignore_dir=None, use_inotify=True):
+        self.paths = [Path(path).resolve() for path in paths]
+        self.patterns = patterns
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.ignore_dir = ignore_dir or (lambda name: name.startswith("."))
+        self._libc = _load_inotify() if use_inotify else None
+        self._fd = None
+        self._watches = {}
+        if self._libc is not None:
+            self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if self._fd < 0:
+                self._fd = None
+            else:
+                for directory in self._directories():
+                    self._add_watch(directory)
+        self._snapshot = None if self._fd is not None else self._scan()
+
+    @property
+    def backend(self):
+        return "inotify" if self._fd is not None else "polling"
+
+    def _matches(self, path):
+        if any(Path(path) == watched for watched in self.paths):
+            return True
+        return any(fnmatch.fnmatch(os.path.basename(path), pattern) for pattern in self.patterns)
+
+    def _directories(self):
+        """Directories to watch: parents of watched files and watched trees"""
+        directories = set()
+        for path in self.paths:
+            if path.is_dir():
+                for dirpath, dirnames, _ in os.walk(path):
+                    dirnames[:] = [d for d in dirnames if not self.ignore_dir(d)]
+                    directories.add(dirpath)
+            else:
+                directories.add(str(path.parent))
+        return directories
+
+    def files(self):
+        """Every file currently matched below the watched paths"""
+        files = set()
+        for path in self.paths:
+            if path.is_dir():
+                for dirpath, dirnames, filenames in os.walk(path):
+                    dirnames[:] = [d for d in dirnames if not self.ignore_dir(d)]
+                    files.update(os.path.join(dirpath, name) for name in filenames
+                                 if self._matches(name))
+            elif path.exists():
+                files.add(str(path))
+        return files
+
+    def _add_watch(self, directory):
+        directory = str(Path(directory).resolve())
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd >= 0:
+            self._watches[wd] = directory
+
+    def _scan(self):
+        snapshot = {}
+        for path in self.files():
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def _read_events(self, timeout):
+        """Changed paths from inotify events arriving within ``timeout`` seconds"""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed, offset = set(), 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0").decode(errors="replace")
+            offset += length
+            directory = self._watches.get(wd)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, name)
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and not self.ignore_dir(name):
+                    self._add_watch(path)
+            elif self._matches(path) and self._is_watched(path):
+                changed.add(path)
+        return changed
+
+    def _is_watched(self, path):
+        """Whether a path reported by inotify falls under one of the watched paths"""
+        for watched in self.paths:
+            if Path(path) == watched or (watched.is_dir() and watched in Path(path).parents):
+                return True
+        return False
+
+    def _poll(self, timeout):
+        """Changed paths from comparing directory scans ``timeout`` seconds apart"""
+        time.sleep(timeout)
+        snapshot = self._scan()
+        changed = {path for path in snapshot.keys() | self._snapshot.keys()
+                   if snapshot.get(path) != self._snapshot.get(path)}
+        self._snapshot = snapshot
+        return changed
+
+    def wait(self):
+        """Block until a burst of changes has settled; return the changed paths"""
+        read = self._read_events if self._fd is not None else self._poll
+        changed = set()
+        while not changed:
+            changed = read(None if self._fd is not None else self.poll_interval)
+        while True:
+            more = read(self.debounce)
+            if not more:
+                return changed
+            changed |= more
+
+    def __iter__(self):
+        while True:
+            yield self.wait()
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print batches of changed files")
+    parser.add_argument("paths", nargs="+", help="Files or directories to watch")
+    parser.add_argument("--pattern", action="append",
+                       help="Only report files matching this glob (repeatable)")
+    parser.add_argument("--debounce", type=float, default=0.3,
+                       help="Seconds without changes that end a burst")
+    parser.add_argument("--poll", action="store_true",
+                       help="Poll instead of using inotify")
+
+    args = parser.parse_args()
+
+    watcher = FileWatcher(args.paths, patterns=tuple(args.pattern or ["*"]),
+                          debounce=args.debounce, use_inotify=not args.poll)
+    print(f"👀 Watching {len(args.paths)} path(s) with {watcher.backend}", flush=True)
+    try:
+        for changed in watcher:
+            for path in sorted(changed):
+                print(path, flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+GitHub Identity Checks
+Confirms that team usernames in pipeline configs are real GitHub accounts,
+looking up each distinct name once, concurrently, through a pluggable backend
+with a persistent TTL cache
+"""
+
+import argparse
+import asyncio
+import http.client
+import json
+import os
+import sys
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from pipeline_common import DEFAULT_CACHE_DIR, write_atomic
+
+
+DEFAULT_API_URL = os.environ.get("ATRIUMN_GITHUB_API_URL", "https://api.github.com")
+DEFAULT_CACHE_FILE = DEFAULT_CACHE_DIR / "identities.json"
+
+# Seconds a lookup result stays valid in the cache
+DEFAULT_TTL = 24 * 3600
+DEFAULT_CONCURRENCY = 8
+DEFAULT_RETRIES = 4
+# Upper bound on any single rate-limit or error backoff, in seconds
+MAX_BACKOFF = 60
+
+# Config fields holding "@username" values
+TEAM_USER_FIELDS = ("default_reviewers", "domain_experts", "tech_lead")
+
+
+def team_usernames(config):
+    """(field path, username) pairs for every team member named in a config"""
+    team = config.get("team") if isinstance(config, dict) else None
+    if not isinstance(team, dict):
+        return []
+    users = []
+    for reviewer in team.get("default_reviewers") or []:
+        users.append(("team.default_reviewers", reviewer))
+    for domain, expert in (team.get("domain_experts") or {}).items():
+        users.append((f"team.domain_experts.{domain}", expert))
+    if team.get("tech_lead"):
+        users.append(("team.tech_lead", team["tech_lead"]))
+    return [(field, user.lstrip("@")) for field, user in users if isinstance(user, str)]
+
+
+class IdentityCache:
+    """Lookup results on disk, each valid for ``ttl`` seconds.
+
+    Only definite answers (exists / doesn't exist) are stored; failed
+    lookups are retried on the next run.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_FILE, ttl=DEFAULT_TTL):
+        self.path = Path(path)
+        self.ttl = ttl
+        try:
+            with open(self.path, 'r') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def get(self, username):
+        """True/False from a fresh entry, or None if unknown or expired"""
+        entry = self.entries.get(username.lower())
+        if entry is None or time.time() - entry["checked"] > self.ttl:
+            return None
+        return entry["exists"]
+
+    def update(self, results):
+        """Store definite results and write the cache file"""
+        now = time.time()
+        for username, exists in results.items():
+            if exists is not None:
+                self.entries[username.lower()] = {"exists": exists, "checked": now}
+        self.entries = {name: entry for name, entry in self.entries.items()
+                        if now - entry["checked"] <= self.ttl}
+        write_atomic(self.path, json.dumps(self.entries))
+
+
+class GitHubBackend:
+    """Looks users up with ``GET {api_url}/users/{name}``.
+
+    Requests run concurrently over a pool of keep-alive connections. A 403
+    or 429 rate-limit response (or an exhausted X-RateLimit-Remaining) pauses
+    every request until Retry-After / X-RateLimit-Reset; other failures back
+    off exponentially. ``api_url`` may point at any GitHub-compatible server,
+    such as a local stand-in for tests.
+    """
+
+    def __init__(self, api_url=DEFAULT_API_URL, token=None, concurrency=DEFAULT_CONCURRENCY,
+                 retries=DEFAULT_RETRIES, timeout=10):
+        url = urllib.parse.urlsplit(api_url)
+        self._connection_class = (http.client.HTTPSConnection if url.scheme == "https"
+                                  else http.client.HTTPConnection)
+        self._netloc = url.netloc
+        self._base_path = url.path.rstrip("/")
+        self._headers = {"Accept": "application/vnd.github+json", "User-Agent": "atriumn-pipeline"}
+        token = token if token is not None else os.environ.get("GITHUB_TOKEN")
+        if token:
+            self._headers["Authorization"] = f"Bearer {token}"
+        self.concurrency = concurrency
+        self.retries = retries
+        self.timeout = timeout
+        self.requests = 0
+        self._pool = []
+        self._pool_lock = threading.Lock()
+        self._paused_until = 0.0
+
+    def _get(self, path):
+        """One blocking GET on a pooled connection: (status, headers), or (None, {}) on I/O errors"""
+        with self._pool_lock:
+            connection = self._pool.pop() if self._pool else None
+            self.requests += 1
+        if connection is None:
+            connection = self._connection_class(self._netloc, timeout=self.timeout)
+        try:
+            connection.request("GET", self._base_path + path, headers=self._headers)
+            response = connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            return None, {}
+        with self._pool_lock:
+            self._pool.append(connection)
+        return response.status, {key.lower(): value for key, value in response.getheaders()}
+
+    def _backoff(self, status, headers, attempt):
+        """Seconds to wait before retrying, pausing all requests when rate limited"""
+        delay = min(2 ** attempt * 0.5, MAX_BACKOFF)
+        retry_after = _retry_after(headers["retry-after"]) if "retry-after" in headers else None
+        if retry_after is not None:
+            delay = retry_after
+        elif headers.get("x-ratelimit-remaining") == "0" and "x-ratelimit-reset" in headers:
+            delay = float(headers["x-ratelimit-reset"]) - time.time()
+        delay = min(max(delay, 0.0), MAX_BACKOFF)
+        if status in (403, 429):
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        return delay
+
+    async def lookup(self, username, executor):
+        """True if the user exists, False if not, None if it couldn't be determined"""
+        loop = asyncio.get_running_loop()
+        path = f"/users/{urllib.parse.quote(username)}"
+        for attempt in range(self.retries + 1):
+            pause = self._paused_until - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+            status, headers = await loop.run_in_executor(executor, self._get, path)
+            if status == 200:
+                return True
+            if status == 404:
+                return False
+            if status is not None and status not in (403, 429) and status < 500:
+                return None
+            if attempt < self.retries:
+                await asyncio.sleep(self._backoff(status, headers, attempt))
+        return None
+
+    async def lookup_many(self, usernames):
+        semaphore = asyncio.Semaphore(self.concurrency)
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            async def bounded(username):
+                async with semaphore:
+                    return username, await self.lookup(username, executor)
+            results = await asyncio.gather(*(bounded(username) for username in usernames))
+        for connection in self._pool:
+            connection.close()
+        self._pool.clear()
+        return dict(results)
+
+
+def _retry_after(value):
+    """Seconds to wait from a Retry-After header (delay-seconds or an HTTP date), or None"""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    from datetime import timezone
+    from email.utils import parsedate_to_datetime
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:  # "-0000" dates are UTC too
+        when = when.replace(tzinfo=timezone.utc)
+    return when.timestamp() - time.time()
+
+
+# Registered backends; each takes the options of GitHubBackend it understands
+BACKENDS = {"github": GitHubBackend}
+
+
+class IdentityChecker:
+    """Deduplicated, cached existence checks for many usernames at once"""
+
+    def __init__(self, backend, cache=None):
+        self.backend = backend
+        self.cache = cache
+
+    def check(self, usernames):
+        """{username: True/False/None} for each distinct username (case-insensitive)"""
+        distinct = {}
+        for username in usernames:
+            distinct.setdefault(username.lower(), username)
+
+        results, pending = {}, []
+        for key, username in distinct.items():
+            cached = self.cache.get(username) if self.cache is not None else None
+            if cached is None:
+                pending.append(username)
+            else:
+                results[username] = cached
+
+        if pending:
+            looked_up = asyncio.run(self.backend.lookup_many(pending))
+            results.update(looked_up)
+            if self.cache is not None:
+                self.cache.update(looked_up)
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that GitHub usernames exist")
+    parser.add_argument("usernames", nargs="+", help="Usernames, with or without a leading @")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="github",
+                       help="Identity backend")
+    parser.add_argument("--api-url", default=DEFAULT_API_URL,
+                       help="Base URL of the GitHub-compatible API (default: $ATRIUMN_GITHUB_API_URL "
+                            "or https://api.github.com)")
+    parser.add_argument("--cache-file", default=str(DEFAULT_CACHE_FILE),
+                       help="Persistent lookup cache")
+    parser.add_argument("--ttl", type=float, default=DEFAULT_TTL,
+                       help="Seconds a cached lookup stays valid")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                       help="Concurrent lookups")
+
+    args = parser.parse_args()
+
+    backend = BACKENDS[args.backend](api_url=args.api_url, concurrency=args.concurrency)
+    checker = IdentityChecker(backend, IdentityCache(args.cache_file, args.ttl))
+    results = checker.check(username.lstrip("@") for username in args.usernames)
+
+    for username, exists in sorted(results.items()):
+        status = {True: "✅", False: "❌", None: "⚠️ "}[exists]
+        detail = {True: "exists", False: "not found", None: "could not be checked"}[exists]
+        print(f"{status} @{username}: {detail}")
+    print(f"📊 {len(results)} username(s), {backend.requests} request(s)")
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
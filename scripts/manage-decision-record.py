@@ -7,42 +7,412 @@ Handles compression, summarization, and archiving of pipeline decision records
 import os
 import re
 import sys
+import json
 import argparse
-import shutil
-from datetime import datetime
+import fcntl
+import functools
+import time
+import zlib
+from contextlib import contextmanager
 from pathlib import Path
 
+import pipeline_common
+from pipeline_common import daemon_request, load_script, temp_path, write_atomic
+
+# datetime, hashlib, lzma, shutil and concurrent.futures are imported where
+# they are used, so read-only actions such as analyze start fast
+
+
+# "## Research Phase (Complete ✅)" -> "Research Phase"
+PHASE_HEADER = re.compile(r'## (\w+ Phase)')
+COMPLETE_MARKER = "Complete ✅"
+
+# --auto thresholds: records longer than these line counts are summarized or compressed
+SUMMARIZE_LINES = 200
+COMPRESS_LINES = 150
+
+# Budget summarization: rough bytes per prompt token, used to turn --budget-tokens into bytes
+BYTES_PER_TOKEN = 4
+
+# Section priorities for budget summarization, by header keyword (first match wins);
+# active phases score ACTIVE_PHASE_PRIORITY, completed ones COMPLETED_PHASE_PRIORITY
+SECTION_PRIORITIES = (
+    ("Current Status", 100),
+    ("Issue Context", 90),
+    ("Pipeline Progress", 60),
+)
+ACTIVE_PHASE_PRIORITY = 70
+COMPLETED_PHASE_PRIORITY = 10
+DEFAULT_SECTION_PRIORITY = 30
+# Added for sections with a "### ... Decisions" subsection, and (scaled by position) for recency
+DECISION_PRIORITY = 15
+RECENCY_PRIORITY = 10
+# Sections at or above this priority are kept in full before anything is condensed
+PINNED_PRIORITY = 60
+
+# Bullet points kept when a section is condensed to fit a budget, and how many of them
+CONDENSED_FACT_PATTERNS = ('Status', 'Validated', 'Document', 'Completed', 'Next Phase', 'Decision')
+CONDENSED_FACTS = 6
+
+# Seconds to wait for another process to release a record's lock
+DEFAULT_LOCK_TIMEOUT = 30
+
+# Per-stage instrumentation; replaced by a StageTimings in main() when requested
+timings = pipeline_common.NoTimings()
+
+# First lines of a phase body that compress_completed_phases has already wrapped
+COMPRESSED_OPENING = ("<details>", "<summary>📋 Phase Summary (click to expand)</summary>")
+
+
+class Section:
+    """A section of a decision record, as produced by ``iter_sections``.
+
+    Level 2 sections start at a "## " header; level 0 is the preamble before
+    the first one. ``start``/``end`` are byte offsets into the record and
+    ``lines`` holds the raw text (header included), so joining the lines of
+    every section reproduces the file exactly. Level 3 ("### ") subsections
+    are recorded in ``subsections`` with offsets but no lines of their own.
+    """
+    
+    __slots__ = ("header", "level", "phase", "complete", "start", "end", "lines", "subsections")
+    
+    def __init__(self, header, level, start):
+        self.header = header
+        self.level = level
+        match = PHASE_HEADER.match(header) if level == 2 else None
+        self.phase = match.group(1) if match else None
+        self.complete = self.phase is not None and COMPLETE_MARKER in header
+        self.start = start
+        self.end = start
+        self.lines = []
+        self.subsections = []
+    
+    @property
+    def text(self):
+        """Raw text of the section, header included"""
+        return "".join(self.lines)
+    
+    @property
+    def compressed(self):
+        """Whether the section body is already a collapsed phase summary"""
+        return tuple(line.rstrip("\r\n") for line in self.lines[1:3]) == COMPRESSED_OPENING
+    
+    def _close(self, end):
+        self.end = end
+        for subsection, following in zip(self.subsections, self.subsections[1:]):
+            subsection.end = following.start
+        if self.subsections:
+            self.subsections[-1].end = end
+
+
+def iter_sections(path):
+    """Yield the sections of a decision record in one streaming pass.
+
+    Only the section currently being read is held in memory.
+    """
+    offset = 0
+    section = Section("", 0, 0)
+    
+    with open(path, 'rb') as f:
+        for raw_line in f:
+            line = raw_line.decode('utf-8')
+            
+            if line.startswith("## "):
+                if section.lines:
+                    section._close(offset)
+                    yield section
+                section = Section(line.rstrip("\n"), 2, offset)
+            elif line.startswith("### "):
+                section.subsections.append(Section(line.rstrip("\n"), 3, offset))
+            
+            section.lines.append(line)
+            offset += len(raw_line)
+    
+    if section.lines:
+        section._close(offset)
+        yield section
+
+
+class BackupStore:
+    """Content-addressed, deduplicated store of decision record snapshots.
+
+    Each snapshot is split into sections (see ``iter_sections``) and every
+    distinct section is stored once under ``objects/<hash>``, optionally
+    compressed. ``manifest.json`` lists snapshots oldest first with their
+    ordered section hashes, so "latest" and timestamp lookups are answered
+    from the manifest without listing the directory. Snapshots beyond the
+    retention policy are dropped and unreferenced objects collected.
+    """
+    
+    CODECS = {
+        "none": (b"0", lambda data: data, lambda data: data),
+        "zlib": (b"z", zlib.compress, zlib.decompress),
+        "lzma": (b"x", lambda data: _lzma().compress(data), lambda data: _lzma().decompress(data)),
+    }
+    
+    def __init__(self, root, compression="zlib", keep_last=20, max_age_days=None):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.manifest_file = self.root / "manifest.json"
+        self.compression = compression
+        self.keep_last = keep_last
+        self.max_age_days = max_age_days
+    
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"snapshots": []}
+    
+    def _save_manifest(self, manifest):
+        write_atomic(self.manifest_file, json.dumps(manifest, indent=2))
+    
+    def _object_path(self, digest):
+        return self.objects_dir / digest[:2] / digest
+    
+    def _put_object(self, data):
+        import hashlib
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not path.exists():
+            tag, compress, _ = self.CODECS[self.compression]
+            write_atomic(path, tag + compress(data), binary=True)
+        return digest
+    
+    def _get_object(self, digest):
+        with open(self._object_path(digest), 'rb') as f:
+            payload = f.read()
+        for tag, _, decompress in self.CODECS.values():
+            if payload[:1] == tag:
+                return decompress(payload[1:])
+        raise ValueError(f"Unknown object encoding: {digest}")
+    
+    def snapshots(self):
+        """All snapshots, oldest first"""
+        return self._load_manifest()["snapshots"]
+    
+    def save(self, record_file):
+        """Snapshot ``record_file``; an unchanged record reuses the latest snapshot"""
+        import hashlib
+        chunks = []
+        record_hash = hashlib.sha256()
+        for section in iter_sections(record_file):
+            data = section.text.encode()
+            record_hash.update(data)
+            chunks.append(self._put_object(data))
+        
+        manifest = self._load_manifest()
+        digest = record_hash.hexdigest()
+        if manifest["snapshots"] and manifest["snapshots"][-1]["sha256"] == digest:
+            return manifest["snapshots"][-1]["id"]
+        
+        # Ids sort by time and stay unique even for snapshots taken in the same
+        # microsecond (callers hold the record lock across save())
+        from datetime import datetime
+        now = datetime.now()
+        snapshot_id = f"{now.strftime('%Y%m%d-%H%M%S-%f')}-{digest[:8]}"
+        existing_ids = {snap["id"] for snap in manifest["snapshots"]}
+        suffix = 1
+        while snapshot_id in existing_ids:
+            suffix += 1
+            snapshot_id = f"{now.strftime('%Y%m%d-%H%M%S-%f')}-{digest[:8]}-{suffix}"
+        snapshot = {
+            "id": snapshot_id,
+            "created": now.isoformat(timespec="seconds"),
+            "sha256": digest,
+            "size": Path(record_file).stat().st_size,
+            "chunks": chunks
+        }
+        manifest["snapshots"].append(snapshot)
+        dropped = self._apply_retention(manifest)
+        self._save_manifest(manifest)
+        if dropped:
+            # Objects only the dropped snapshots used would otherwise pile up until --action gc
+            self._delete_unreferenced(manifest, {digest for snap in dropped for digest in snap["chunks"]})
+        return snapshot["id"]
+    
+    def find(self, ref=None):
+        """Look up a snapshot by id or timestamp prefix; None means the latest"""
+        snapshots = self.snapshots()
+        if not snapshots:
+            raise FileNotFoundError("No backups found")
+        if ref is None:
+            return snapshots[-1]
+        for snapshot in reversed(snapshots):
+            if snapshot["id"] == ref or snapshot["id"].startswith(ref):
+                return snapshot
+        raise FileNotFoundError(f"No backup matching: {ref}")
+    
+    def restore(self, snapshot, target):
+        """Reassemble ``snapshot`` into ``target``"""
+        target = Path(target)
+        tmp_file = temp_path(target)
+        with open(tmp_file, 'wb') as f:
+            for digest in snapshot["chunks"]:
+                f.write(self._get_object(digest))
+        os.replace(tmp_file, target)
+    
+    def _apply_retention(self, manifest):
+        """Drop snapshots outside the retention policy; returns the dropped snapshots"""
+        original = manifest["snapshots"]
+        snapshots = original
+        if self.max_age_days is not None:
+            from datetime import datetime
+            cutoff = datetime.now().timestamp() - self.max_age_days * 86400
+            snapshots = [snap for snap in snapshots[:-1]
+                         if datetime.fromisoformat(snap["created"]).timestamp() >= cutoff] + snapshots[-1:]
+        if self.keep_last:
+            snapshots = snapshots[-self.keep_last:]
+        manifest["snapshots"] = snapshots
+        kept = {snap["id"] for snap in snapshots}
+        return [snap for snap in original if snap["id"] not in kept]
+    
+    def gc(self):
+        """Apply the retention policy and delete unreferenced objects"""
+        manifest = self._load_manifest()
+        self._apply_retention(manifest)
+        self._save_manifest(manifest)
+        return {"snapshots": len(manifest["snapshots"]), **self._delete_unreferenced(manifest)}
+    
+    def _delete_unreferenced(self, manifest, candidates=None):
+        """Delete objects no snapshot in ``manifest`` refers to.
+
+        With ``candidates`` (the chunks of just dropped snapshots) only those
+        objects are checked, without listing the store; otherwise every
+        object is. Callers hold the record lock, as for every other write to
+        the store.
+        """
+        referenced = {digest for snap in manifest["snapshots"] for digest in snap["chunks"]}
+        if candidates is not None:
+            paths = [self._object_path(digest) for digest in candidates - referenced]
+        elif self.objects_dir.exists():
+            paths = [path for path in self.objects_dir.glob("*/*")
+                     if path.name not in referenced and not path.name.endswith(".tmp")]
+        else:
+            paths = []
+        removed = reclaimed = 0
+        for path in paths:
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            reclaimed += size
+            removed += 1
+        return {"removed_objects": removed, "reclaimed_bytes": reclaimed}
+
+
+def _lzma():
+    """lzma, imported on first use of the lzma backup codec"""
+    import lzma
+    return lzma
+
+
+def _locked(method):
+    """Run a DecisionRecordManager method while holding the record's lock"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _section_priority(section):
+    """Budget summarization priority of a section, before its recency bonus"""
+    if section.level == 0:
+        return float("inf")  # the record title
+    for keyword, priority in SECTION_PRIORITIES:
+        if keyword in section.header:
+            break
+    else:
+        if section.phase:
+            priority = COMPLETED_PHASE_PRIORITY if section.complete else ACTIVE_PHASE_PRIORITY
+        else:
+            priority = DEFAULT_SECTION_PRIORITY
+    if any("Decision" in subsection.header for subsection in section.subsections):
+        priority += DECISION_PRIORITY
+    return priority
+
+
+def _condensed(section):
+    """A section's header and its key facts, for records summarized to a budget"""
+    if section.level == 0:
+        return section.text
+    facts = dict.fromkeys(line.strip() for line in section.lines[1:]
+                          if line.lstrip().startswith('- **')
+                          and any(pattern in line for pattern in CONDENSED_FACT_PATTERNS))
+    return section.lines[0].rstrip("\n") + "\n" + "".join(
+        f"{fact}\n" for fact in list(facts)[:CONDENSED_FACTS]) + "\n"
+
+
+def _strip_newline(text):
+    """Drop the newline that separates a section from the next header"""
+    return text[:-1] if text.endswith("\n") else text
+
 
 class DecisionRecordManager:
     """Manages decision record size and readability"""
     
-    def __init__(self, decision_file_path):
+    def __init__(self, decision_file_path, backup_compression="zlib", keep_backups=20,
+                 backup_max_age_days=None, lock_timeout=DEFAULT_LOCK_TIMEOUT, budget_bytes=None):
         self.decision_file = Path(decision_file_path)
+        self.lock_timeout = lock_timeout
+        self.budget_bytes = budget_bytes
         self.backup_dir = self.decision_file.parent / f"{self.decision_file.stem}-archive"
         self.backup_dir.mkdir(exist_ok=True)
+        self.compress_index_file = self.backup_dir / "compress-index.json"
+        self.section_index_file = self.backup_dir / "section-index.json"
+        self.lock_file = self.backup_dir / "record.lock"
+        self.backups = BackupStore(self.backup_dir / "backups", compression=backup_compression,
+                                   keep_last=keep_backups, max_age_days=backup_max_age_days)
         
+    @contextmanager
+    def lock(self):
+        """Hold the advisory lock that serializes writers of this record.
+
+        Waits up to ``lock_timeout`` seconds, then raises TimeoutError.
+        """
+        with open(self.lock_file, 'a') as f:
+            with timings.stage("lock_wait"):
+                deadline = time.monotonic() + self.lock_timeout
+                while True:
+                    try:
+                        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                        break
+                    except BlockingIOError:
+                        if time.monotonic() >= deadline:
+                            raise TimeoutError(f"Timed out waiting for lock on {self.decision_file}")
+                        time.sleep(0.05)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+    
     def analyze_size(self):
         """Analyze decision record size and complexity"""
         if not self.decision_file.exists():
             return {"exists": False}
-            
-        with open(self.decision_file, 'r') as f:
-            content = f.read()
-            
-        lines = content.split('\n')
-        words = len(content.split())
         
-        # Count phases
-        completed_phases = len(re.findall(r'## \w+ Phase.*?Complete ✅', content))
-        total_phases = len(re.findall(r'## \w+ Phase', content))
+        newlines = words = 0
+        completed_phases = total_phases = sections = subsections = 0
         
-        # Count sections
-        sections = len(re.findall(r'^## ', content, re.MULTILINE))
-        subsections = len(re.findall(r'^### ', content, re.MULTILINE))
+        with timings.stage("analyze"):
+            for section in iter_sections(self.decision_file):
+                for line in section.lines:
+                    newlines += line.endswith("\n")
+                    words += len(line.split())
+                
+                if section.level == 2:
+                    sections += 1
+                    if section.phase:
+                        total_phases += 1
+                        completed_phases += section.complete
+                subsections += len(section.subsections)
         
         return {
             "exists": True,
-            "lines": len(lines),
+            "lines": newlines + 1,
             "words": words,
             "completed_phases": completed_phases,
             "total_phases": total_phases,
@@ -52,124 +422,265 @@ class DecisionRecordManager:
         }
     
     def create_backup(self):
-        """Create timestamped backup of current decision record"""
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        backup_file = self.backup_dir / f"decision-record-backup-{timestamp}.md"
-        shutil.copy2(self.decision_file, backup_file)
-        return backup_file
-    
-    def compress_completed_phases(self):
-        """Compress completed phases into collapsible sections"""
-        backup_file = self.create_backup()
+        """Snapshot the current decision record into the backup store, returning its id"""
+        with timings.stage("backup"):
+            return self.backups.save(self.decision_file)
+    
+    def _rewrite(self, transform, finish=None, keep=None):
+        """Stream the record's sections through ``transform`` into a new file.
+
+        ``transform(section, out)`` writes the replacement text for each
+        section to ``out``; ``finish(out)``, if given, may append a trailer.
+        The result replaces the record once complete, unless ``keep()``
+        returns False, in which case the record is left untouched.
+        Returns (original_lines, new_lines, replaced).
+        """
+        tmp_file = temp_path(self.decision_file)
+        original_newlines = 0
         
-        with open(self.decision_file, 'r') as f:
-            content = f.read()
+        with open(tmp_file, 'w') as f, timings.stage("rewrite"):
+            out = _CountingWriter(f)
+            for section in iter_sections(self.decision_file):
+                original_newlines += sum(line.endswith("\n") for line in section.lines)
+                transform(section, out)
+            if finish is not None:
+                finish(out)
         
-        def compress_phase(match):
-            section_header = match.group(1)
-            section_content = match.group(2)
+        if keep is not None and not keep():
+            tmp_file.unlink()
+            return original_newlines + 1, original_newlines + 1, False
+        
+        os.replace(tmp_file, self.decision_file)
+        return original_newlines + 1, out.newlines + 1, True
+    
+    def _load_compress_index(self):
+        """Load the sidecar index written by the last compression, if any"""
+        try:
+            with open(self.compress_index_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _save_compress_index(self, lines, sections):
+        """Record the compressed record's shape so later runs can skip it"""
+        stat = self.decision_file.stat()
+        index = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "lines": lines,
+            "sections": sections
+        }
+        with timings.stage("index"):
+            write_atomic(self.compress_index_file, json.dumps(index, indent=2))
+    
+    def section_index(self):
+        """Byte offsets of every section, from a sidecar rebuilt when the record changes.
+
+        The index lives in the archive directory and is keyed to the record's
+        size and mtime, so a current index is served without opening the record.
+        """
+        stat = self.decision_file.stat()
+        try:
+            with open(self.section_index_file, 'r') as f:
+                index = json.load(f)
+            if (index["size"], index["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+                return index
+        except (OSError, ValueError, KeyError):
+            pass
+        
+        with timings.stage("section_index"):
+            sections = [{
+                "header": section.header,
+                "start": section.start,
+                "end": section.end,
+                "subsections": [{"header": subsection.header, "start": subsection.start,
+                                 "end": subsection.end} for subsection in section.subsections]
+            } for section in iter_sections(self.decision_file)]
+            index = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sections": sections}
+            write_atomic(self.section_index_file, json.dumps(index))
+        return index
+    
+    def get_section(self, name):
+        """Text of the section (or subsection) titled ``name``, or None.
+
+        ``name`` matches a header exactly or up to a status suffix, so
+        "Research Phase" finds "## Research Phase (Complete ✅)". Only the
+        section's own bytes are read from the record.
+        """
+        name = name.lstrip("#").strip()
+        
+        def matches(entry):
+            title = entry["header"].lstrip("#").strip()
+            return title == name or title.startswith(f"{name} (")
+        
+        sections = self.section_index()["sections"]
+        entry = next((section for section in sections if section["header"] and matches(section)), None)
+        if entry is None:
+            entry = next((subsection for section in sections for subsection in section["subsections"]
+                          if matches(subsection)), None)
+        if entry is None:
+            return None
+        
+        with open(self.decision_file, 'rb') as f:
+            f.seek(entry["start"])
+            return f.read(entry["end"] - entry["start"]).decode('utf-8')
+    
+    @_locked
+    def compress_completed_phases(self, incremental=False):
+        """Compress completed phases into collapsible sections.
+
+        Phases that are already collapsed are never wrapped again. A sidecar
+        index of section hashes and offsets is kept in the archive directory.
+        With ``incremental``, a record whose size and mtime match the index is
+        not read at all, sections whose hash is in the index are passed
+        through untouched, and the record is only backed up and rewritten
+        when at least one section was compressed.
+        """
+        import hashlib
+        index = self._load_compress_index() if incremental else None
+        if index is not None:
+            stat = self.decision_file.stat()
+            if (index["size"], index["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+                return {
+                    "action": "unchanged",
+                    "backup_file": None,
+                    "original_lines": index["lines"],
+                    "compressed_lines": index["lines"],
+                    "compressed_sections": 0
+                }
+        known_hashes = {entry["sha256"] for entry in index["sections"]} if index else set()
+        
+        key_patterns = ['Status', 'Validated', 'Document', 'Completed', 'Next Phase']
+        indexed_sections = []
+        compressed_sections = 0
+        record_size = self.decision_file.stat().st_size
+        
+        def compress_phase(section, out):
+            nonlocal compressed_sections
+            text = section.text
+            digest = hashlib.sha256(text.encode()).hexdigest()
             
-            if "(Complete ✅)" in section_header:
+            if section.complete and not section.compressed and digest not in known_hashes:
                 # Extract key information for summary
                 summary_lines = []
-                key_patterns = ['Status', 'Validated', 'Document', 'Completed', 'Next Phase']
-                
-                for line in section_content.split('\n'):
+                for line in section.lines[1:]:
                     line = line.strip()
                     if line.startswith('- **') and any(pattern in line for pattern in key_patterns):
                         summary_lines.append(line)
                 
-                summary = '\n'.join(summary_lines[:4])  # Keep top 4 key facts
+                # Keep the record's line endings; like re.sub(r'...(?=\n## |\Z)'), the newline
+                # before the next header stays outside the details, the final one inside
+                newline = "\r\n" if section.lines[0].endswith("\r\n") else "\n"
+                summary = newline.join(summary_lines[:4])  # Keep top 4 key facts
+                body = "".join(section.lines[1:])
+                separator = ""
+                if section.end != record_size and body.endswith(newline):
+                    body, separator = body[:-len(newline)], newline
                 
-                return f"""{section_header}
-<details>
-<summary>📋 Phase Summary (click to expand)</summary>
-
-{summary}
-
-<details>
-<summary>📝 Complete Phase Details</summary>
-
-{section_content}
-</details>
-</details>
-"""
-            return match.group(0)
-        
-        # Apply compression to completed phases
-        compressed = re.sub(
-            r'(## \w+ Phase.*?Complete ✅.*?)\n(.*?)(?=\n## |\Z)',
-            compress_phase,
-            content,
-            flags=re.DOTALL
-        )
-        
-        with open(self.decision_file, 'w') as f:
-            f.write(compressed)
+                text = newline.join([
+                    section.lines[0].rstrip("\r\n"),
+                    "<details>",
+                    "<summary>📋 Phase Summary (click to expand)</summary>",
+                    "",
+                    summary,
+                    "",
+                    "<details>",
+                    "<summary>📝 Complete Phase Details</summary>",
+                    "",
+                    body,
+                    "</details>",
+                    "</details>",
+                    separator
+                ])
+                digest = hashlib.sha256(text.encode()).hexdigest()
+                compressed_sections += 1
+            
+            start = out.bytes
+            out.write(text)
+            indexed_sections.append({
+                "header": section.header,
+                "start": start,
+                "end": out.bytes,
+                "sha256": digest,
+                "compressed": section.complete
+            })
+        
+        backup_file = None
+        
+        def keep():
+            nonlocal backup_file
+            if incremental and not compressed_sections:
+                return False
+            backup_file = self.create_backup()
+            return True
+        
+        original_lines, compressed_lines, replaced = self._rewrite(compress_phase, keep=keep)
+        self._save_compress_index(compressed_lines, indexed_sections)
             
         return {
-            "action": "compressed",
-            "backup_file": str(backup_file),
-            "original_lines": len(content.split('\n')),
-            "compressed_lines": len(compressed.split('\n'))
+            "action": "compressed" if replaced else "unchanged",
+            "backup_file": backup_file,
+            "original_lines": original_lines,
+            "compressed_lines": compressed_lines,
+            "compressed_sections": compressed_sections
         }
     
+    @_locked
     def summarize_record(self):
-        """Create summary version and archive detailed sections"""
-        backup_file = self.create_backup()
+        """Create summary version and archive detailed sections.
+
+        With a ``budget_bytes`` the record is instead packed into that many
+        bytes by section priority (see ``_plan_budget``).
+        """
+        if self.budget_bytes is not None:
+            return self._summarize_to_budget(self.budget_bytes)
         
-        with open(self.decision_file, 'r') as f:
-            content = f.read()
+        from datetime import datetime
+        backup_file = self.create_backup()
         
-        # Extract key sections to keep in summary
-        summary_sections = []
+        # Sections are written out as they are read; only archive paths are kept
         archive_sections = []
+        first_section = True
+        record_size = self.decision_file.stat().st_size
         
-        # Split content into sections
-        sections = re.split(r'\n(?=## )', content)
-        
-        for section in sections:
-            if not section.strip():
-                continue
-                
-            section_header = section.split('\n')[0]
+        def summarize_section(section, out):
+            nonlocal first_section
+            # Like re.split(r'\n(?=## )'): only the final section keeps its newline
+            piece = section.text if section.end == record_size else _strip_newline(section.text)
+            if not piece.strip():
+                return
+            
+            if not first_section:
+                out.write("\n\n")
+            first_section = False
             
             # Keep these sections in summary
-            if any(keyword in section_header for keyword in [
+            if any(keyword in section.header for keyword in [
                 'Issue Context', 'Current Status', 'Pipeline Progress', 'Decision'
             ]):
-                summary_sections.append(section)
-            elif "(Complete ✅)" in section_header:
-                # Compress completed phases heavily
-                lines = section.split('\n')
-                header = lines[0]
-                
-                # Extract only the most essential info
-                essential_info = []
-                for line in lines[1:]:
-                    if '**Status**:' in line or '**Validated**:' in line or '**Document**:' in line:
-                        essential_info.append(line)
-                        
-                compressed_section = f"{header}\n" + '\n'.join(essential_info[:2])
-                summary_sections.append(compressed_section)
+                out.write(piece)
+            elif section.level == 2 and COMPLETE_MARKER in section.header:
+                # Compress completed phases heavily, keeping only the most essential info
+                essential_info = [
+                    line.rstrip("\n") for line in section.lines[1:]
+                    if '**Status**:' in line or '**Validated**:' in line or '**Document**:' in line
+                ]
+                out.write(f"{section.header}\n" + '\n'.join(essential_info[:2]))
                 
                 # Archive full section
-                phase_name = re.search(r'## (\w+ Phase)', header)
-                if phase_name:
-                    archive_file = self.backup_dir / f"{phase_name.group(1).lower().replace(' ', '-')}-details.md"
-                    with open(archive_file, 'w') as f:
-                        f.write(section)
+                if section.phase:
+                    archive_file = self.backup_dir / f"{section.phase.lower().replace(' ', '-')}-details.md"
+                    with timings.stage("archive"):
+                        write_atomic(archive_file, piece)
                     archive_sections.append(str(archive_file))
             else:
                 # Keep current/active sections
-                summary_sections.append(section)
-        
-        # Create summary content
-        summary_content = '\n\n'.join(summary_sections)
+                out.write(piece)
         
-        # Add archive reference
-        if archive_sections:
-            summary_content += f"""
+        def write_archive_reference(out):
+            if not archive_sections:
+                return
+            out.write(f"""
 
 ## Archived Sections
 Detailed phase information has been archived for space efficiency:
@@ -177,50 +688,455 @@ Detailed phase information has been archived for space efficiency:
 
 ---
 *Summary generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
-*Full backup: [{backup_file.name}]({backup_file})*
-"""
+*Full backup: `{backup_file}` (restore with `--action restore --backup-file {backup_file}`)*
+""")
         
-        with open(self.decision_file, 'w') as f:
-            f.write(summary_content)
+        original_lines, summary_lines, _ = self._rewrite(summarize_section, write_archive_reference)
             
         return {
             "action": "summarized",
-            "backup_file": str(backup_file),
+            "backup_file": backup_file,
             "archived_files": archive_sections,
-            "original_lines": len(content.split('\n')),
-            "summary_lines": len(summary_content.split('\n'))
+            "original_lines": original_lines,
+            "summary_lines": summary_lines
         }
     
+    def _plan_budget(self, budget_bytes, reserved_bytes):
+        """Decide how each section is kept when summarizing to ``budget_bytes``.
+
+        Returns one entry per section: "full", "condensed" or None (archived).
+        Sections are scored and measured in one streaming pass; the plan is
+        then packed greedily in priority order: pinned sections in full, then
+        every remaining section condensed, then full texts where they still fit.
+        """
+        priorities, full_sizes, condensed_sizes = [], [], []
+        for section in iter_sections(self.decision_file):
+            priorities.append(_section_priority(section))
+            full_sizes.append(section.end - section.start)
+            condensed_sizes.append(len(_condensed(section).encode()))
+        
+        count = len(priorities)
+        for position in range(count):
+            priorities[position] += RECENCY_PRIORITY * position / max(count - 1, 1)
+        order = sorted(range(count), key=lambda i: -priorities[i])
+        
+        plan = [None] * count
+        remaining = budget_bytes - reserved_bytes
+        for i in order:
+            # The record title is kept even when it alone exceeds the budget
+            if priorities[i] == float("inf") or (priorities[i] >= PINNED_PRIORITY
+                                                  and full_sizes[i] <= remaining):
+                plan[i] = "full"
+                remaining -= full_sizes[i]
+        for i in order:
+            if plan[i] is None and condensed_sizes[i] <= remaining:
+                plan[i] = "condensed"
+                remaining -= condensed_sizes[i]
+        for i in order:
+            if plan[i] == "condensed" and full_sizes[i] - condensed_sizes[i] <= remaining:
+                plan[i] = "full"
+                remaining -= full_sizes[i] - condensed_sizes[i]
+        return plan
+    
+    def _summarize_to_budget(self, budget_bytes):
+        """Rewrite the record to fit ``budget_bytes``, archiving what doesn't fit.
+
+        Sections that are condensed or dropped are written in full, in order,
+        to one archive file per run, which the record's trailer links to.
+        """
+        trailer = ("\n## Archived Sections\n"
+                   "{count} section(s) condensed or archived to fit a {budget} byte budget: "
+                   "[{name}]({path})\n"
+                   "*Full backup: `{backup}` (restore with `--action restore --backup-file {backup}`)*\n")
+        # Reserve room for the trailer; the placeholder is longer than any snapshot id
+        placeholder_id = "0" * 40
+        placeholder_archive = self.backup_dir / f"budget-{placeholder_id}.md"
+        reserved = len(trailer.format(count=10 ** 9, budget=budget_bytes, name=placeholder_archive.stem,
+                                      path=placeholder_archive, backup=placeholder_id).encode())
+        
+        plan = self._plan_budget(budget_bytes, reserved)
+        kept = plan.count("full")
+        if kept == len(plan):
+            # Either the record fits, or it is over budget with nothing that may be dropped
+            # (such as a record without "## " sections)
+            size = self.decision_file.stat().st_size
+            lines = self.analyze_size()["lines"]
+            return {
+                "action": "unchanged" if size <= budget_bytes else "cannot_fit",
+                "backup_file": None,
+                "archived_files": [],
+                "original_lines": lines,
+                "summary_lines": lines,
+                "budget_bytes": budget_bytes,
+                "summary_bytes": size,
+                "kept_sections": kept,
+                "condensed_sections": 0,
+                "archived_sections": 0
+            }
+        
+        backup_file = self.create_backup()
+        archive_file = self.backup_dir / f"budget-{backup_file}.md"
+        tmp_archive = temp_path(archive_file)
+        position = 0
+        
+        with open(tmp_archive, 'w') as archive:
+            def pack_section(section, out):
+                nonlocal position
+                form = plan[position] if position < len(plan) else "full"
+                position += 1
+                if form == "full":
+                    out.write(section.text)
+                    return
+                archive.write(section.text)
+                if form == "condensed":
+                    out.write(_condensed(section))
+            
+            def write_archive_reference(out):
+                out.write(trailer.format(count=len(plan) - kept, budget=budget_bytes,
+                                         name=archive_file.stem, path=archive_file, backup=backup_file))
+            
+            original_lines, summary_lines, _ = self._rewrite(pack_section, write_archive_reference)
+        os.replace(tmp_archive, archive_file)
+        
+        return {
+            "action": "summarized",
+            "backup_file": backup_file,
+            "archived_files": [str(archive_file)],
+            "original_lines": original_lines,
+            "summary_lines": summary_lines,
+            "budget_bytes": budget_bytes,
+            "summary_bytes": self.decision_file.stat().st_size,
+            "kept_sections": kept,
+            "condensed_sections": plan.count("condensed"),
+            "archived_sections": plan.count(None)
+        }
+    
+    @_locked
     def restore_from_backup(self, backup_file=None):
-        """Restore decision record from backup"""
-        if backup_file:
-            backup_path = Path(backup_file)
+        """Restore decision record from a backup snapshot.
+
+        ``backup_file`` may be a snapshot id, a timestamp prefix such as
+        ``20250817-1430`` (latest match wins), or the path of a legacy
+        ``decision-record-backup-*.md`` copy. Defaults to the latest snapshot.
+        """
+        if backup_file and Path(backup_file).is_file():
+            tmp_file = temp_path(self.decision_file)
+            import shutil
+            shutil.copyfile(backup_file, tmp_file)
+            os.replace(tmp_file, self.decision_file)
+            return {"action": "restored", "from_backup": str(backup_file)}
+        
+        snapshot = self.backups.find(backup_file)
+        with timings.stage("restore"):
+            self.backups.restore(snapshot, self.decision_file)
+        return {"action": "restored", "from_backup": snapshot["id"]}
+    
+    def list_backups(self):
+        """Backup snapshots of this record, oldest first"""
+        return [{key: snap[key] for key in ("id", "created", "size")}
+                for snap in self.backups.snapshots()]
+    
+    @_locked
+    def gc_backups(self):
+        """Apply the backup retention policy and drop unreferenced data"""
+        return self.backups.gc()
+    
+    def auto_maintain(self, analysis=None):
+        """Summarize or compress the record depending on its size (the --auto policy).
+
+        With a ``budget_bytes``, records over budget are summarized to fit it
+        and all others are left alone.
+        """
+        analysis = analysis or self.analyze_size()
+        if self.budget_bytes is not None:
+            if analysis["file_size"] > self.budget_bytes:
+                result = self.summarize_record()
+            else:
+                result = {"action": "none"}
+        elif analysis["lines"] > SUMMARIZE_LINES:
+            result = self.summarize_record()
+        elif analysis["lines"] > COMPRESS_LINES:
+            result = self.compress_completed_phases(incremental=True)
+        else:
+            result = {"action": "none"}
+        return result
+
+
+class DecisionTree:
+    """Applies the --auto policy to every decision record below a directory.
+
+    Records are processed in a process pool. ``<root>/.maintenance-index.json``
+    remembers the size and mtime of each record after its last run, so records
+    that haven't changed since are skipped without being opened.
+    """
+    
+    INDEX_NAME = ".maintenance-index.json"
+    
+    def __init__(self, root, jobs=None, **manager_options):
+        self.root = Path(root)
+        self.jobs = jobs
+        self.manager_options = manager_options
+        self.index_file = self.root / self.INDEX_NAME
+    
+    def records(self):
+        """Decision records below the root, skipping per-record archive directories"""
+        records = []
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = sorted(d for d in dirnames if not d.endswith("-archive") and not d.startswith("."))
+            records.extend(Path(dirpath) / name for name in sorted(filenames)
+                           if name.endswith(".md") and not name.startswith("."))
+        return records
+    
+    def _load_index(self):
+        try:
+            with open(self.index_file, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+    
+    def maintain(self):
+        """Process changed records and return a summary of per-file actions"""
+        start = time.perf_counter()
+        index = self._load_index()
+        
+        results, pending = [], []
+        for record in self.records():
+            key = str(record.relative_to(self.root))
+            try:
+                stat = record.stat()
+            except OSError:
+                pending.append(key)  # reported as failed by its worker
+                continue
+            entry = index.get(key)
+            if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                results.append({"file": key, "action": "skipped", "bytes_before": stat.st_size,
+                                "bytes_after": stat.st_size, "bytes_reclaimed": 0})
+            else:
+                pending.append(key)
+        
+        jobs = min(self.jobs or os.cpu_count() or 1, len(pending)) or 1
+        items = [(str(self.root), key, self.manager_options) for key in pending]
+        if jobs == 1:
+            processed = [_maintain_tree_item(item) for item in items]
         else:
-            # Get most recent backup
-            backups = list(self.backup_dir.glob("decision-record-backup-*.md"))
-            if not backups:
-                raise FileNotFoundError("No backup files found")
-            backup_path = max(backups, key=lambda p: p.stat().st_mtime)
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                processed = list(pool.map(_maintain_tree_item, items))
+        results.extend(processed)
+        results.sort(key=lambda result: result["file"])
+        
+        # Forget deleted records; remember the post-maintenance state of the rest
+        index = {key: entry for key, entry in index.items() if (self.root / key).exists()}
+        for result in processed:
+            mtime_ns = result.pop("mtime_ns")
+            if "error" not in result:
+                index[result["file"]] = {"size": result["bytes_after"], "mtime_ns": mtime_ns,
+                                         "action": result["action"]}
+            else:
+                index.pop(result["file"], None)
+        write_atomic(self.index_file, json.dumps(index, indent=2, sort_keys=True))
         
-        shutil.copy2(backup_path, self.decision_file)
-        return {"action": "restored", "from_backup": str(backup_path)}
+        failed = sum(1 for result in results if "error" in result)
+        actions = {}
+        for result in results:
+            actions[result["action"]] = actions.get(result["action"], 0) + 1
+        return {
+            "root": str(self.root),
+            "total": len(results),
+            "processed": len(processed),
+            "skipped": len(results) - len(processed),
+            "failed": failed,
+            "actions": actions,
+            "bytes_reclaimed": sum(result["bytes_reclaimed"] for result in results),
+            "jobs": jobs,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+            "results": results
+        }
+
+
+def _maintain_tree_item(item):
+    """Apply the --auto policy to one record inside a DecisionTree worker"""
+    root, key, manager_options = item
+    record = Path(root) / key
+    start = time.perf_counter()
+    result = {"file": key, "bytes_before": 0}
+    # A record that can't be read (or is deleted mid-run) fails on its own, not the whole tree
+    try:
+        result["bytes_before"] = record.stat().st_size
+        manager = DecisionRecordManager(record, **manager_options)
+        outcome = manager.auto_maintain()
+        result["action"] = outcome["action"]
+        result["backup_file"] = outcome.get("backup_file")
+    except (OSError, UnicodeDecodeError, ValueError) as e:
+        result["action"] = "error"
+        result["error"] = str(e)
+    try:
+        stat = record.stat()
+        result["bytes_after"] = stat.st_size
+        result["mtime_ns"] = stat.st_mtime_ns
+    except OSError as e:
+        result["action"] = "error"
+        result.setdefault("error", str(e))
+        result["bytes_after"] = result["bytes_before"]
+        result["mtime_ns"] = None
+    result["bytes_reclaimed"] = result["bytes_before"] - result["bytes_after"]
+    result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return result
+
+
+class _CountingWriter:
+    """File wrapper that counts the newlines and bytes written through it"""
+    
+    def __init__(self, f):
+        self.f = f
+        self.newlines = 0
+        self.bytes = 0
+    
+    def write(self, text):
+        self.newlines += text.count("\n")
+        self.bytes += len(text.encode())
+        self.f.write(text)
+
+
+def watch_records(path, debounce=0.3, use_inotify=True, **manager_options):
+    """Re-apply the --auto policy to decision records as they change, until interrupted.
+
+    ``path`` is a record or a directory of records. The state each record was
+    left in is remembered in memory, so the writes made here (and saves that
+    don't change a record) don't trigger another round.
+    """
+    file_watcher = load_script("file-watcher")
+    watcher = file_watcher.FileWatcher(
+        [path], patterns=("*.md",), debounce=debounce, use_inotify=use_inotify,
+        ignore_dir=lambda name: name.startswith(".") or name.endswith("-archive"))
+    
+    def state(record):
+        stat = os.stat(record)
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    seen = {record: state(record) for record in watcher.files()}
+    print(f"👀 Watching {len(seen)} decision record(s) with {watcher.backend} (Ctrl-C to stop)")
+    sys.stdout.flush()
+    try:
+        for changed in watcher:
+            for record in sorted(changed):
+                if not os.path.exists(record):
+                    seen.pop(record, None)
+                    continue
+                if seen.get(record) == state(record):
+                    continue
+                start = time.perf_counter()
+                try:
+                    manager = DecisionRecordManager(record, **manager_options)
+                    analysis = manager.analyze_size()
+                    result = manager.auto_maintain(analysis)
+                except (OSError, TimeoutError) as e:
+                    print(f"❌ {record}: {e}")
+                    continue
+                seen[record] = state(record)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                if result["action"] == "summarized":
+                    detail = f"summarized {result['original_lines']} → {result['summary_lines']} lines"
+                elif result["action"] == "cannot_fit":
+                    detail = (f"{result['summary_bytes']} bytes, can't be reduced to the "
+                              f"{result['budget_bytes']} byte budget")
+                elif result["action"] == "none":
+                    detail = f"{analysis['lines']} lines, no action needed"
+                else:
+                    detail = f"{result['action']} {result['original_lines']} → {result['compressed_lines']} lines"
+                print(f"📝 {time.strftime('%H:%M:%S')} {record}: {detail} ({elapsed_ms:.1f} ms)")
+            sys.stdout.flush()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
 
 
 def main():
     parser = argparse.ArgumentParser(description="Manage pipeline decision records")
-    parser.add_argument("decision_file", help="Path to decision record file")
-    parser.add_argument("--action", choices=["analyze", "compress", "summarize", "restore"], 
+    parser.add_argument("decision_file", help="Path to decision record file (a directory with --tree)")
+    parser.add_argument("--action", choices=["analyze", "compress", "summarize", "restore", "backups", "gc"], 
                        default="analyze", help="Action to perform")
-    parser.add_argument("--backup-file", help="Specific backup file to restore from")
+    parser.add_argument("--backup-file",
+                       help="Backup snapshot id or timestamp prefix (or legacy backup file) to restore from")
+    parser.add_argument("--backup-compression", choices=sorted(BackupStore.CODECS), default="zlib",
+                       help="Compression for newly stored backup data")
+    parser.add_argument("--keep-backups", type=int, default=20,
+                       help="Number of backup snapshots to retain (0 keeps all)")
+    parser.add_argument("--backup-max-age-days", type=float,
+                       help="Drop backup snapshots older than this (the latest is always kept)")
     parser.add_argument("--auto", action="store_true", 
                        help="Automatically choose action based on file size")
+    parser.add_argument("--lock-timeout", type=float, default=DEFAULT_LOCK_TIMEOUT,
+                       help="Seconds to wait for concurrent updates of the same record")
+    budget = parser.add_mutually_exclusive_group()
+    budget.add_argument("--budget-bytes", type=int,
+                       help="Summarize (and --auto) to fit this many bytes, keeping the highest-priority sections")
+    budget.add_argument("--budget-tokens", type=int,
+                       help=f"Like --budget-bytes, estimating {BYTES_PER_TOKEN} bytes per prompt token")
+    parser.add_argument("--get-section", metavar="NAME",
+                       help="Print one section (e.g. \"Current Status\") using the record's offset index")
+    parser.add_argument("--incremental", action="store_true",
+                       help="Only compress phases that changed since the last compression")
+    parser.add_argument("--tree", action="store_true",
+                       help="Apply --auto to every record below the decision_file directory")
+    parser.add_argument("--jobs", type=int,
+                       help="Worker processes for --tree (default: CPU count)")
+    parser.add_argument("--no-daemon", action="store_true",
+                       help="Analyze in-process even if a pipeline daemon is running")
+    parser.add_argument("--watch", action="store_true",
+                       help="Keep running and apply --auto to records (or a directory of them) as they change")
+    parser.add_argument("--debounce", type=float, default=0.3,
+                       help="Seconds of quiet that end a burst of edits in --watch mode")
+    pipeline_common.add_timing_arguments(parser)
     
     args = parser.parse_args()
     
-    manager = DecisionRecordManager(args.decision_file)
+    global timings
+    action = "watch" if args.watch else "tree" if args.tree else "auto" if args.auto else args.action
+    timings = pipeline_common.timings_from_args(args, {"command": "manage-decision-record",
+                                                       "action": action}) or timings
+    
+    manager_options = {"backup_compression": args.backup_compression,
+                       "keep_backups": args.keep_backups,
+                       "backup_max_age_days": args.backup_max_age_days,
+                       "lock_timeout": args.lock_timeout,
+                       "budget_bytes": (args.budget_tokens * BYTES_PER_TOKEN if args.budget_tokens
+                                        else args.budget_bytes)}
+    
+    if args.watch:
+        watch_records(args.decision_file, debounce=args.debounce, **manager_options)
+        sys.exit(0)
+    
+    if args.tree:
+        if not os.path.isdir(args.decision_file):
+            parser.error("--tree requires decision_file to be a directory")
+        with timings.stage("tree"):
+            summary = DecisionTree(args.decision_file, jobs=args.jobs, **manager_options).maintain()
+        print(json.dumps(summary, indent=2))
+        sys.exit(0 if not summary["failed"] else 1)
+    
+    manager = DecisionRecordManager(args.decision_file, **manager_options)
+    
+    if args.get_section:
+        try:
+            section = manager.get_section(args.get_section)
+        except FileNotFoundError:
+            print("Decision record file does not exist", file=sys.stderr)
+            sys.exit(1)
+        if section is None:
+            print(f"❌ Section not found: {args.get_section}", file=sys.stderr)
+            sys.exit(1)
+        sys.stdout.write(section)
+        sys.exit(0)
     
     if args.action == "analyze" or args.auto:
-        analysis = manager.analyze_size()
+        analysis = None
+        if not args.no_daemon:
+            with timings.stage("daemon_request"):
+                analysis = daemon_request("analyze", decision_file=os.path.abspath(args.decision_file))
+        if analysis is None:
+            analysis = manager.analyze_size()
         
         if not analysis["exists"]:
             print("Decision record file does not exist")
@@ -235,34 +1151,71 @@ def main():
         print(f"  Subsections: {analysis['subsections']}")
         
         if args.auto:
-            if analysis["lines"] > 200:
+            if manager.budget_bytes is not None:
+                if analysis["file_size"] > manager.budget_bytes:
+                    print(f"\nFile is over its {manager.budget_bytes} byte budget - summarizing to fit...")
+            elif analysis["lines"] > SUMMARIZE_LINES:
                 print("\nFile is large - applying summarization...")
-                result = manager.summarize_record()
-                print(f"Summarized: {result['original_lines']} → {result['summary_lines']} lines")
-            elif analysis["lines"] > 150:
+            elif analysis["lines"] > COMPRESS_LINES:
                 print("\nFile is getting large - applying compression...")
-                result = manager.compress_completed_phases()
-                print(f"Compressed: {result['original_lines']} → {result['compressed_lines']} lines")
-            else:
+            result = manager.auto_maintain(analysis)
+            if result["action"] == "summarized":
+                print(f"Summarized: {result['original_lines']} → {result['summary_lines']} lines")
+            elif result["action"] == "cannot_fit":
+                print(f"⚠️  Record can't be reduced to fit: all {result['kept_sections']} section(s) must be kept")
+            elif result["action"] == "none":
                 print("\nFile size is manageable - no action needed")
+            else:
+                print(f"Compressed: {result['original_lines']} → {result['compressed_lines']} lines")
     
     elif args.action == "compress":
-        result = manager.compress_completed_phases()
-        print(f"Compressed completed phases")
+        result = manager.compress_completed_phases(incremental=args.incremental)
+        if result["action"] == "unchanged":
+            print(f"No newly completed phases to compress")
+        else:
+            print(f"Compressed completed phases ({result['compressed_sections']} sections)")
         print(f"Lines: {result['original_lines']} → {result['compressed_lines']}")
         print(f"Backup: {result['backup_file']}")
     
     elif args.action == "summarize":
         result = manager.summarize_record()
+        if result["action"] == "unchanged":
+            print(f"Record already fits the {result['budget_bytes']} byte budget")
+            sys.exit(0)
+        if result["action"] == "cannot_fit":
+            print(f"⚠️  Record can't be reduced to its {result['budget_bytes']} byte budget: "
+                  f"all {result['kept_sections']} section(s) must be kept ({result['summary_bytes']} bytes)")
+            sys.exit(1)
         print(f"Created summary version")
         print(f"Lines: {result['original_lines']} → {result['summary_lines']}")
         print(f"Backup: {result['backup_file']}")
-        print(f"Archived: {len(result['archived_files'])} sections")
+        if manager.budget_bytes is not None:
+            print(f"Size: {result['summary_bytes']} bytes (budget {result['budget_bytes']})")
+            print(f"Sections: {result['kept_sections']} kept, {result['condensed_sections']} condensed, "
+                  f"{result['archived_sections']} archived to {result['archived_files'][0]}")
+        else:
+            print(f"Archived: {len(result['archived_files'])} sections")
     
     elif args.action == "restore":
         result = manager.restore_from_backup(args.backup_file)
         print(f"Restored from: {result['from_backup']}")
+    
+    elif args.action == "backups":
+        backups = manager.list_backups()
+        if not backups:
+            print("No backups found")
+        for backup in backups:
+            print(f"{backup['id']}  {backup['created']}  {backup['size']} bytes")
+    
+    elif args.action == "gc":
+        result = manager.gc_backups()
+        print(f"Backups retained: {result['snapshots']}")
+        print(f"Removed objects: {result['removed_objects']} ({result['reclaimed_bytes']} bytes reclaimed)")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    try:
+        main()
+    except TimeoutError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
\ No newline at end of file
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Pipeline Validation Daemon
+Keeps parsed schemas, compiled validators and resolved configs in memory and
+serves validation requests from the pipeline CLIs over a Unix domain socket
+
+Protocol: one JSON object per line in each direction. A request names an
+``op`` plus its parameters; the reply is ``{"ok": true, "result": ...}`` or
+``{"ok": false, "error": "..."}``. Paths in requests must be absolute.
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+
+from pipeline_common import DEFAULT_DAEMON_SOCKET as DEFAULT_SOCKET, load_script
+
+# Seconds a client waits for the daemon before falling back to in-process work
+CLIENT_TIMEOUT = 30
+
+
+def request(op, socket_path=None, **params):
+    """Send one request to a running daemon.
+
+    Returns the result, or None when no daemon is listening or the request
+    failed, in which case callers do the work in-process.
+    """
+    socket_path = str(socket_path or DEFAULT_SOCKET)
+    if not os.path.exists(socket_path):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(CLIENT_TIMEOUT)
+            client.connect(socket_path)
+            client.sendall(json.dumps(dict(params, op=op)).encode() + b"\n")
+            with client.makefile('rb') as f:
+                reply = json.loads(f.readline())
+    except (OSError, ValueError):
+        return None
+    return reply["result"] if reply.get("ok") else None
+
+
+class PipelineService:
+    """Request handlers sharing warm validators across connections"""
+
+    def __init__(self):
+        self.validate_config = load_script("validate-config")
+        self.manage_decision_record = load_script("manage-decision-record")
+        self.started = time.time()
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._validators = {}
+        self._resolvers = {}
+
+    def validator(self, schema, cache_dir=None, no_cache=False, max_errors=None):
+        """The validator for ``schema``, rebuilt whenever the schema file changes"""
+        schema_hash = self.validate_config.content_hash(schema)
+        key = (schema, cache_dir, no_cache, max_errors)
+        with self._lock:
+            entry = self._validators.get(key)
+            if entry is None or entry[0] != schema_hash:
+                cache = None if no_cache else self.validate_config.ResultCache(
+                    cache_dir or self.validate_config.DEFAULT_CACHE_DIR)
+                entry = (schema_hash, self.validate_config.ConfigValidator(schema, cache=cache,
+                                                                           max_errors=max_errors))
+                self._validators[key] = entry
+                self._resolvers = {k: v for k, v in self._resolvers.items() if k[0] != schema}
+            return entry[1]
+
+    def resolver(self, schema, base_config, cache_dir=None):
+        """The resolver for ``schema`` and ``base_config``; keeps resolved configs in memory"""
+        validator = self.validator(schema, cache_dir)
+        key = (schema, base_config, cache_dir)
+        with self._lock:
+            resolver = self._resolvers.get(key)
+            if resolver is None or resolver.validator is not validator:
+                resolver = self.validate_config.ConfigResolver(
+                    validator, base_config, cache_dir or self.validate_config.DEFAULT_CACHE_DIR)
+                self._resolvers[key] = resolver
+            return resolver
+
+    def handle(self, message):
+        """Dispatch one request to its ``op_<name>`` handler"""
+        handler = getattr(self, f"op_{message.pop('op', '')}", None)
+        if handler is None:
+            raise ValueError("unknown op")
+        with self._lock:
+            self.requests += 1
+        return handler(**message)
+
+    def op_ping(self):
+        return {"pid": os.getpid(), "uptime_s": round(time.time() - self.started, 3),
+                "requests": self.requests, "validators": len(self._validators)}
+
+    def op_validate(self, config_file, schema, cache_dir=None, no_cache=False, max_errors=None):
+        return self.validator(schema, cache_dir, no_cache, max_errors).validate_config(config_file)
+
+    def op_report(self, config_file, schema, cache_dir=None, no_cache=False, max_errors=None):
+        return self.validator(schema, cache_dir, no_cache, max_errors).generate_config_report(config_file)
+
+    def op_resolve(self, config_file, schema, base_config, cache_dir=None):
+        resolved, artifact = self.resolver(schema, base_config, cache_dir).resolve(config_file)
+        return {"resolved": resolved, "artifact": str(artifact)}
+
+    def op_analyze(self, decision_file):
+        return self.manage_decision_record.DecisionRecordManager(decision_file).analyze_size()
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """Reads JSON requests line by line and writes one JSON reply per request"""
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                reply = {"ok": True, "result": self.server.service.handle(json.loads(line))}
+            except Exception as e:  # reported to the client, which falls back in-process
+                reply = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(reply).encode() + b"\n")
+            self.wfile.flush()
+
+
+class PipelineDaemon(socketserver.ThreadingUnixStreamServer):
+    """Unix socket server handling each connection on its own thread"""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path):
+        self.socket_path = Path(socket_path)
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            if request("ping", self.socket_path) is not None:
+                raise RuntimeError(f"Daemon already running on {self.socket_path}")
+            self.socket_path.unlink()  # left behind by a daemon that didn't exit cleanly
+        self.service = PipelineService()
+        super().__init__(str(self.socket_path), RequestHandler)
+
+    def server_close(self):
+        super().server_close()
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve pipeline validation requests from a warm process")
+    parser.add_argument("--socket", default=str(DEFAULT_SOCKET),
+                       help="Unix socket path (default: $ATRIUMN_DAEMON_SOCKET or <cache dir>/daemon.sock)")
+    parser.add_argument("--status", action="store_true",
+                       help="Report whether a daemon is running")
+    parser.add_argument("--stop", action="store_true",
+                       help="Stop a running daemon")
+
+    args = parser.parse_args()
+
+    if args.status or args.stop:
+        status = request("ping", args.socket)
+        if status is None:
+            print(f"❌ No daemon running on {args.socket}")
+            sys.exit(1)
+        if args.stop:
+            os.kill(status["pid"], signal.SIGTERM)
+            print(f"✅ Stopped daemon (pid {status['pid']})")
+        else:
+            print(f"✅ Daemon running on {args.socket}")
+            print(f"  PID: {status['pid']}")
+            print(f"  Uptime: {status['uptime_s']}s")
+            print(f"  Requests served: {status['requests']}")
+        sys.exit(0)
+
+    try:
+        server = PipelineDaemon(args.socket)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    # SIGTERM stops the serve loop from another thread (shutdown() blocks until it exits)
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown).start())
+    print(f"✅ Pipeline daemon listening on {args.socket}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Pipeline Timings
+Per-stage wall time and peak memory for the pipeline CLIs (--timings,
+--prometheus-textfile and --profile), plus a viewer for saved cProfile dumps
+"""
+
+import argparse
+import atexit
+import json
+import sys
+import time
+import tracemalloc
+
+from pipeline_common import write_atomic
+
+
+class StageTimings:
+    """Collects wall time, call counts and tracemalloc peaks per named stage.
+
+    Stages may nest; a stage's peak covers everything allocated while it was
+    open, including its children. Results are written when the process exits,
+    so the CLIs can keep calling sys.exit() wherever they finish.
+    """
+
+    def __init__(self, labels, json_file=None, prometheus_file=None, profile_file=None):
+        self.labels = labels
+        self.json_file = json_file
+        self.prometheus_file = prometheus_file
+        self.profile_file = profile_file
+        self.stages = {}
+        self._stack = []
+        self._start = time.perf_counter()
+        self._profiler = None
+
+        tracemalloc.start()
+        if profile_file:
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        atexit.register(self.finish)
+
+    def stage(self, name):
+        return _Stage(self, name)
+
+    def _enter(self, name):
+        if self._stack:
+            self._stack[-1][2] = max(self._stack[-1][2], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        self._stack.append([name, time.perf_counter(), 0])
+
+    def _exit(self):
+        name, start, peak = self._stack.pop()
+        elapsed = time.perf_counter() - start
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        if self._stack:
+            self._stack[-1][2] = max(self._stack[-1][2], peak)
+
+        entry = self.stages.setdefault(name, {"calls": 0, "wall_ms": 0.0, "peak_bytes": 0})
+        entry["calls"] += 1
+        entry["wall_ms"] += elapsed * 1000
+        entry["peak_bytes"] = max(entry["peak_bytes"], peak)
+
+    def report(self):
+        """Timings collected so far as a JSON-serializable dict"""
+        _, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+        peak = max([peak] + [entry["peak_bytes"] for entry in self.stages.values()])
+        return {
+            "labels": self.labels,
+            "total_ms": round((time.perf_counter() - self._start) * 1000, 3),
+            "peak_memory_bytes": peak,
+            "stages": [{"name": name, "calls": entry["calls"], "wall_ms": round(entry["wall_ms"], 3),
+                        "peak_bytes": entry["peak_bytes"]}
+                       for name, entry in self.stages.items()]
+        }
+
+    def prometheus(self, report):
+        """Report in the Prometheus text exposition format"""
+        def labels(**extra):
+            pairs = dict(self.labels, **extra)
+            escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"') for value in pairs.values())
+            return "{" + ",".join(f'{key}="{value}"' for key, value in zip(pairs, escaped)) + "}"
+
+        lines = [
+            "# HELP atriumn_pipeline_run_seconds Wall time of the whole pipeline command",
+            "# TYPE atriumn_pipeline_run_seconds gauge",
+            f"atriumn_pipeline_run_seconds{labels()} {report['total_ms'] / 1000:.6f}",
+            "# HELP atriumn_pipeline_run_peak_bytes Peak traced Python memory of the command",
+            "# TYPE atriumn_pipeline_run_peak_bytes gauge",
+            f"atriumn_pipeline_run_peak_bytes{labels()} {report['peak_memory_bytes']}",
+        ]
+        metrics = (("stage_seconds", "Wall time spent in a pipeline stage", lambda s: f"{s['wall_ms'] / 1000:.6f}"),
+                   ("stage_calls", "Times a pipeline stage ran", lambda s: s["calls"]),
+                   ("stage_peak_bytes", "Peak traced Python memory during a stage", lambda s: s["peak_bytes"]))
+        for metric, help_text, value in metrics:
+            lines.append(f"# HELP atriumn_pipeline_{metric} {help_text}")
+            lines.append(f"# TYPE atriumn_pipeline_{metric} gauge")
+            lines.extend(f"atriumn_pipeline_{metric}{labels(stage=stage['name'])} {value(stage)}"
+                         for stage in report["stages"])
+        return "\n".join(lines) + "\n"
+
+    def finish(self):
+        """Stop collecting and write every requested output"""
+        if self._profiler is not None:
+            self._profiler.disable()
+            self._profiler.dump_stats(self.profile_file)
+            self._profiler = None
+        report = self.report()
+        tracemalloc.stop()
+
+        if self.json_file == "-":
+            print(json.dumps(report, indent=2), file=sys.stderr)
+        elif self.json_file:
+            write_atomic(self.json_file, json.dumps(report, indent=2) + "\n")
+        if self.prometheus_file:
+            # The textfile collector may read at any moment, so never expose a partial file
+            write_atomic(self.prometheus_file, self.prometheus(report))
+
+
+class _Stage:
+    __slots__ = ("timings", "name")
+
+    def __init__(self, timings, name):
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self):
+        self.timings._enter(self.name)
+
+    def __exit__(self, *exc_info):
+        self.timings._exit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show the hottest functions in a --profile dump")
+    parser.add_argument("profile_file", help="cProfile dump written by --profile")
+    parser.add_argument("--sort", default="cumulative",
+                       help="pstats sort key (cumulative, tottime, calls, ...)")
+    parser.add_argument("--limit", type=int, default=25,
+                       help="Number of functions to show")
+
+    args = parser.parse_args()
+
+    import pstats
+    pstats.Stats(args.profile_file).strip_dirs().sort_stats(args.sort).print_stats(args.limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Pipeline Common
+Helpers shared by the pipeline scripts: cache and daemon socket locations,
+loading sibling scripts, the daemon client, the timing options and their
+no-op stand-in, and atomic file writes
+
+The CLIs import this module by name, which works because Python puts a
+script's own directory on sys.path. Code that loads the scripts from
+elsewhere (benchmarks, stress tests) adds this directory to sys.path first.
+"""
+
+import os
+from contextlib import nullcontext
+from pathlib import Path
+
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+# Where derived artifacts (resolved configs, cached results, indexes) are stored
+DEFAULT_CACHE_DIR = Path(os.environ.get("ATRIUMN_CACHE_DIR",
+                                        Path.home() / ".cache" / "atriumn-pipeline"))
+
+# Unix socket the pipeline daemon listens on
+DEFAULT_DAEMON_SOCKET = Path(os.environ.get("ATRIUMN_DAEMON_SOCKET") or DEFAULT_CACHE_DIR / "daemon.sock")
+
+
+def load_script(name):
+    """Import a hyphenated script from scripts/ as a module"""
+    import importlib.util
+    spec = importlib.util.spec_from_file_location(name.replace("-", "_"), SCRIPT_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def daemon_request(op, socket_path=None, **params):
+    """Have a running pipeline daemon perform ``op``; None means do it in-process.
+
+    The daemon client is only loaded once its socket exists, so runs without
+    a daemon don't pay for its imports.
+    """
+    socket_path = socket_path or DEFAULT_DAEMON_SOCKET
+    if not os.path.exists(socket_path):
+        return None
+    return load_script("pipeline-daemon").request(op, socket_path, **params)
+
+
+def add_timing_arguments(parser):
+    """Add the shared --timings/--prometheus-textfile/--profile options to a CLI parser"""
+    parser.add_argument("--timings", nargs="?", const="-", metavar="FILE",
+                       help="Write per-stage wall time and peak memory as JSON (to stderr without FILE)")
+    parser.add_argument("--prometheus-textfile", metavar="FILE",
+                       help="Write stage timings for the Prometheus node_exporter textfile collector")
+    parser.add_argument("--profile", metavar="FILE",
+                       help="Also dump cProfile statistics to FILE")
+
+
+def timings_from_args(args, labels):
+    """A StageTimings (see pipeline-timings.py) for the options added by
+    add_timing_arguments, or None if none were given"""
+    if not (args.timings or args.prometheus_textfile or args.profile):
+        return None
+    return load_script("pipeline-timings").StageTimings(
+        labels, json_file=args.timings, prometheus_file=args.prometheus_textfile, profile_file=args.profile)
+
+
+class NoTimings:
+    """Stand-in for pipeline-timings' StageTimings when --timings is off"""
+
+    def stage(self, name):
+        return _NO_STAGE
+
+
+_NO_STAGE = nullcontext()
+
+
+# Process umask, applied to files created through temp_path
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def temp_path(path):
+    """Create a uniquely named temporary file next to ``path``.
+
+    The name is unique per call, not per process, so threads (such as the
+    daemon's request handlers) never share one. The file gets ``path``'s
+    permissions (or the umask default) so that an ``os.replace`` onto
+    ``path`` doesn't change them.
+    """
+    import tempfile
+    fd, tmp_file = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        mode = path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    os.chmod(tmp_file, mode)
+    return Path(tmp_file)
+
+
+def write_atomic(path, data, binary=False):
+    """Write ``data`` to ``path`` via a temporary file and an atomic rename"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = temp_path(path)
+    try:
+        with open(tmp_file, 'wb' if binary else 'w') as f:
+            f.write(data)
+        os.replace(tmp_file, path)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
@@ -4,25 +4,405 @@ Configuration Validation Script
 Validates repository configuration files against the schema
 """
 
+# Modules only some code paths need (yaml, glob, shutil, marshal,
+# concurrent.futures) are imported where they are used, so that quick CLI
+# calls, especially those answered from the caches, start fast
 import argparse
+import copy
+import hashlib
 import json
 import os
+import re
 import sys
-import yaml
+import time
+from collections import defaultdict
+from functools import cached_property
 from pathlib import Path
 
+import pipeline_common
+from pipeline_common import DEFAULT_CACHE_DIR, daemon_request, load_script, write_atomic
+
+
+# Bump whenever validation semantics or result shapes change, so cached
+# results from older versions of this script are never served
+VALIDATOR_VERSION = "4"
+
+# Upper bound on the on-disk size of cached validation results
+DEFAULT_RESULT_CACHE_BYTES = 32 * 1024 * 1024
+
+
+# Per-stage instrumentation; replaced by a StageTimings in main() when requested
+timings = pipeline_common.NoTimings()
+
+
+# Schema type names mapped to the Python types yaml.safe_load produces
+SCHEMA_TYPES = {
+    "string": str,
+    "integer": int,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+# Checks for the schema's ``format`` keyword; an email only has to look like one
+FORMATS = {
+    "email": re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+\Z").match,
+}
+
+
+class ErrorLimitReached(Exception):
+    """Raised by BoundedErrors when an error arrives after it is full"""
+
+
+class BoundedErrors(list):
+    """An error list that stops validation, by raising ErrorLimitReached, once it
+    would exceed its limit; the error that raises it is dropped"""
+
+    def __init__(self, limit):
+        super().__init__()
+        self.limit = limit
+
+    def append(self, error):
+        if len(self) >= self.limit:
+            raise ErrorLimitReached
+        super().append(error)
+
+
+def compile_field(field_name, field_def):
+    """Compile a schema field definition into a validator callable.
+
+    The returned callable takes ``(value, errors)`` and appends any error
+    messages to ``errors``. Type lookups, regex compilation and
+    allowed-value sets are resolved here once, not per validated value;
+    array ``items`` are compiled once too and checked in a single pass over
+    the list.
+    """
+    checks = []
+    expected_type = field_def.get("type")
+
+    python_type = SCHEMA_TYPES.get(expected_type)
+    if python_type is not None:
+        type_error = f"{field_name}: Expected {expected_type}, got "
+
+        def check_type(value, errors):
+            if not isinstance(value, python_type):
+                errors.append(type_error + type(value).__name__)
+        checks.append(check_type)
+
+    if "pattern" in field_def:
+        pattern = field_def["pattern"]
+        matcher = re.compile(pattern).match
+
+        def check_pattern(value, errors):
+            if isinstance(value, str) and not matcher(value):
+                errors.append(f"{field_name}: Value '{value}' doesn't match pattern '{pattern}'")
+        checks.append(check_pattern)
+
+    if "format" in field_def:
+        format_name = field_def["format"]
+        if format_name not in FORMATS:
+            raise ValueError(f"{field_name}: Unknown format '{format_name}' in schema")
+        format_matcher = FORMATS[format_name]
+
+        def check_format(value, errors):
+            if isinstance(value, str) and not format_matcher(value):
+                errors.append(f"{field_name}: Value '{value}' is not a valid {format_name}")
+        checks.append(check_format)
+
+    if "minimum" in field_def or "maximum" in field_def:
+        minimum = field_def.get("minimum")
+        maximum = field_def.get("maximum")
+
+        def check_range(value, errors):
+            if not isinstance(value, int):
+                return
+            if minimum is not None and value < minimum:
+                errors.append(f"{field_name}: Value {value} below minimum {minimum}")
+            if maximum is not None and value > maximum:
+                errors.append(f"{field_name}: Value {value} above maximum {maximum}")
+        checks.append(check_range)
+
+    if "allowed_values" in field_def:
+        allowed_list = field_def["allowed_values"]
+        allowed = frozenset(allowed_list)
+
+        def check_allowed(value, errors):
+            try:
+                ok = value in allowed
+            except TypeError:  # unhashable values (lists, dicts) are never allowed
+                ok = False
+            if not ok:
+                errors.append(f"{field_name}: Value '{value}' not in allowed values {allowed_list}")
+        checks.append(check_allowed)
+
+    if expected_type == "object" and "properties" in field_def:
+        properties = {
+            prop_name: compile_field(f"{field_name}.{prop_name}", prop_def)
+            for prop_name, prop_def in field_def["properties"].items()
+        }
+
+        def check_properties(value, errors):
+            if not isinstance(value, dict):
+                return
+            for prop_name, prop_value in value.items():
+                validator = properties.get(prop_name)
+                if validator is not None:
+                    validator(prop_value, errors)
+        checks.append(check_properties)
+
+    if expected_type == "array" and "items" in field_def:
+        item_name = f"{field_name}[]"
+        validate_item = compile_field(item_name, field_def["items"])
+        name_length = len(item_name)
+
+        def check_items(value, errors):
+            if not isinstance(value, list):
+                return
+            # Item errors are named "field[]"; relabel the (rare) failures with their index
+            item_errors = []
+            for index, item in enumerate(value):
+                validate_item(item, item_errors)
+                if item_errors:
+                    for error in item_errors:
+                        errors.append(f"{field_name}[{index}]{error[name_length:]}")
+                    item_errors.clear()
+        checks.append(check_items)
+
+    if len(checks) == 1:
+        return checks[0]
+    checks = tuple(checks)
+
+    def validate(value, errors):
+        for check in checks:
+            check(value, errors)
+    return validate
+
+
+def load_yaml(stream):
+    """yaml.safe_load, using libyaml's much faster CSafeLoader when PyYAML has it"""
+    import yaml
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def load_schema_snapshot(schema_file, schema_hash, snapshot_dir):
+    """Parse a schema file, or load the snapshot saved the last time it was parsed.
+
+    Snapshots are marshal dumps keyed by the schema's content hash and the
+    Python version (marshal's format is version specific), so an edited
+    schema is simply parsed again. A snapshot that can't be written (such as
+    under a read-only cache directory) is skipped.
+    """
+    import marshal
+    snapshot = Path(snapshot_dir) / f"{schema_hash}-py{sys.version_info[0]}{sys.version_info[1]}.marshal"
+    try:
+        with open(snapshot, 'rb') as f:
+            return marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    with open(schema_file, 'r') as f:
+        schema = load_yaml(f)
+    try:
+        data = marshal.dumps(schema)
+    except ValueError:
+        return schema  # holds values marshal can't store, such as YAML timestamps
+    try:
+        write_atomic(snapshot, data, binary=True)
+    except OSError:
+        pass
+    return schema
+
+
+def content_hash(path):
+    """SHA-256 of a file's contents"""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def write_json_atomic(path, data):
+    """Write JSON to ``path`` via a temporary file and an atomic rename"""
+    write_atomic(path, json.dumps(data, indent=2))
+
+
+def json_value(value):
+    """``json.dumps`` default for YAML values JSON has no type for: dates become ISO 8601 strings"""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def deep_merge(base, override):
+    """Recursively merge ``override`` into ``base``, returning a new dict.
+
+    Nested mappings are merged key by key; any other value in ``override``
+    (including lists) replaces the one in ``base``.
+    """
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def schema_defaults(field_definitions):
+    """Collect the (nested) default values declared in field definitions"""
+    defaults = {}
+    for field_name, field_def in field_definitions.items():
+        if "default" in field_def:
+            defaults[field_name] = copy.deepcopy(field_def["default"])
+        elif "properties" in field_def:
+            nested = schema_defaults(field_def["properties"])
+            if nested:
+                defaults[field_name] = nested
+    return defaults
+
+
+class ResultCache:
+    """On-disk cache of validation results with size-bounded LRU eviction.
+
+    Entries live in ``<cache_dir>/<subdir>/<key>.json``. A hit refreshes the
+    entry's mtime, and eviction removes the least recently used entries once
+    the cache grows past ``max_bytes``. Entries that can't be read or decoded
+    are misses.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_RESULT_CACHE_BYTES, subdir="results"):
+        self.root = Path(cache_dir)
+        self.cache_dir = self.root / subdir
+        self.max_bytes = max_bytes
+        self._total_bytes = None  # scanned lazily on the first write
+
+    @staticmethod
+    def key(kind, schema_hash, config_hash):
+        """Cache key for a result of ``kind`` ("validate" or "report")"""
+        parts = (VALIDATOR_VERSION, kind, schema_hash, config_hash)
+        return hashlib.sha256(":".join(parts).encode()).hexdigest()
+
+    def get(self, key):
+        """Return the cached result for ``key``, or None"""
+        entry = self.cache_dir / f"{key}.json"
+        try:
+            with open(entry, 'r') as f:
+                result = json.load(f)
+            os.utime(entry)
+        except (OSError, ValueError):
+            return None
+        return result
+
+    def put(self, key, result):
+        """Store a result and evict old entries if over budget.
+
+        Caching is best effort: results JSON can't hold (such as configs with
+        YAML dates) and unwritable cache directories are simply not cached.
+        """
+        entry = self.cache_dir / f"{key}.json"
+        try:
+            write_json_atomic(entry, result)
+
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._entries())
+            else:
+                self._total_bytes += entry.stat().st_size
+            if self._total_bytes > self.max_bytes:
+                self.evict()
+        except (TypeError, ValueError, OSError):
+            pass
+
+    def _entries(self):
+        """(mtime, size, path) for every cache entry"""
+        entries = []
+        for entry in self.cache_dir.glob("*.json"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:  # evicted by a concurrent process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        return entries
+
+    def evict(self):
+        """Remove least recently used entries until within max_bytes"""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                entry.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._total_bytes = total
+
+
+class CompiledSchema:
+    """A configuration schema compiled into reusable validator callables"""
+
+    def __init__(self, schema):
+        schema_def = schema["configuration_schema"]
+        self.required_fields = tuple(schema_def["required_fields"])
+        self.known_fields = frozenset(self.required_fields) | frozenset(schema_def["optional_fields"])
+        self.validators = {
+            field_name: compile_field(field_name, field_def)
+            for field_name, field_def in schema["field_definitions"].items()
+        }
+
+    def validate(self, config, max_errors=None):
+        """Validate a parsed configuration, returning (errors, warnings, truncated).
+
+        With ``max_errors``, validation stops at the first error beyond that
+        many, and ``truncated`` is True; a config with exactly ``max_errors``
+        errors is reported in full.
+        """
+        errors = [] if max_errors is None else BoundedErrors(max_errors)
+        warnings = []
+        truncated = False
+
+        try:
+            for field in self.required_fields:
+                if field not in config:
+                    errors.append(f"Missing required field: {field}")
+
+            validators = self.validators
+            for field, value in config.items():
+                validator = validators.get(field)
+                if validator is not None:
+                    validator(value, errors)
+        except ErrorLimitReached:
+            truncated = True
+
+        for field in config:
+            if field not in self.known_fields:
+                warnings.append(f"Unknown field (will be ignored): {field}")
+
+        return list(errors), warnings, truncated
+
 
 class ConfigValidator:
     """Validates repository configurations against schema"""
     
-    def __init__(self, schema_file):
+    def __init__(self, schema_file, schema=None, cache=None, max_errors=None):
         self.schema_file = Path(schema_file)
-        self.schema = self._load_schema()
+        self.cache = cache
+        self.max_errors = max_errors
+        self.schema = schema if schema is not None else self._load_schema()
+        with timings.stage("compile_schema"):
+            self.compiled_schema = CompiledSchema(self.schema)
+            self.defaults = schema_defaults(self.schema["field_definitions"])
         
     def _load_schema(self):
-        """Load the configuration schema"""
-        with open(self.schema_file, 'r') as f:
-            return yaml.safe_load(f)
+        """Load the configuration schema (from its snapshot when results are cached)"""
+        with timings.stage("load_schema"):
+            if self.cache is not None:
+                return load_schema_snapshot(self.schema_file, self.schema_hash, self.cache.root / "schemas")
+            with open(self.schema_file, 'r') as f:
+                return load_yaml(f)
+    
+    @cached_property
+    def schema_hash(self):
+        """Content hash of the schema file"""
+        return content_hash(self.schema_file)
     
     def validate_config(self, config_file):
         """Validate a configuration file"""
@@ -34,113 +414,72 @@ class ConfigValidator:
                 "error": f"Configuration file not found: {config_file}"
             }
         
+        with timings.stage("read_config"), open(config_path, 'rb') as f:
+            raw_config = f.read()
+        
+        cache_key = None
+        if self.cache is not None:
+            with timings.stage("cache_lookup"):
+                kind = "validate" if self.max_errors is None else f"validate-max{self.max_errors}"
+                cache_key = self.cache.key(kind, self.schema_hash, hashlib.sha256(raw_config).hexdigest())
+                cached = self.cache.get(cache_key)
+            if cached is not None:
+                cached["cached"] = True
+                return cached
+        
+        result = self._validate_raw_config(raw_config)
+        if cache_key is not None:
+            with timings.stage("cache_store"):
+                self.cache.put(cache_key, result)
+        return result
+    
+    def _validate_raw_config(self, raw_config):
+        """Parse and validate the bytes of a configuration file"""
+        import yaml
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            with timings.stage("parse_yaml"):
+                config = load_yaml(raw_config)
         except yaml.YAMLError as e:
             return {
                 "valid": False,
                 "error": f"Invalid YAML syntax: {e}"
             }
         
+        if not isinstance(config, dict):
+            found = "an empty file" if config is None else type(config).__name__
+            return {
+                "valid": False,
+                "error": f"Configuration must be a mapping, got {found}"
+            }
+        
         # Validate against schema
-        validation_result = self._validate_against_schema(config)
+        with timings.stage("validate_schema"):
+            validation_result = self._validate_against_schema(config)
         
         if validation_result["valid"]:
             # Apply defaults and enhancements
-            enhanced_config = self._apply_defaults(config)
+            with timings.stage("apply_defaults"):
+                enhanced_config = self._apply_defaults(config)
             validation_result["enhanced_config"] = enhanced_config
             
         return validation_result
     
     def _validate_against_schema(self, config):
         """Validate configuration against schema"""
-        schema_def = self.schema["configuration_schema"]
-        field_definitions = self.schema["field_definitions"]
-        
-        errors = []
-        warnings = []
-        
-        # Check required fields
-        for field in schema_def["required_fields"]:
-            if field not in config:
-                errors.append(f"Missing required field: {field}")
-        
-        # Validate field types and constraints
-        for field, value in config.items():
-            if field in field_definitions:
-                field_errors = self._validate_field(field, value, field_definitions[field])
-                errors.extend(field_errors)
-        
-        # Check for unknown fields
-        known_fields = schema_def["required_fields"] + schema_def["optional_fields"]
-        for field in config:
-            if field not in known_fields:
-                warnings.append(f"Unknown field (will be ignored): {field}")
+        errors, warnings, truncated = self.compiled_schema.validate(config, self.max_errors)
         
-        return {
+        result = {
             "valid": len(errors) == 0,
             "errors": errors,
             "warnings": warnings
         }
-    
-    def _validate_field(self, field_name, value, field_def):
-        """Validate a specific field"""
-        errors = []
-        
-        # Type validation
-        expected_type = field_def["type"]
-        if expected_type == "string" and not isinstance(value, str):
-            errors.append(f"{field_name}: Expected string, got {type(value).__name__}")
-        elif expected_type == "integer" and not isinstance(value, int):
-            errors.append(f"{field_name}: Expected integer, got {type(value).__name__}")
-        elif expected_type == "boolean" and not isinstance(value, bool):
-            errors.append(f"{field_name}: Expected boolean, got {type(value).__name__}")
-        elif expected_type == "array" and not isinstance(value, list):
-            errors.append(f"{field_name}: Expected array, got {type(value).__name__}")
-        elif expected_type == "object" and not isinstance(value, dict):
-            errors.append(f"{field_name}: Expected object, got {type(value).__name__}")
-        
-        # Pattern validation
-        if "pattern" in field_def and isinstance(value, str):
-            import re
-            if not re.match(field_def["pattern"], value):
-                errors.append(f"{field_name}: Value '{value}' doesn't match pattern '{field_def['pattern']}'")
-        
-        # Range validation
-        if isinstance(value, int):
-            if "minimum" in field_def and value < field_def["minimum"]:
-                errors.append(f"{field_name}: Value {value} below minimum {field_def['minimum']}")
-            if "maximum" in field_def and value > field_def["maximum"]:
-                errors.append(f"{field_name}: Value {value} above maximum {field_def['maximum']}")
-        
-        # Allowed values validation
-        if "allowed_values" in field_def and value not in field_def["allowed_values"]:
-            errors.append(f"{field_name}: Value '{value}' not in allowed values {field_def['allowed_values']}")
-        
-        # Recursive validation for objects
-        if expected_type == "object" and "properties" in field_def:
-            for prop_name, prop_value in value.items():
-                if prop_name in field_def["properties"]:
-                    prop_errors = self._validate_field(
-                        f"{field_name}.{prop_name}", 
-                        prop_value, 
-                        field_def["properties"][prop_name]
-                    )
-                    errors.extend(prop_errors)
-        
-        return errors
+        if truncated:
+            result["errors_truncated"] = True
+        return result
     
     def _apply_defaults(self, config):
-        """Apply default values to configuration"""
-        field_definitions = self.schema["field_definitions"]
-        enhanced_config = config.copy()
-        
-        for field_name, field_def in field_definitions.items():
-            if field_name not in enhanced_config and "default" in field_def:
-                enhanced_config[field_name] = field_def["default"]
-        
-        return enhanced_config
+        """Apply (nested) schema default values to configuration"""
+        return deep_merge(copy.deepcopy(self.defaults), config)
     
     def get_config_recommendations(self, config):
         """Provide recommendations based on configuration"""
@@ -181,15 +520,27 @@ class ConfigValidator:
     
     def generate_config_report(self, config_file):
         """Generate a comprehensive configuration report"""
+        cache_key = None
+        if self.cache is not None and Path(config_file).exists():
+            cache_key = self.cache.key("report", self.schema_hash, content_hash(config_file))
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                cached["config_file"] = str(config_file)
+                cached["cached"] = True
+                return cached
+        
         validation_result = self.validate_config(config_file)
         
         if not validation_result["valid"]:
             return validation_result
         
         config = validation_result["enhanced_config"]
-        recommendations = self.get_config_recommendations(config)
+        # Schema defaults always fill in escalation_hours; only a channel or list means notifications
+        notifications = config.get("notifications", {})
+        with timings.stage("recommendations"):
+            recommendations = self.get_config_recommendations(config)
         
-        return {
+        report = {
             "valid": True,
             "config_file": str(config_file),
             "repo_name": config.get("repo_name"),
@@ -201,24 +552,399 @@ class ConfigValidator:
                 "thoughts_directory": config.get("thoughts_directory"),
                 "research_min_refs": config.get("validation", {}).get("research_min_refs"),
                 "team_size": len(config.get("team", {}).get("default_reviewers", [])),
-                "has_notifications": bool(config.get("notifications", {})),
+                "has_notifications": bool(notifications.get("slack_channel") or notifications.get("email_list")),
                 "parallel_pipelines": config.get("workflow_customization", {}).get("parallel_pipelines", 3)
             }
         }
+        
+        if cache_key is not None:
+            self.cache.put(cache_key, report)
+        return report
+
+    def validate_batch(self, config_files, report=False, jobs=None, fleet=False, identity_checker=None):
+        """Validate many configuration files, spreading work over a process pool.
+
+        With ``fleet``, the valid configs are also checked against each other
+        (see FleetIndex); per-file results still come from the result cache,
+        so only new or changed configs are re-read before the fleet pass.
+        With an ``identity_checker``, team usernames across all configs are
+        checked against GitHub in one deduplicated batch.
+        """
+        config_files = [str(config_file) for config_file in config_files]
+        jobs = min(jobs or os.cpu_count() or 1, len(config_files)) or 1
+        start = time.perf_counter()
+
+        if jobs == 1:
+            _init_batch_worker(self.schema_file, self.schema, self.cache, self.max_errors)
+            results = [_validate_batch_item(config_file, report) for config_file in config_files]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            # The parsed schema is shipped once per worker, never re-read from disk
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_batch_worker,
+                                     initargs=(self.schema_file, self.schema, self.cache,
+                                               self.max_errors)) as pool:
+                chunksize = max(1, len(config_files) // (jobs * 4))
+                results = list(pool.map(_validate_batch_item, config_files,
+                                        [report] * len(config_files), chunksize=chunksize))
+
+        if identity_checker is not None:
+            check_team_identities(results, identity_checker)
+
+        passed = sum(1 for result in results if result["valid"])
+        batch = {
+            "valid": passed == len(results),
+            "total": len(results),
+            "passed": passed,
+            "failed": len(results) - passed,
+            "jobs": jobs,
+            "elapsed_ms": None,
+            "results": results
+        }
+
+        if fleet:
+            with timings.stage("fleet_check"):
+                index = FleetIndex()
+                for result in results:
+                    if result["valid"]:
+                        index.add(result["config_file"], result["enhanced_config"])
+                batch["fleet"] = index.findings()
+            batch["valid"] = batch["valid"] and batch["fleet"]["valid"]
+
+        batch["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        return batch
+
+
+class ConfigResolver:
+    """Resolves repository configs through the inheritance chain.
+
+    Values are layered as schema defaults -> base config (configs/default.yml)
+    -> repository config. Resolved configs are memoized in-process and written
+    to ``<cache_dir>/resolved/<key>.json``, where the key is derived from the
+    content hashes of all three inputs. The artifacts are a ResultCache of
+    their own, with the same LRU size bound as validation results.
+    """
+    
+    def __init__(self, validator, base_config_file, cache_dir=DEFAULT_CACHE_DIR,
+                 max_bytes=DEFAULT_RESULT_CACHE_BYTES):
+        self.validator = validator
+        self.base_config_file = Path(base_config_file)
+        self.artifacts = ResultCache(cache_dir, max_bytes, subdir="resolved")
+        self.cache_dir = self.artifacts.cache_dir
+        self._memo = {}
+    
+    @cached_property
+    def base_config_hash(self):
+        """Content hash of the base config file"""
+        return content_hash(self.base_config_file)
+    
+    def cache_key(self, config_file):
+        """Cache key for a repository config: hash of all three input hashes"""
+        hashes = (self.validator.schema_hash, self.base_config_hash, content_hash(config_file))
+        return hashlib.sha256(":".join(hashes).encode()).hexdigest()
+    
+    def artifact_path(self, config_file):
+        """Path of the resolved config artifact for a repository config"""
+        return self.cache_dir / f"{self.cache_key(config_file)}.json"
+    
+    def merge(self, config):
+        """Layer schema defaults, the base config and ``config``"""
+        with open(self.base_config_file, 'r') as f:
+            base_config = load_yaml(f) or {}
+        return deep_merge(deep_merge(copy.deepcopy(self.validator.defaults), base_config), config)
+    
+    def resolve(self, config_file):
+        """Return the resolved config for ``config_file`` and its artifact path"""
+        key = self.cache_key(config_file)
+        artifact = self.cache_dir / f"{key}.json"
+        
+        resolved = self._memo.get(key)
+        if resolved is None:
+            resolved = self.artifacts.get(key)
+        
+        if resolved is None:
+            with open(config_file, 'r') as f:
+                resolved = self.merge(load_yaml(f) or {})
+            # The resolved config is a JSON document, served the same whether cached or not
+            resolved = json.loads(json.dumps(resolved, default=json_value))
+            self.artifacts.put(key, resolved)
+        
+        self._memo[key] = resolved
+        return copy.deepcopy(resolved), artifact
+
+
+# Per-process validator used by batch workers
+_batch_validator = None
+
+
+class FleetIndex:
+    """Cross-repository rules checked over every config of a fleet at once.
+
+    ``validation_rules`` in schema.yml includes rules no single config can
+    check (repo_name must be unique across all repositories). Each config is
+    added to hash indexes keyed by the values those rules compare, so the
+    whole fleet is checked in one pass instead of comparing configs pairwise.
+    """
+
+    def __init__(self):
+        # repo_name (case-insensitive) -> config files using it
+        self.repo_names = defaultdict(list)
+        # branch prefix -> branch naming pattern -> config files
+        self.branch_prefixes = defaultdict(lambda: defaultdict(list))
+        # GitHub user -> expert domain -> config files
+        self.domain_experts = defaultdict(lambda: defaultdict(list))
+
+    def add(self, config_file, config):
+        """Index one (enhanced) configuration"""
+        self.repo_names[str(config.get("repo_name", "")).lower()].append(config_file)
+
+        branches = config.get("branches") or {}
+        if branches.get("prefix"):
+            self.branch_prefixes[branches["prefix"]][branches.get("naming")].append(config_file)
+
+        for domain, user in ((config.get("team") or {}).get("domain_experts") or {}).items():
+            # The schema allows any value here; only "@user" strings can be compared
+            if isinstance(user, str):
+                self.domain_experts[user.lower()][domain].append(config_file)
+
+    def findings(self):
+        """Errors (broken cross-repo rules) and warnings (likely conflicts) for the fleet"""
+        errors, warnings = [], []
+
+        for repo_name, config_files in self.repo_names.items():
+            if len(config_files) > 1:
+                errors.append(f"repo_name '{repo_name}' must be unique across all repositories "
+                              f"(used by {', '.join(config_files)})")
+
+        for prefix, namings in self.branch_prefixes.items():
+            if len(namings) > 1:
+                used = "; ".join(f"'{naming}' in {', '.join(files)}" for naming, files in namings.items())
+                warnings.append(f"Branch prefix '{prefix}' uses conflicting naming patterns: {used}")
+            # Only prefixes ending at a '/' boundary can shadow each other ("feature/" vs "feature/api/")
+            segments = prefix.rstrip("/").split("/")
+            for length in range(1, len(segments)):
+                parent = "/".join(segments[:length]) + "/"
+                if parent in self.branch_prefixes:
+                    owners = [f for files in self.branch_prefixes[parent].values() for f in files]
+                    nested = [f for files in namings.values() for f in files]
+                    warnings.append(f"Branch prefix '{prefix}' ({', '.join(nested)}) is nested inside "
+                                    f"'{parent}' ({', '.join(owners)})")
+
+        for user, domains in self.domain_experts.items():
+            if len(domains) > 1:
+                used = "; ".join(f"{domain} in {', '.join(files)}" for domain, files in sorted(domains.items()))
+                warnings.append(f"{user} is a domain expert for different domains across repositories: {used}")
+
+        return {"valid": not errors, "errors": errors, "warnings": warnings}
+
+
+def _init_batch_worker(schema_file, schema, cache, max_errors=None):
+    """Build the batch worker's validator from an already-parsed schema"""
+    global _batch_validator
+    _batch_validator = ConfigValidator(schema_file, schema=schema, cache=cache, max_errors=max_errors)
+
+
+def _validate_batch_item(config_file, report):
+    """Validate one configuration file inside a batch worker"""
+    start = time.perf_counter()
+    try:
+        if report:
+            result = _batch_validator.generate_config_report(config_file)
+        else:
+            result = _batch_validator.validate_config(config_file)
+    except OSError as e:  # unreadable, or removed since the paths were expanded
+        result = {"valid": False, "error": f"Cannot read configuration: {e}"}
+    result["config_file"] = config_file
+    result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return result
+
+
+def check_team_identities(results, checker):
+    """Flag team usernames that aren't GitHub accounts in valid validation results.
+
+    Every distinct username across ``results`` is looked up once through
+    ``checker`` (see github-identity.py). Unknown users are errors and make
+    the result invalid; lookups that failed are reported as warnings.
+    """
+    github_identity = load_script("github-identity")
+    team_users = [(result, github_identity.team_usernames(result["enhanced_config"]))
+                  for result in results if result["valid"]]
+    with timings.stage("identity_check"):
+        exists = checker.check(user for _, users in team_users for _, user in users)
+    exists = {user.lower(): found for user, found in exists.items()}
+    
+    for result, users in team_users:
+        for field, user in users:
+            found = exists.get(user.lower())
+            if found is False:
+                result.setdefault("errors", []).append(f"{field}: @{user} is not a GitHub user")
+                result["valid"] = False
+            elif found is None:
+                result.setdefault("warnings", []).append(f"{field}: could not verify GitHub user @{user}")
+
+
+def expand_config_paths(paths, schema_file=None):
+    """Expand directories and glob patterns into a sorted list of config files"""
+    import glob
+    schema_path = Path(schema_file).resolve() if schema_file else None
+    config_files = set()
+
+    for path in paths:
+        if os.path.isdir(path):
+            matches = [str(p) for ext in ("*.yml", "*.yaml") for p in Path(path).glob(ext)]
+        elif glob.has_magic(path):
+            matches = glob.glob(path, recursive=True)
+        else:
+            matches = [path]
+
+        for match in matches:
+            if schema_path is None or Path(match).resolve() != schema_path:
+                config_files.add(match)
+
+    return sorted(config_files)
+
+
+def print_batch_item(item):
+    """Print one file's result from a batch or watch run"""
+    status = "✅" if item["valid"] else "❌"
+    print(f"{status} {item['config_file']} ({item['elapsed_ms']:.1f} ms)")
+
+    if "error" in item:
+        print(f"    Error: {item['error']}")
+    for error in item.get("errors", []):
+        print(f"    • {error}")
+    if item.get("errors_truncated"):
+        print(f"    … stopped after {len(item['errors'])} error(s)")
+
+
+def print_batch_result(result):
+    """Print an aggregated batch result as text"""
+    for item in result["results"]:
+        print_batch_item(item)
+
+    print()
+    print(f"📊 Batch validation: {result['passed']}/{result['total']} passed "
+          f"in {result['elapsed_ms']:.1f} ms using {result['jobs']} worker(s)")
+
+    if "fleet" in result:
+        fleet = result["fleet"]
+        print(f"{'✅' if fleet['valid'] else '❌'} Cross-repository checks: "
+              f"{len(fleet['errors'])} error(s), {len(fleet['warnings'])} warning(s)")
+        for error in fleet["errors"]:
+            print(f"    • {error}")
+        for warning in fleet["warnings"]:
+            print(f"    ⚠️  {warning}")
+
+    if result["valid"]:
+        print("✅ Configuration validation PASSED")
+    else:
+        print("❌ Configuration validation FAILED")
+
+
+def watch_configs(paths, schema_file, cache=None, debounce=0.3, use_inotify=True, max_errors=None):
+    """Revalidate configs whenever they change, until interrupted.
+
+    Results are memoized in memory by content hash, so saving a file without
+    changing it (or reverting an edit) is answered without validating again.
+    A schema change rebuilds the validator and revalidates every config.
+    """
+    file_watcher = load_script("file-watcher")
+    schema_file = str(Path(schema_file).resolve())
+    watcher = file_watcher.FileWatcher(list(paths) + [schema_file], patterns=("*.yml", "*.yaml"),
+                                       debounce=debounce, use_inotify=use_inotify)
+    validator = ConfigValidator(schema_file, cache=cache, max_errors=max_errors)
+    memo = {}
+    
+    def check(config_files):
+        for config_file in sorted(config_files):
+            start = time.perf_counter()
+            if not os.path.exists(config_file):
+                print(f"🗑️  {config_file} removed")
+                continue
+            key = content_hash(config_file)
+            if key not in memo:
+                memo[key] = validator.validate_config(config_file)
+            item = dict(memo[key], config_file=config_file,
+                        elapsed_ms=(time.perf_counter() - start) * 1000)
+            print_batch_item(item)
+        sys.stdout.flush()
+    
+    print(f"👀 Watching configuration files with {watcher.backend} (Ctrl-C to stop)")
+    check(expand_config_paths(paths, schema_file))
+    try:
+        for changed in watcher:
+            print(f"\n🔄 {time.strftime('%H:%M:%S')} {len(changed)} file(s) changed")
+            # Changed paths come back resolved, like schema_file, so a schema kept
+            # in a watched config directory triggers a rebuild, never a validation
+            if schema_file in changed:
+                validator = ConfigValidator(schema_file, cache=cache, max_errors=max_errors)
+                memo.clear()
+                check(expand_config_paths(paths, schema_file))
+            else:
+                check(changed)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
 
 
 def main():
     parser = argparse.ArgumentParser(description="Validate repository configuration files")
-    parser.add_argument("config_file", help="Path to configuration file to validate")
+    parser.add_argument("config_file", nargs="+",
+                       help="Path to configuration file to validate (directories and globs with --batch)")
     parser.add_argument("--schema", default="configs/schema.yml", 
                        help="Path to schema file")
     parser.add_argument("--output", choices=["text", "json"], default="text",
                        help="Output format")
     parser.add_argument("--report", action="store_true",
                        help="Generate comprehensive report")
+    parser.add_argument("--resolve", action="store_true",
+                       help="Write the fully resolved (inherited) configuration as JSON")
+    parser.add_argument("--resolved-output",
+                       help="Copy the resolved configuration to this path (default: print it)")
+    parser.add_argument("--base-config", default="configs/default.yml",
+                       help="Base configuration that all repos inherit")
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR),
+                       help="Directory for cached artifacts")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Always revalidate instead of reusing cached results")
+    parser.add_argument("--batch", action="store_true",
+                       help="Validate every config matched by the given directories/globs in one process")
+    parser.add_argument("--fleet", action="store_true",
+                       help="With --batch, also check cross-repository rules (unique repo_name, "
+                            "branch prefixes, domain experts)")
+    parser.add_argument("--check-identities", action="store_true",
+                       help="Check that team usernames are real GitHub users (cached, see github-identity.py)")
+    parser.add_argument("--identity-api-url",
+                       help="GitHub-compatible API for --check-identities (default: $ATRIUMN_GITHUB_API_URL "
+                            "or https://api.github.com)")
+    parser.add_argument("--max-errors", type=int, default=None, metavar="N",
+                       help="Stop validating a config after N errors")
+    parser.add_argument("--fail-fast", action="store_const", const=1, dest="max_errors",
+                       help="Stop validating a config at its first error (same as --max-errors 1)")
+    parser.add_argument("--jobs", type=int, default=None,
+                       help="Worker processes for --batch (default: CPU count)")
+    parser.add_argument("--no-daemon", action="store_true",
+                       help="Validate in-process even if a pipeline daemon is running")
+    parser.add_argument("--watch", action="store_true",
+                       help="Keep running and revalidate configs as they change")
+    parser.add_argument("--debounce", type=float, default=0.3,
+                       help="Seconds of quiet that end a burst of edits in --watch mode")
+    pipeline_common.add_timing_arguments(parser)
     
     args = parser.parse_args()
     
+    if not (args.batch or args.watch) and len(args.config_file) > 1:
+        parser.error("multiple configuration files require --batch")
+    if args.fleet and not args.batch:
+        parser.error("--fleet requires --batch")
+    if args.max_errors is not None and args.max_errors < 1:
+        parser.error("--max-errors must be at least 1")
+    
+    global timings
+    action = ("watch" if args.watch else "batch" if args.batch else "resolve" if args.resolve
+              else "report" if args.report else "validate")
+    timings = pipeline_common.timings_from_args(args, {"command": "validate-config", "action": action}) or timings
+    
     # Find schema file
     script_dir = Path(__file__).parent
     schema_path = script_dir.parent / args.schema
@@ -227,19 +953,100 @@ def main():
         print(f"❌ Schema file not found: {schema_path}")
         sys.exit(1)
     
-    validator = ConfigValidator(schema_path)
+    cache = None if args.no_cache else ResultCache(args.cache_dir)
     
-    if args.report:
-        result = validator.generate_config_report(args.config_file)
-    else:
-        result = validator.validate_config(args.config_file)
+    identity_checker = None
+    if args.check_identities:
+        github_identity = load_script("github-identity")
+        backend = github_identity.GitHubBackend(args.identity_api_url or github_identity.DEFAULT_API_URL)
+        identity_checker = github_identity.IdentityChecker(
+            backend, None if args.no_cache else github_identity.IdentityCache(Path(args.cache_dir) / "identities.json"))
+    
+    if args.watch:
+        watch_configs(args.config_file, schema_path, cache=cache, debounce=args.debounce,
+                      max_errors=args.max_errors)
+        sys.exit(0)
+    
+    if args.batch:
+        validator = ConfigValidator(schema_path, cache=cache, max_errors=args.max_errors)
+        with timings.stage("expand_paths"):
+            config_files = expand_config_paths(args.config_file, schema_path)
+        if not config_files:
+            print("❌ No configuration files matched")
+            sys.exit(1)
+        
+        with timings.stage("batch"):
+            result = validator.validate_batch(config_files, report=args.report, jobs=args.jobs,
+                                              fleet=args.fleet, identity_checker=identity_checker)
+        
+        if args.output == "json":
+            print(json.dumps(result, indent=2))
+        else:
+            print_batch_result(result)
+        
+        sys.exit(0 if result["valid"] else 1)
+    
+    config_file = args.config_file[0]
+    
+    # Prefer a running daemon, which already holds the parsed schema and
+    # resolved configs; build a validator in-process only when it can't help
+    def via_daemon(op, **params):
+        if args.no_daemon:
+            return None
+        with timings.stage("daemon_request"):
+            return daemon_request(op, config_file=os.path.abspath(config_file),
+                                  schema=str(schema_path.resolve()),
+                                  cache_dir=os.path.abspath(args.cache_dir), **params)
+    
+    validator = None
+    
+    if args.resolve:
+        result = via_daemon("validate", no_cache=args.no_cache, max_errors=args.max_errors)
+        if result is None:
+            validator = ConfigValidator(schema_path, cache=cache, max_errors=args.max_errors)
+            result = validator.validate_config(config_file)
+        if not result["valid"]:
+            print(json.dumps(result, indent=2) if args.output == "json"
+                  else "❌ Configuration validation FAILED - not resolving")
+            sys.exit(1)
+        
+        base_config = script_dir.parent / args.base_config
+        resolved = via_daemon("resolve", base_config=str(base_config.resolve()))
+        if resolved is None:
+            validator = validator or ConfigValidator(schema_path, cache=cache, max_errors=args.max_errors)
+            with timings.stage("resolve"):
+                config, artifact = ConfigResolver(validator, base_config, args.cache_dir).resolve(config_file)
+            resolved = {"resolved": config, "artifact": str(artifact)}
+        
+        if args.resolved_output:
+            if os.path.exists(resolved["artifact"]):
+                import shutil
+                shutil.copyfile(resolved["artifact"], args.resolved_output)
+            else:  # the cache directory isn't writable
+                write_json_atomic(Path(args.resolved_output), resolved["resolved"])
+            print(f"✅ Resolved configuration written to {args.resolved_output}")
+        else:
+            print(json.dumps(resolved["resolved"], indent=2))
+        sys.exit(0)
+    
+    result = via_daemon("report" if args.report else "validate", no_cache=args.no_cache,
+                        max_errors=args.max_errors)
+    if result is None:
+        validator = ConfigValidator(schema_path, cache=cache, max_errors=args.max_errors)
+        if args.report:
+            result = validator.generate_config_report(config_file)
+        else:
+            result = validator.validate_config(config_file)
+    
+    if identity_checker is not None:
+        check_team_identities([result], identity_checker)
     
     if args.output == "json":
         print(json.dumps(result, indent=2))
     else:
         # Text output
         if result["valid"]:
-            print("✅ Configuration validation PASSED")
+            print("✅ Configuration validation PASSED" + (" (cached)" if result.get("cached") else ""))
             
             if args.report:
                 print(f"\n📊 Configuration Report for {result['repo_name']}")
@@ -273,6 +1080,8 @@ def main():
                 print("\nErrors:")
                 for error in result["errors"]:
                     print(f"  • {error}")
+                if result.get("errors_truncated"):
+                    print(f"  … stopped after {len(result['errors'])} error(s)")
     
     sys.exit(0 if result["valid"] else 1)
 
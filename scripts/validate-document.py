@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Document Validation Script
+Validates research documents and implementation plans in a single pass over
+the document, with the same pass/fail rules as validate-research.sh and
+validate-plan.sh
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import yaml
+from pathlib import Path
+
+from pipeline_common import load_script
+
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_CONFIG_FILE = ".github/development-pipeline-config.yml"
+DEFAULT_CONFIG_FILE = SCRIPT_DIR.parent / "configs" / "default.yml"
+
+# Research sections used when the config doesn't list any
+# (validate-research.sh reads them from validation.plan_required_sections)
+DEFAULT_RESEARCH_SECTIONS = (
+    "## Research Question",
+    "## Summary",
+    "## Detailed Findings",
+    "## Code References",
+    "## Architecture Insights",
+)
+
+# `filename.ext:line` references; a line counts once however many it holds
+FILE_REFERENCE = re.compile(r'`[^`]*\.[a-z]*:')
+PLAN_PHASE = re.compile(r'^## Phase [0-9]')
+VERIFICATION_HEADER = re.compile(r'#### .*Verification:')
+AUTOMATED_VERIFICATION = "#### Automated Verification:"
+MANUAL_VERIFICATION = "#### Manual Verification:"
+# Lines after an automated verification header searched for commands (grep -A 10)
+VERIFICATION_CONTEXT_LINES = 10
+
+RESEARCH_PLACEHOLDERS = ("TODO", "FIXME", "XXX", "...")
+RESEARCH_BRACKET_PLACEHOLDERS = ("[TODO]", "[FIXME]", "[PLACEHOLDER]", "[XXX]")
+PLAN_OPEN_QUESTIONS = ("TODO", "FIXME", "XXX", "TBD", "???")
+
+# Repository-specific research checks: (applies-when pattern or None, required pattern, warning)
+REPO_RESEARCH_RULES = {
+    "platform-api": [
+        (None, re.compile(r'API'), "Platform API research should mention API considerations"),
+        (None, re.compile(r'security|auth|permission', re.I),
+         "Platform API research should consider security implications"),
+        (None, re.compile(r'performance|scalability', re.I),
+         "Platform API research should consider performance impact"),
+    ],
+    "curatefor.me": [
+        (re.compile(r'hld|daemon'), re.compile(r'humanlayer'),
+         "HLD-related research should mention humanlayer context"),
+        (re.compile(r'user.*interface|frontend', re.I), re.compile(r'ux|user.*experience', re.I),
+         "Frontend research should consider user experience"),
+    ],
+}
+
+
+class DocumentIndex:
+    """Everything the validation rules need from a markdown document.
+
+    The file is read once and its lines are scanned once; rules are then
+    evaluated against this index instead of re-reading the document.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            self.text = f.read()
+
+        # grep -q "^---" over the first 20 lines
+        self.has_frontmatter = False
+        # Identifier-like text before the first ':' of a line (grep "^field:")
+        self.line_keys = set()
+        # Lines containing '#': the only lines a "## Section" pattern can match
+        self.heading_lines = []
+        self.file_references = 0
+        self.phases = 0
+        self.verification_sections = 0
+        self.words = 0
+        # Automated verification headers and the lines after them
+        self.automated_verification = []
+        # Lines after the closing frontmatter delimiter, without '---' lines
+        # (awk '/^---$/{if(++c==2) f=1; next} f')
+        body_lines = []
+        delimiters = 0
+        context_left = 0
+
+        for number, line in enumerate(self.text.splitlines()):
+            self.words += len(line.split())
+            if number < 20 and line.startswith("---"):
+                self.has_frontmatter = True
+
+            if line == "---":
+                delimiters += 1
+            elif delimiters >= 2:
+                body_lines.append(line)
+
+            key, colon, _ = line.partition(":")
+            if colon and key.isidentifier():
+                self.line_keys.add(key)
+
+            if "#" in line:
+                self.heading_lines.append(line)
+                if PLAN_PHASE.match(line):
+                    self.phases += 1
+                if VERIFICATION_HEADER.search(line):
+                    self.verification_sections += 1
+
+            if "`" in line and FILE_REFERENCE.search(line):
+                self.file_references += 1
+
+            if AUTOMATED_VERIFICATION in line:
+                self.automated_verification.append(line)
+                context_left = VERIFICATION_CONTEXT_LINES
+            elif context_left:
+                self.automated_verification.append(line)
+                context_left -= 1
+
+        self.body = "\n".join(body_lines) if self.has_frontmatter else self.text
+
+    def has_line_key(self, key):
+        """Whether some line starts with ``key:``"""
+        return key in self.line_keys
+
+    def contains_section(self, section):
+        """Whether ``section`` appears in any line (grep -q, matched literally)"""
+        if "#" in section:
+            return any(section in line for line in self.heading_lines)
+        return section in self.text
+
+
+def _config_value(config, path, default):
+    """Look up a dotted path the way jq/yq's ``//`` operator does"""
+    value = config
+    for key in path.split("."):
+        value = value.get(key) if isinstance(value, dict) else None
+    return default if value is None or value is False else value
+
+
+class DocumentValidator:
+    """Applies the research and plan rules configured for a repository"""
+
+    def __init__(self, config):
+        self.config = config or {}
+        self.repo_name = _config_value(self.config, "repo_name", "unknown")
+        self.thoughts_directory = _config_value(self.config, "thoughts_directory", "thoughts/")
+        self.min_refs = int(_config_value(self.config, "validation.research_min_refs", 3))
+        self.plan_sections = list(_config_value(self.config, "validation.plan_required_sections", []))
+
+    def validate(self, kind, document):
+        """Validate ``document`` as a "research" or "plan" document"""
+        if not os.path.isfile(document):
+            label = "Research document" if kind == "research" else "Implementation plan"
+            return {"valid": False, "document": str(document), "kind": kind,
+                    "errors": [f"{label} not found: {document}"], "warnings": []}
+
+        index = DocumentIndex(document)
+        if kind == "research":
+            errors, warnings = self.research_errors(index), self.research_warnings(index)
+            statistics = {"repository": self.repo_name, "file_references": index.file_references,
+                          "word_count": index.words, "min_refs": self.min_refs}
+        else:
+            errors, warnings = self.plan_errors(index), []
+            statistics = {"phases": index.phases, "success_criteria": index.verification_sections,
+                          "word_count": index.words}
+
+        return {
+            "valid": not errors,
+            "document": str(document),
+            "kind": kind,
+            "errors": errors,
+            "warnings": warnings,
+            "statistics": statistics
+        }
+
+    def _frontmatter_errors(self, index, required_fields):
+        if not index.has_frontmatter:
+            return ["Missing YAML frontmatter"]
+        return [f"Missing required frontmatter field: {field}"
+                for field in required_fields if not index.has_line_key(field)]
+
+    def _section_errors(self, index, sections):
+        return [f"Missing required section: {section}"
+                for section in sections if not index.contains_section(section)]
+
+    def research_errors(self, index):
+        """Rules from validate-research.sh"""
+        errors = self._frontmatter_errors(index, ("date", "researcher"))
+        if index.has_frontmatter and not any(index.has_line_key(field)
+                                             for field in ("topic", "issue_title", "research_type")):
+            errors.append("Missing topic information (need one of: topic, issue_title, research_type)")
+
+        try:
+            in_thoughts = re.match(self.thoughts_directory, index.path) is not None
+        except re.error:
+            in_thoughts = index.path.startswith(self.thoughts_directory)
+        if not in_thoughts:
+            errors.append(f"Research document not in expected directory structure "
+                          f"(expected {self.thoughts_directory}*)")
+
+        errors.extend(self._section_errors(index, self.plan_sections or DEFAULT_RESEARCH_SECTIONS))
+
+        if index.file_references < self.min_refs:
+            errors.append(f"Insufficient file references ({index.file_references} found, "
+                          f"need {self.min_refs})")
+
+        errors.extend(f"Found placeholder text: {placeholder}"
+                      for placeholder in RESEARCH_PLACEHOLDERS if placeholder in index.body)
+        if any(placeholder in index.body for placeholder in RESEARCH_BRACKET_PLACEHOLDERS):
+            errors.append("Found bracket placeholder text")
+        return errors
+
+    def research_warnings(self, index):
+        """Repository-specific research recommendations (never fail validation)"""
+        return [warning for applies, required, warning in REPO_RESEARCH_RULES.get(self.repo_name, [])
+                if (applies is None or applies.search(index.text)) and not required.search(index.text)]
+
+    def plan_errors(self, index):
+        """Rules from validate-plan.sh"""
+        errors = self._frontmatter_errors(index, ("date", "researcher", "topic", "status"))
+        errors.extend(self._section_errors(index, self.plan_sections))
+
+        if not any("make " in line or "npm " in line or "test" in line
+                   for line in index.automated_verification):
+            errors.append("Automated verification section missing or invalid")
+        if not index.contains_section(MANUAL_VERIFICATION):
+            errors.append("Manual verification section missing")
+
+        errors.extend(f"Found unresolved question or TODO: {issue}"
+                      for issue in PLAN_OPEN_QUESTIONS if issue in index.body)
+
+        if not index.phases:
+            errors.append("No implementation phases found")
+        return errors
+
+
+def load_config(config_file=None, config_json=None, resolve=False):
+    """Load the repository config the shell validators would use.
+
+    ``config_file`` may be YAML or a resolved JSON artifact; without one the
+    repository's pipeline config or configs/default.yml is used. With
+    ``resolve`` the config is first resolved through its inheritance chain.
+    """
+    if config_json is not None:
+        return json.loads(config_json)
+
+    if config_file is None:
+        config_file = REPO_CONFIG_FILE if os.path.isfile(REPO_CONFIG_FILE) else DEFAULT_CONFIG_FILE
+
+    if resolve:
+        validate_config = load_script("validate-config")
+        validator = validate_config.ConfigValidator(SCRIPT_DIR.parent / "configs" / "schema.yml")
+        resolver = validate_config.ConfigResolver(validator, DEFAULT_CONFIG_FILE)
+        return resolver.resolve(config_file)[0]
+
+    with open(config_file, 'r') as f:
+        return yaml.safe_load(f) or {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate research documents and implementation plans")
+    parser.add_argument("kind", choices=["research", "plan"], help="Document type")
+    parser.add_argument("document", help="Path to the markdown document")
+    parser.add_argument("--config",
+                       help=f"Repository config, YAML or resolved JSON (default: {REPO_CONFIG_FILE} "
+                            "or configs/default.yml)")
+    parser.add_argument("--config-json", help="Repository config as a JSON string")
+    parser.add_argument("--resolve", action="store_true",
+                       help="Resolve the config through its inheritance chain first")
+    parser.add_argument("--output", choices=["text", "json"], default="text",
+                       help="Output format")
+
+    args = parser.parse_args()
+
+    validator = DocumentValidator(load_config(args.config, args.config_json, args.resolve))
+    result = validator.validate(args.kind, args.document)
+
+    if args.output == "json":
+        print(json.dumps(result, indent=2))
+    else:
+        title = "Research" if args.kind == "research" else "Plan"
+        if result["valid"]:
+            print(f"✅ {title} validation PASSED")
+        else:
+            print(f"❌ {title} validation FAILED")
+            print("\nErrors:")
+            for error in result["errors"]:
+                print(f"  • {error}")
+
+        if result["warnings"]:
+            print(f"\n⚠️  Warnings:")
+            for warning in result["warnings"]:
+                print(f"  • {warning}")
+
+        if "statistics" in result:
+            print(f"\n📊 Document statistics:")
+            for key, value in result["statistics"].items():
+                print(f"   - {key.replace('_', ' ').capitalize()}: {value}")
+
+    sys.exit(0 if result["valid"] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ CONFIG_FILE="${1:-.github/development-pipeline-config.yml}"
 BRANCH_NAME="${2}"
 
 load_config() {
+    # CONFIG_FILE may also be a resolved JSON config from validate-config.py --resolve
     if [ -f "$CONFIG_FILE" ]; then
         CONFIG_SOURCE="$CONFIG_FILE"
     else
@@ -25,6 +26,8 @@ load_config() {
     while IFS= read -r line; do
         TEST_COMMANDS+=("$line")
     done < <(yq eval '.validation.implementation_test_commands[]' "$CONFIG_SOURCE")
+    
+    BASE_BRANCH=$(yq eval '.base_branch' "$CONFIG_SOURCE")
 }
 
 validate_branch_exists() {
@@ -40,7 +43,7 @@ validate_branch_state() {
     git checkout "$BRANCH_NAME" >/dev/null 2>&1
     
     # Get base branch from config
-    local base_branch=$(yq eval '.base_branch' "$CONFIG_SOURCE")
+    local base_branch="$BASE_BRANCH"
     
     # Check if branch is ahead of base
     local commits_ahead=$(git rev-list --count HEAD ^"$base_branch" 2>/dev/null || echo "0")
@@ -69,7 +72,7 @@ validate_test_commands() {
 
 validate_no_merge_conflicts() {
     # Check if branch can merge cleanly with base
-    local base_branch=$(yq eval '.base_branch' "$CONFIG_SOURCE")
+    local base_branch="$BASE_BRANCH"
     
     if ! git merge-tree "$(git merge-base HEAD "$base_branch")" HEAD "$base_branch" >/dev/null 2>&1; then
         echo "❌ Branch has merge conflicts with $base_branch"
@@ -118,7 +121,7 @@ main() {
     echo ""
     echo "✅ Implementation validation PASSED"
     echo "📊 Implementation statistics:"
-    local base_branch=$(yq eval '.base_branch' "$CONFIG_SOURCE")
+    local base_branch="$BASE_BRANCH"
     echo "   - Commits: $(git rev-list --count HEAD ^"$base_branch" 2>/dev/null || echo "0")"
     echo "   - Files changed: $(git diff --name-only "$base_branch" 2>/dev/null | wc -l || echo "0")"
     echo "   - Test commands run: ${#TEST_COMMANDS[@]}"
@@ -0,0 +1,548 @@
+#!/usr/bin/env python3
+"""
+Benchmark Script
+Times the Python hot paths used by the development pipeline
+
+Inputs are generated deterministically (decision records from
+templates/decision-record-template.md, repo configs from configs/*.yml), so
+JSON results from two commits can be compared with --baseline.
+"""
+
+import argparse
+import copy
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import yaml
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = REPO_ROOT / "scripts"
+CONFIGS_DIR = REPO_ROOT / "configs"
+TEMPLATE_FILE = REPO_ROOT / "templates" / "decision-record-template.md"
+
+# The scripts import their shared helpers by name, so scripts/ must be importable
+sys.path.insert(0, str(SCRIPTS_DIR))
+from pipeline_common import load_script
+
+PLACEHOLDER = re.compile(r'\{(\w+)\}')
+TEMPLATE_PHASE = re.compile(r'^## (\w+) Phase$')
+
+# Budget for the summarize_budget operation (roughly 4k prompt tokens)
+BUDGET_BYTES = 16 * 1024
+
+# Result keys compared against a baseline (lower is better)
+METRIC_SUFFIXES = ("_us", "_ms", "_peak_kb")
+
+# Absolute increase (in the metric's unit) below which a change is treated as noise
+NOISE_FLOOR = 1.0
+
+
+def interpret_field(field_name, value, field_def):
+    """Reference schema walker (the pre-compilation implementation)"""
+    errors = []
+
+    expected_type = field_def["type"]
+    if expected_type == "string" and not isinstance(value, str):
+        errors.append(f"{field_name}: Expected string, got {type(value).__name__}")
+    elif expected_type == "integer" and not isinstance(value, int):
+        errors.append(f"{field_name}: Expected integer, got {type(value).__name__}")
+    elif expected_type == "boolean" and not isinstance(value, bool):
+        errors.append(f"{field_name}: Expected boolean, got {type(value).__name__}")
+    elif expected_type == "array" and not isinstance(value, list):
+        errors.append(f"{field_name}: Expected array, got {type(value).__name__}")
+    elif expected_type == "object" and not isinstance(value, dict):
+        errors.append(f"{field_name}: Expected object, got {type(value).__name__}")
+
+    if "pattern" in field_def and isinstance(value, str):
+        if not re.match(field_def["pattern"], value):
+            errors.append(f"{field_name}: Value '{value}' doesn't match pattern '{field_def['pattern']}'")
+
+    if isinstance(value, int):
+        if "minimum" in field_def and value < field_def["minimum"]:
+            errors.append(f"{field_name}: Value {value} below minimum {field_def['minimum']}")
+        if "maximum" in field_def and value > field_def["maximum"]:
+            errors.append(f"{field_name}: Value {value} above maximum {field_def['maximum']}")
+
+    if "allowed_values" in field_def and value not in field_def["allowed_values"]:
+        errors.append(f"{field_name}: Value '{value}' not in allowed values {field_def['allowed_values']}")
+
+    if expected_type == "object" and "properties" in field_def:
+        for prop_name, prop_value in value.items():
+            if prop_name in field_def["properties"]:
+                errors.extend(interpret_field(
+                    f"{field_name}.{prop_name}",
+                    prop_value,
+                    field_def["properties"][prop_name]
+                ))
+
+    return errors
+
+
+def interpret_config(schema, config):
+    """Validate a parsed config with the reference walker"""
+    field_definitions = schema["field_definitions"]
+    errors = []
+    for field, value in config.items():
+        if field in field_definitions:
+            errors.extend(interpret_field(field, value, field_definitions[field]))
+    return errors
+
+
+def time_call(func, iterations):
+    """Return the best-of-three wall time per call, in microseconds"""
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / iterations * 1e6
+
+
+def time_op(func, setup, repeats):
+    """Return the best wall time of ``func(setup())`` in milliseconds; setup isn't timed"""
+    best = None
+    for _ in range(repeats):
+        state = setup()
+        start = time.perf_counter()
+        func(state)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+def peak_memory_kb(func, setup):
+    """Return the peak traced allocation of one ``func(setup())`` call, in KiB"""
+    state = setup()
+    tracemalloc.start()
+    try:
+        func(state)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def fill_placeholders(text, seed):
+    """Replace template placeholders with deterministic values"""
+    return PLACEHOLDER.sub(lambda m: f"{m.group(1).replace('_', ' ')} {seed}", text)
+
+
+def generate_decision_record(lines, phases, complete_ratio=0.5):
+    """Build a decision record of about ``lines`` lines with ``phases`` phase sections.
+
+    Phase sections are cycled from the template and padded out with findings;
+    the first ``complete_ratio`` of them are marked complete. Records never
+    get shorter than the filled-in template skeleton.
+    """
+    template = TEMPLATE_FILE.read_text()
+    template, trailer = template.split("\n## Lessons Learned", 1)
+    blocks = [block.strip("\n") for block in template.split("\n---\n")]
+    header = fill_placeholders(blocks[0], 0)
+    trailer = fill_placeholders("## Lessons Learned" + trailer.rstrip("\n"), 0)
+    phase_blocks = [block for block in blocks[1:] if TEMPLATE_PHASE.match(block.split("\n", 1)[0])]
+
+    sections = []
+    completed = int(phases * complete_ratio)
+    for i in range(phases):
+        title, body = phase_blocks[i % len(phase_blocks)].split("\n", 1)
+        name = TEMPLATE_PHASE.match(title).group(1)
+        cycle = i // len(phase_blocks)
+        title = f"## {name}{cycle + 1 if cycle else ''} Phase"
+        if i < completed:
+            title += " (Complete ✅)"
+        sections.append(f"{title}\n{fill_placeholders(body, i)}")
+
+    def render():
+        return "\n\n---\n\n".join([header] + sections + [trailer]) + "\n"
+
+    padding = max(0, lines - render().count("\n"))
+    for i in range(phases):
+        count = padding // phases + (1 if i < padding % phases else 0)
+        sections[i] += "".join(f"\n- Finding {j}: observed behaviour in `src/module_{j % 97}.py:{j}`"
+                               for j in range(count))
+    return render()
+
+
+def generate_research_document(lines):
+    """Build a research document of about ``lines`` lines that passes validation"""
+    sections = ["## Research Question", "## Summary", "## Detailed Findings",
+                "## Code References", "## Architecture Insights"]
+    out = ["---", "date: 2025-08-17T14:30:00-05:00", "researcher: benchmark",
+           'topic: "Generated research"', "status: complete", "---", "", "# Research: Generated", ""]
+    per_section = max(1, (lines - len(out)) // len(sections) - 2)
+    for number, section in enumerate(sections):
+        out += [section, ""]
+        out += [f"- Finding {number}.{j} in `src/module_{j % 97}.py:{j}` affects request handling"
+                for j in range(per_section)]
+    return "\n".join(out) + "\n"
+
+
+def generate_configs(directory, count):
+    """Write ``count`` repo configs derived from configs/*.yml; return their paths"""
+    bases = []
+    for config_file in sorted(CONFIGS_DIR.glob("*.yml")):
+        if config_file.name != "schema.yml":
+            with open(config_file, 'r') as f:
+                bases.append(yaml.safe_load(f))
+
+    paths = []
+    for i in range(count):
+        config = copy.deepcopy(bases[i % len(bases)])
+        config["repo_name"] = f"{config.get('repo_name', 'repo')}-{i}"
+        path = Path(directory) / f"config-{i}.yml"
+        with open(path, 'w') as f:
+            yaml.safe_dump(config, f, sort_keys=False)
+        paths.append(path)
+    return paths
+
+
+def bench_config_validation(args):
+    """Compare the compiled schema validators with the reference walker"""
+    validate_config = load_script("validate-config")
+    validator = validate_config.ConfigValidator(CONFIGS_DIR / "schema.yml")
+
+    configs = []
+    for config_file in sorted(CONFIGS_DIR.glob("*.yml")):
+        if config_file.name == "schema.yml":
+            continue
+        with open(config_file, 'r') as f:
+            configs.append(yaml.safe_load(f))
+
+    def run_interpreted():
+        for config in configs:
+            interpret_config(validator.schema, config)
+
+    def run_compiled():
+        for config in configs:
+            validator.compiled_schema.validate(config)
+
+    interpreted_us = time_call(run_interpreted, args.iterations)
+    compiled_us = time_call(run_compiled, args.iterations)
+
+    return [{
+        "name": "config_validation",
+        "configs": len(configs),
+        "iterations": args.iterations,
+        "interpreted_us": round(interpreted_us, 2),
+        "compiled_us": round(compiled_us, 2),
+        "speedup": round(interpreted_us / compiled_us, 2),
+    }]
+
+
+def bench_config_files(args):
+    """Time validate_config and generate_config_report over generated config files"""
+    validate_config = load_script("validate-config")
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config_files = generate_configs(tmp, args.configs)
+        validator = validate_config.ConfigValidator(CONFIGS_DIR / "schema.yml")
+        cached_validator = validate_config.ConfigValidator(
+            CONFIGS_DIR / "schema.yml", cache=validate_config.ResultCache(Path(tmp) / "cache"))
+
+        def validate_all(validator):
+            for config_file in config_files:
+                validator.validate_config(config_file)
+
+        def report_all(validator):
+            for config_file in config_files:
+                validator.generate_config_report(config_file)
+
+        validate_all(cached_validator)
+        fresh = lambda: validator
+        warm = lambda: cached_validator
+        results.append({
+            "name": "config_files",
+            "configs": len(config_files),
+            "validate_ms": round(time_op(validate_all, fresh, args.repeats), 3),
+            "validate_cached_ms": round(time_op(validate_all, warm, args.repeats), 3),
+            "report_ms": round(time_op(report_all, fresh, args.repeats), 3),
+            "validate_peak_kb": round(peak_memory_kb(validate_all, fresh), 1),
+            "report_peak_kb": round(peak_memory_kb(report_all, fresh), 1),
+        })
+    return results
+
+
+def bench_decision_record(args):
+    """Time the decision record operations on generated records of each size"""
+    manage = load_script("manage-decision-record")
+    results = []
+
+    for lines in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            pristine = Path(tmp) / "pristine.md"
+            pristine.write_text(generate_decision_record(lines, args.phases))
+            record = Path(tmp) / "record.md"
+            archive = Path(tmp) / "record-archive"
+
+            def fresh():
+                """A manager over an unmodified record with no archive or backups"""
+                shutil.rmtree(archive, ignore_errors=True)
+                shutil.copyfile(pristine, record)
+                return manage.DecisionRecordManager(record)
+
+            def backed_up():
+                """A manager whose record was backed up and then overwritten"""
+                manager = fresh()
+                manager.create_backup()
+                record.write_text("# overwritten\n")
+                return manager
+
+            def budgeted():
+                """A fresh manager that summarizes to BUDGET_BYTES"""
+                manager = fresh()
+                manager.budget_bytes = BUDGET_BYTES
+                return manager
+
+            def indexed():
+                """A fresh manager whose section index is already built"""
+                manager = fresh()
+                manager.section_index()
+                return manager
+
+            operations = {
+                "analyze": (lambda manager: manager.analyze_size(), fresh),
+                "compress": (lambda manager: manager.compress_completed_phases(), fresh),
+                "summarize": (lambda manager: manager.summarize_record(), fresh),
+                "summarize_budget": (lambda manager: manager.summarize_record(), budgeted),
+                "restore": (lambda manager: manager.restore_from_backup(), backed_up),
+                "section_index": (lambda manager: manager.section_index(), fresh),
+                "get_section": (lambda manager: manager.get_section("Current Status"), indexed),
+            }
+
+            result = {"name": "decision_record", "lines": fresh().analyze_size()["lines"],
+                      "phases": args.phases, "bytes": pristine.stat().st_size}
+            for operation, (func, setup) in operations.items():
+                result[f"{operation}_ms"] = round(time_op(func, setup, args.repeats), 3)
+                result[f"{operation}_peak_kb"] = round(peak_memory_kb(func, setup), 1)
+            results.append(result)
+    return results
+
+
+def bench_document_validation(args):
+    """Compare the single-pass document engine with validate-research.sh"""
+    validate_document = load_script("validate-document")
+    results = []
+
+    for lines in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            document = Path(tmp) / "research.md"
+            document.write_text(generate_research_document(lines))
+            config = {"thoughts_directory": f"{tmp}/", "validation": {"research_min_refs": 3}}
+            validator = validate_document.DocumentValidator(config)
+
+            def run_engine(_):
+                assert validator.validate("research", document)["valid"]
+
+            def run_shell(_):
+                subprocess.run([str(SCRIPTS_DIR / "validate-research.sh"), json.dumps(config), str(document)],
+                               check=True, capture_output=True)
+
+            def run_engine_cli(_):
+                subprocess.run([sys.executable, str(SCRIPTS_DIR / "validate-document.py"), "research",
+                                str(document), "--config-json", json.dumps(config)],
+                               check=True, capture_output=True)
+
+            engine_ms = time_op(run_engine, lambda: None, args.repeats)
+            shell_ms = time_op(run_shell, lambda: None, args.repeats)
+            results.append({
+                "name": "document_validation",
+                "lines": lines,
+                "bytes": document.stat().st_size,
+                "engine_ms": round(engine_ms, 3),
+                "engine_cli_ms": round(time_op(run_engine_cli, lambda: None, args.repeats), 3),
+                "shell_ms": round(shell_ms, 3),
+                "speedup": round(shell_ms / engine_ms, 2),
+                "engine_peak_kb": round(peak_memory_kb(run_engine, lambda: None), 1),
+            })
+    return results
+
+
+def bench_daemon_latency(args):
+    """Compare cold CLI calls with the same calls answered by a warm pipeline daemon"""
+    pipeline_daemon = load_script("pipeline-daemon")
+    config_file = str(CONFIGS_DIR / "platform-api.yml")
+    schema = str(CONFIGS_DIR / "schema.yml")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        record = Path(tmp) / "record.md"
+        record.write_text(generate_decision_record(1000, args.phases))
+        socket_path = Path(tmp) / "daemon.sock"
+        env = dict(os.environ, ATRIUMN_DAEMON_SOCKET=str(socket_path), ATRIUMN_CACHE_DIR=tmp)
+        commands = {
+            "validate": [str(SCRIPTS_DIR / "validate-config.py"), config_file, "--no-cache"],
+            "analyze": [str(SCRIPTS_DIR / "manage-decision-record.py"), str(record)],
+        }
+
+        def cli(command):
+            return lambda _: subprocess.run([sys.executable] + command, env=env, check=True,
+                                            capture_output=True)
+
+        result = {"name": "daemon_latency"}
+        for op, command in commands.items():
+            result[f"{op}_cold_cli_ms"] = round(time_op(cli(command + ["--no-daemon"]), lambda: None,
+                                                        args.repeats), 3)
+
+        daemon = subprocess.Popen([sys.executable, str(SCRIPTS_DIR / "pipeline-daemon.py"),
+                                   "--socket", str(socket_path)], env=env, stdout=subprocess.DEVNULL)
+        try:
+            deadline = time.monotonic() + 10
+            while pipeline_daemon.request("ping", socket_path) is None:
+                if time.monotonic() > deadline:
+                    raise RuntimeError("pipeline daemon did not start")
+                time.sleep(0.05)
+
+            requests = {
+                "validate": lambda _: pipeline_daemon.request(
+                    "validate", socket_path, config_file=config_file, schema=schema, no_cache=True),
+                "analyze": lambda _: pipeline_daemon.request("analyze", socket_path,
+                                                             decision_file=str(record)),
+            }
+            for op, command in commands.items():
+                result[f"{op}_warm_cli_ms"] = round(time_op(cli(command), lambda: None, args.repeats), 3)
+                result[f"{op}_daemon_request_ms"] = round(time_op(requests[op], lambda: None,
+                                                                  args.repeats), 3)
+        finally:
+            daemon.terminate()
+            daemon.wait()
+    return [result]
+
+
+def import_time_ms(command, env):
+    """Total time spent importing modules in one run of ``command``, from ``-X importtime``"""
+    completed = subprocess.run([sys.executable, "-X", "importtime"] + command, env=env,
+                               capture_output=True, text=True)
+    total_us = 0
+    for line in completed.stderr.splitlines():
+        if line.startswith("import time:"):
+            self_us = line.split(":", 1)[1].split("|")[0].strip()
+            if self_us.isdigit():
+                total_us += int(self_us)
+    return total_us / 1000
+
+
+def bench_startup(args):
+    """Time short CLI runs end to end, where interpreter start-up and imports dominate"""
+    config_file = str(CONFIGS_DIR / "platform-api.yml")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        record = Path(tmp) / "record.md"
+        record.write_text(generate_decision_record(1000, args.phases))
+        env = dict(os.environ, ATRIUMN_CACHE_DIR=tmp,
+                   ATRIUMN_DAEMON_SOCKET=str(Path(tmp) / "no-daemon.sock"))
+        commands = {
+            "interpreter": ["-c", "pass"],
+            "validate_cached": [str(SCRIPTS_DIR / "validate-config.py"), config_file],
+            "validate_no_cache": [str(SCRIPTS_DIR / "validate-config.py"), config_file, "--no-cache"],
+            "analyze": [str(SCRIPTS_DIR / "manage-decision-record.py"), str(record)],
+            "get_section": [str(SCRIPTS_DIR / "manage-decision-record.py"), str(record),
+                            "--get-section", "Current Status"],
+        }
+
+        result = {"name": "startup"}
+        for op, command in commands.items():
+            # One untimed run fills the result, schema and section caches
+            subprocess.run([sys.executable] + command, env=env, check=True, capture_output=True)
+            result[f"{op}_cli_ms"] = round(time_op(
+                lambda _: subprocess.run([sys.executable] + command, env=env, check=True, capture_output=True),
+                lambda: None, args.repeats), 3)
+            result[f"{op}_import_ms"] = round(import_time_ms(command, env), 3)
+    return [result]
+
+
+BENCHMARKS = {
+    "config_files": bench_config_files,
+    "config_validation": bench_config_validation,
+    "daemon_latency": bench_daemon_latency,
+    "decision_record": bench_decision_record,
+    "document_validation": bench_document_validation,
+    "startup": bench_startup,
+}
+
+
+def result_id(result):
+    """Identify a result across runs by its name and input parameters"""
+    params = {key: value for key, value in result.items()
+              if key != "name" and not key.endswith(METRIC_SUFFIXES) and key != "speedup"}
+    return f"{result['name']}{json.dumps(params, sort_keys=True)}"
+
+
+def compare_results(results, baseline, threshold):
+    """Return metrics that got slower or bigger than ``threshold`` x the baseline"""
+    previous = {result_id(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        old = previous.get(result_id(result))
+        if old is None:
+            continue
+        for key, value in result.items():
+            if (key.endswith(METRIC_SUFFIXES) and old.get(key)
+                    and value > old[key] * threshold and value - old[key] > NOISE_FLOOR):
+                regressions.append({"benchmark": result_id(result), "metric": key,
+                                    "baseline": old[key], "current": value,
+                                    "ratio": round(value / old[key], 2)})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pipeline hot paths")
+    parser.add_argument("--only", choices=sorted(BENCHMARKS), action="append",
+                       help="Run only the named benchmark (repeatable)")
+    parser.add_argument("--iterations", type=int, default=2000,
+                       help="Iterations per timing sample")
+    parser.add_argument("--repeats", type=int, default=3,
+                       help="Timed runs per file operation (the best is reported)")
+    parser.add_argument("--sizes", type=lambda value: [int(n) for n in value.split(",")],
+                       default=[100, 1000, 10000, 100000],
+                       help="Comma-separated decision record sizes in lines")
+    parser.add_argument("--phases", type=int, default=4,
+                       help="Phase sections per generated decision record")
+    parser.add_argument("--configs", type=int, default=200,
+                       help="Number of generated config files")
+    parser.add_argument("--output", choices=["text", "json"], default="text",
+                       help="Output format")
+    parser.add_argument("--baseline",
+                       help="JSON results from an earlier run to check for regressions")
+    parser.add_argument("--threshold", type=float, default=1.5,
+                       help="Slowdown ratio against --baseline that counts as a regression")
+
+    args = parser.parse_args()
+
+    results = []
+    for name in (args.only or sorted(BENCHMARKS)):
+        results.extend(BENCHMARKS[name](args))
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            regressions = compare_results(results, json.load(f), args.threshold)
+
+    if args.output == "json":
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            print(f"📊 {result['name']}")
+            for key, value in result.items():
+                if key != "name":
+                    print(f"  {key}: {value}")
+
+    for regression in regressions:
+        print(f"⚠️  {regression['benchmark']} {regression['metric']}: "
+              f"{regression['baseline']} → {regression['current']} ({regression['ratio']}x)",
+              file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the GitHub users API, for testing identity checks offline
+
+Answers GET /users/<name> with 200 for the given users and 404 otherwise.
+With --rate-limit, the first request for each user gets a 429 with
+Retry-After (in seconds, or as an HTTP date with --retry-after-date),
+exercising backoff. Every request is appended to --log.
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like api.github.com
+
+    def do_GET(self):
+        server = self.server
+        name = self.path.rsplit("/", 1)[-1].lower()
+        with server.lock:
+            seen = name in server.seen
+            server.seen.add(name)
+            if server.log:
+                with open(server.log, 'a') as f:
+                    f.write(f"{self.path}\n")
+
+        if server.rate_limit and not seen:
+            retry_after = formatdate(time.time() + 1, usegmt=True) if server.retry_after_date else "0.2"
+            self._reply(429, {"message": "rate limited"}, {"Retry-After": retry_after})
+        elif self.path.startswith("/users/") and name in server.users:
+            self._reply(200, {"login": name})
+        else:
+            self._reply(404, {"message": "Not Found"})
+
+    def _reply(self, status, body, headers=None):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a fake GitHub users API")
+    parser.add_argument("users", nargs="*", help="Usernames that exist")
+    parser.add_argument("--port", type=int, default=0, help="Port (default: any free port)")
+    parser.add_argument("--rate-limit", action="store_true",
+                       help="Answer the first request for each user with 429")
+    parser.add_argument("--retry-after-date", action="store_true",
+                       help="Send Retry-After as an HTTP date instead of seconds")
+    parser.add_argument("--log", help="Append each request path to this file")
+
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), StubHandler)
+    server.daemon_threads = True
+    server.users = {user.lstrip("@").lower() for user in args.users}
+    server.rate_limit = args.rate_limit
+    server.retry_after_date = args.retry_after_date
+    server.log = args.log
+    server.seen = set()
+    server.lock = threading.Lock()
+
+    print(f"http://127.0.0.1:{server.server_address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Decision Record Stress Test
+Runs many concurrent manage-decision-record.py processes against one record
+and checks that locking and atomic writes keep the record and its backups intact
+"""
+
+import argparse
+import hashlib
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+MANAGER = REPO_ROOT / "scripts" / "manage-decision-record.py"
+
+# The scripts import their shared helpers by name, so scripts/ must be importable
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+from pipeline_common import load_script
+
+# Mix of writers and readers; compress is idempotent, so any interleaving
+# must end in the same record a single serial compress produces
+ACTIONS = [
+    ["--action", "compress"],
+    ["--action", "compress", "--incremental"],
+    ["--action", "analyze"],
+    ["--action", "backups"],
+]
+
+
+def run_stress(record, workers, rounds):
+    """Hammer a copy of ``record`` with concurrent processes; return a list of problems"""
+    problems = []
+    manager_module = load_script("manage-decision-record")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+
+        expected_file = tmp / "serial" / record.name
+        expected_file.parent.mkdir()
+        shutil.copy(record, expected_file)
+        subprocess.run([sys.executable, str(MANAGER), str(expected_file), "--action", "compress"],
+                       check=True, capture_output=True)
+        expected = expected_file.read_bytes()
+
+        work = tmp / "concurrent" / record.name
+        work.parent.mkdir()
+        shutil.copy(record, work)
+
+        for round_number in range(rounds):
+            processes = [
+                subprocess.Popen([sys.executable, str(MANAGER), str(work)] + ACTIONS[i % len(ACTIONS)],
+                                 stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                for i in range(workers)
+            ]
+            for process in processes:
+                _, stderr = process.communicate()
+                if process.returncode != 0:
+                    problems.append(f"round {round_number}: process exited {process.returncode}: "
+                                    f"{stderr.decode(errors='replace').strip()}")
+            # Start the next round from the original record again
+            if round_number < rounds - 1:
+                if work.read_bytes() != expected:
+                    problems.append(f"round {round_number}: record differs from serial compress result")
+                shutil.copy(record, work)
+
+        if work.read_bytes() != expected:
+            problems.append("final record differs from serial compress result")
+
+        manager = manager_module.DecisionRecordManager(work)
+        manifest = manager.backups._load_manifest()
+        ids = [snap["id"] for snap in manifest["snapshots"]]
+        if len(ids) != len(set(ids)):
+            problems.append(f"duplicate snapshot ids in manifest: {sorted(ids)}")
+        for snap in manifest["snapshots"]:
+            restored = tmp / f"restored-{snap['id']}"
+            manager.backups.restore(snap, restored)
+            if hashlib.sha256(restored.read_bytes()).hexdigest() != snap["sha256"]:
+                problems.append(f"snapshot {snap['id']} does not restore to its recorded content")
+
+        leftovers = [str(path.relative_to(work.parent)) for path in work.parent.rglob("*.tmp")]
+        if leftovers:
+            problems.append(f"temporary files left behind: {leftovers}")
+
+        return problems, len(ids)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stress test concurrent decision record updates")
+    parser.add_argument("decision_file", help="Decision record to copy and stress")
+    parser.add_argument("--workers", type=int, default=16,
+                       help="Concurrent processes per round")
+    parser.add_argument("--rounds", type=int, default=3,
+                       help="Number of rounds")
+    parser.add_argument("--output", choices=["text", "json"], default="text",
+                       help="Output format")
+
+    args = parser.parse_args()
+
+    problems, snapshots = run_stress(Path(args.decision_file), args.workers, args.rounds)
+
+    if args.output == "json":
+        print(json.dumps({"valid": not problems, "workers": args.workers, "rounds": args.rounds,
+                          "snapshots": snapshots, "problems": problems}, indent=2))
+    elif problems:
+        print("❌ Decision record stress test FAILED")
+        for problem in problems:
+            print(f"  - {problem}")
+    else:
+        print(f"✅ Decision record stress test PASSED "
+              f"({args.workers} processes x {args.rounds} rounds, {snapshots} snapshots)")
+
+    sys.exit(0 if not problems else 1)
+
+
+if __name__ == "__main__":
+    main()
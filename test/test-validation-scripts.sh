@@ -7,6 +7,9 @@ SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 TEST_DATA_DIR="$SCRIPT_DIR/test-data"
 SCRIPTS_DIR="$SCRIPT_DIR/../scripts"
 
+# Keep cached artifacts from the Python validators inside the test data
+export ATRIUMN_CACHE_DIR="$TEST_DATA_DIR/cache"
+
 # Colors for output
 RED='\033[0;31m'
 GREEN='\033[0;32m'
@@ -237,6 +240,64 @@ This plan is missing required sections.
 
 ## Overview
 Some overview text.
+EOF
+
+    # Create valid repository configuration
+    cat > "$TEST_DATA_DIR/valid-config.yml" << 'EOF'
+repo_name: "test-repo"
+base_branch: "main"
+thoughts_directory: "thoughts/"
+
+validation:
+  research_min_refs: 3
+
+notifications:
+  slack_channel: "#dev-team"
+  escalation_hours: 2
+
+team:
+  default_reviewers: ["@test-user"]
+  tech_lead: "@test-lead"
+EOF
+
+    # Create invalid repository configuration (type, pattern and range errors)
+    cat > "$TEST_DATA_DIR/invalid-config.yml" << 'EOF'
+repo_name: 42
+base_branch: "trunk"
+thoughts_directory: "thoughts"
+
+notifications:
+  slack_channel: "dev-team"
+  escalation_hours: 48
+
+team: ["@not-an-object"]
+EOF
+
+    # Create decision record with completed and active phases
+    mkdir -p "$TEST_DATA_DIR/decisions"
+    cat > "$TEST_DATA_DIR/decisions/pipeline-issue-1.md" << 'EOF'
+# Pipeline Decision Record - Issue #1: Test Issue
+
+## Issue Context
+- **Issue**: #1
+- **Title**: Test Issue
+
+## Research Phase (Complete ✅)
+- **Status**: Validation passed
+- **Document**: `thoughts/shared/research/issue-1.md`
+- **Validated**: 2025-08-17T14:30:00-05:00
+- **Next Phase**: Planning
+
+### Key Findings
+- Finding one
+- Finding two
+
+## Planning Phase (Starting)
+- **Status**: Awaiting implementation plan
+
+## Pipeline Progress
+- [✅] Research Phase
+- [❌] Planning Phase
 EOF
 
     echo -e "${GREEN}✅ Test data setup complete${NC}"
@@ -312,6 +373,765 @@ test_plan_validation() {
     fi
 }
 
+test_document_validation() {
+    echo
+    echo -e "${BLUE}Testing Document Validation Engine${NC}"
+    echo "==================================="
+    
+    local engine="$SCRIPTS_DIR/validate-document.py"
+    local config="{\"thoughts_directory\": \"$TEST_DATA_DIR/\", \"validation\": {\"research_min_refs\": 3, \"plan_required_sections\": []}}"
+    
+    # Test 1: Valid research document passes with research sections
+    if python3 "$engine" research "$TEST_DATA_DIR/valid-research.md" --config-json "$config" >/dev/null 2>&1; then
+        print_test_result "Engine: valid research document" "PASS"
+    else
+        print_test_result "Engine: valid research document" "FAIL" "Valid research failed validation"
+    fi
+    
+    # Test 2: Invalid research documents fail
+    local doc failed=""
+    for doc in invalid-research-missing-sections.md invalid-research-no-frontmatter.md invalid-research-no-refs.md non-existent.md; do
+        if python3 "$engine" research "$TEST_DATA_DIR/$doc" --config-json "$config" >/dev/null 2>&1; then
+            failed="$failed $doc"
+        fi
+    done
+    if [ -z "$failed" ]; then
+        print_test_result "Engine: invalid research documents" "PASS"
+    else
+        print_test_result "Engine: invalid research documents" "FAIL" "Passed validation:$failed"
+    fi
+    
+    # Test 3: Engine agrees with validate-research.sh on every research fixture
+    local mismatches="" shell_rc engine_rc
+    for doc in valid-research.md invalid-research-missing-sections.md invalid-research-no-frontmatter.md invalid-research-no-refs.md; do
+        shell_rc=0
+        engine_rc=0
+        "$SCRIPTS_DIR/validate-research.sh" "$config" "$TEST_DATA_DIR/$doc" >/dev/null 2>&1 || shell_rc=$?
+        python3 "$engine" research "$TEST_DATA_DIR/$doc" --config-json "$config" >/dev/null 2>&1 || engine_rc=$?
+        [ "$shell_rc" -eq "$engine_rc" ] || mismatches="$mismatches $doc"
+    done
+    if [ -z "$mismatches" ]; then
+        print_test_result "Engine matches shell research validation" "PASS"
+    else
+        print_test_result "Engine matches shell research validation" "FAIL" "Different result for:$mismatches"
+    fi
+    
+    # Test 4: Plans are checked against the configured plan sections
+    if python3 "$engine" plan "$TEST_DATA_DIR/valid-plan.md" --config "$SCRIPTS_DIR/../configs/default.yml" >/dev/null 2>&1 \
+        && ! python3 "$engine" plan "$TEST_DATA_DIR/invalid-plan-missing-sections.md" --config "$SCRIPTS_DIR/../configs/default.yml" >/dev/null 2>&1; then
+        print_test_result "Engine: plan validation" "PASS"
+    else
+        print_test_result "Engine: plan validation" "FAIL" "Unexpected plan validation result"
+    fi
+}
+
+# Test configuration validation script
+test_config_validation() {
+    echo
+    echo -e "${BLUE}Testing Configuration Validation Script${NC}"
+    echo "========================================="
+    
+    local validator="$SCRIPTS_DIR/validate-config.py"
+    local output
+    
+    # Test 1: Valid configuration should pass
+    if python3 "$validator" "$TEST_DATA_DIR/valid-config.yml" >/dev/null 2>&1; then
+        print_test_result "Valid configuration" "PASS"
+    else
+        print_test_result "Valid configuration" "FAIL" "Valid configuration failed validation"
+    fi
+    
+    # Test 2: Invalid configuration should fail
+    if ! python3 "$validator" "$TEST_DATA_DIR/invalid-config.yml" >/dev/null 2>&1; then
+        print_test_result "Invalid configuration" "PASS"
+    else
+        print_test_result "Invalid configuration" "FAIL" "Invalid configuration passed validation"
+    fi
+    
+    # Test 3: Every schema constraint is reported
+    output=$(python3 "$validator" "$TEST_DATA_DIR/invalid-config.yml" 2>&1 || true)
+    local expected_errors=(
+        "repo_name: Expected string, got int"
+        "base_branch: Value 'trunk' not in allowed values"
+        "thoughts_directory: Value 'thoughts' doesn't match pattern"
+        "notifications.slack_channel: Value 'dev-team' doesn't match pattern"
+        "notifications.escalation_hours: Value 48 above maximum 24"
+        "team: Expected object, got list"
+    )
+    local missing=""
+    for expected in "${expected_errors[@]}"; do
+        if ! echo "$output" | grep -qF "$expected"; then
+            missing="$expected"
+            break
+        fi
+    done
+    if [ -z "$missing" ]; then
+        print_test_result "Schema constraint errors reported" "PASS"
+    else
+        print_test_result "Schema constraint errors reported" "FAIL" "Missing error: $missing"
+    fi
+    
+    # Test 4: Bundled configurations should pass
+    local config
+    for config in default.yml curatefor.me.yml platform-api.yml; do
+        if python3 "$validator" "$SCRIPT_DIR/../configs/$config" >/dev/null 2>&1; then
+            print_test_result "Bundled configuration: $config" "PASS"
+        else
+            print_test_result "Bundled configuration: $config" "FAIL" "Bundled configuration failed validation"
+        fi
+    done
+    
+    # Test 5: Batch mode aggregates results and fails if any config fails
+    output=$(python3 "$validator" --batch --jobs 2 --output json "$TEST_DATA_DIR" 2>/dev/null || true)
+    if echo "$output" | python3 -c 'import json, sys; r = json.load(sys.stdin); sys.exit(0 if (r["total"], r["passed"], r["valid"]) == (2, 1, False) else 1)'; then
+        print_test_result "Batch validation of config directory" "PASS"
+    else
+        print_test_result "Batch validation of config directory" "FAIL" "Unexpected batch summary"
+    fi
+    
+    # Test 6: Batch mode skips the schema file itself
+    if python3 "$validator" --batch "$SCRIPT_DIR/../configs" >/dev/null 2>&1; then
+        print_test_result "Batch validation of bundled configs" "PASS"
+    else
+        print_test_result "Batch validation of bundled configs" "FAIL" "Bundled configs failed batch validation"
+    fi
+    
+    # Test 7: Resolved config inherits nested defaults from schema and default.yml
+    local cache_dir="$TEST_DATA_DIR/cache"
+    python3 "$validator" "$TEST_DATA_DIR/valid-config.yml" --resolve --cache-dir "$cache_dir" \
+        --resolved-output "$TEST_DATA_DIR/resolved.json" >/dev/null 2>&1 || true
+    if [ -f "$TEST_DATA_DIR/resolved.json" ] && python3 -c '
+import json, sys
+c = json.load(open(sys.argv[1]))
+assert c["repo_name"] == "test-repo"
+assert c["validation"]["research_min_refs"] == 3
+assert c["validation"]["implementation_test_commands"] == ["make test"]
+assert c["workflow_customization"]["phase_timeouts"]["implementation_hours"] == 24
+assert c["branches"]["prefix"] == "feature/"
+assert c["notifications"]["slack_channel"] == "#dev-team"
+' "$TEST_DATA_DIR/resolved.json" 2>/dev/null; then
+        print_test_result "Resolved config inheritance" "PASS"
+    else
+        print_test_result "Resolved config inheritance" "FAIL" "Resolved config is missing inherited values"
+    fi
+    
+    # Test 8: Resolved configs are cached by input content hashes
+    if [ "$(find "$cache_dir/resolved" -name '*.json' 2>/dev/null | wc -l)" -eq 1 ]; then
+        print_test_result "Resolved config cache artifact" "PASS"
+    else
+        print_test_result "Resolved config cache artifact" "FAIL" "Expected one cached resolved config"
+    fi
+    
+    # Test 9: Unchanged configs are served from the result cache
+    python3 "$validator" "$TEST_DATA_DIR/valid-config.yml" >/dev/null 2>&1 || true
+    if python3 "$validator" "$TEST_DATA_DIR/valid-config.yml" 2>&1 | grep -q "PASSED (cached)"; then
+        print_test_result "Validation result cache hit" "PASS"
+    else
+        print_test_result "Validation result cache hit" "FAIL" "Second run was not served from cache"
+    fi
+    
+    # Test 10: --no-cache always revalidates
+    if python3 "$validator" "$TEST_DATA_DIR/valid-config.yml" --no-cache 2>&1 | grep -q "PASSED (cached)"; then
+        print_test_result "Validation --no-cache" "FAIL" "--no-cache returned a cached result"
+    else
+        print_test_result "Validation --no-cache" "PASS"
+    fi
+    
+    # Test 11: Watch mode revalidates a config when it changes
+    local watch_dir="$TEST_DATA_DIR/watch-configs"
+    mkdir -p "$watch_dir"
+    cp "$TEST_DATA_DIR/valid-config.yml" "$watch_dir/watched.yml"
+    python3 "$validator" "$watch_dir" --watch --no-cache --debounce 0.1 > "$watch_dir/watch.log" 2>&1 &
+    local watch_pid=$!
+    sleep 1
+    sed 's/base_branch: "main"/base_branch: "trunk"/' "$TEST_DATA_DIR/valid-config.yml" > "$watch_dir/watched.yml"
+    sleep 1.5
+    kill "$watch_pid" 2>/dev/null || true
+    wait "$watch_pid" 2>/dev/null || true
+    if grep -q "✅ $watch_dir/watched.yml" "$watch_dir/watch.log" \
+        && grep -q "❌ $watch_dir/watched.yml" "$watch_dir/watch.log"; then
+        print_test_result "Config watch mode" "PASS"
+    else
+        print_test_result "Config watch mode" "FAIL" "Change was not revalidated"
+    fi
+    
+    # Test 12: --timings and --prometheus-textfile report per-stage timings
+    python3 "$validator" "$TEST_DATA_DIR/valid-config.yml" --no-cache --no-daemon \
+        --timings "$TEST_DATA_DIR/timings.json" --prometheus-textfile "$TEST_DATA_DIR/timings.prom" >/dev/null 2>&1 || true
+    if python3 -c 'import json, sys; r = json.load(open(sys.argv[1])); sys.exit(0 if {"load_schema", "parse_yaml", "validate_schema"} <= {s["name"] for s in r["stages"]} else 1)' "$TEST_DATA_DIR/timings.json" 2>/dev/null \
+        && grep -q '^atriumn_pipeline_stage_seconds{command="validate-config",action="validate",stage="parse_yaml"}' "$TEST_DATA_DIR/timings.prom"; then
+        print_test_result "Config validation stage timings" "PASS"
+    else
+        print_test_result "Config validation stage timings" "FAIL" "Missing stage timings"
+    fi
+    
+    # Test 13: Fleet checks catch duplicate repo names and conflicting branch/expert settings
+    local fleet_dir="$TEST_DATA_DIR/fleet-configs"
+    mkdir -p "$fleet_dir"
+    cp "$TEST_DATA_DIR/valid-config.yml" "$fleet_dir/a.yml"
+    sed 's/test-repo/Test-Repo/' "$TEST_DATA_DIR/valid-config.yml" > "$fleet_dir/b.yml"
+    printf 'repo_name: "api"\nbase_branch: "main"\nthoughts_directory: "thoughts/"\nbranches:\n  prefix: "feature/api/"\nteam:\n  domain_experts:\n    backend: "@pat"\n' > "$fleet_dir/c.yml"
+    printf 'repo_name: "web"\nbase_branch: "main"\nthoughts_directory: "thoughts/"\nteam:\n  domain_experts:\n    frontend: "@pat"\n' > "$fleet_dir/d.yml"
+    # Schema-valid but not a single "@user": must be skipped, not abort the batch
+    printf 'repo_name: "mobile"\nbase_branch: "main"\nthoughts_directory: "thoughts/"\nteam:\n  domain_experts:\n    mobile: ["@x"]\n' > "$fleet_dir/e.yml"
+    output=$(python3 "$validator" "$fleet_dir" --batch --fleet --output json 2>/dev/null || true)
+    if echo "$output" | python3 -c 'import json, sys; f = json.load(sys.stdin)["fleet"]; sys.exit(0 if len(f["errors"]) == 1 and "test-repo" in f["errors"][0] and any("nested inside" in w for w in f["warnings"]) and any("@pat" in w for w in f["warnings"]) else 1)' \
+        && ! python3 "$validator" "$fleet_dir" --batch --fleet >/dev/null 2>&1 \
+        && rm "$fleet_dir/b.yml" && python3 "$validator" "$fleet_dir" --batch --fleet >/dev/null 2>&1; then
+        print_test_result "Config fleet consistency checks" "PASS"
+    else
+        print_test_result "Config fleet consistency checks" "FAIL" "$output"
+    fi
+    
+    # Test 14: Team usernames are checked once per user against a (stand-in) GitHub API, then cached
+    local stub_log="$TEST_DATA_DIR/github-stub.log"
+    python3 "$SCRIPT_DIR/github-api-stub.py" test-user --rate-limit --log "$stub_log" > "$TEST_DATA_DIR/github-stub.url" &
+    local stub_pid=$!
+    local attempt
+    for attempt in $(seq 50); do
+        [ -s "$TEST_DATA_DIR/github-stub.url" ] && break
+        sleep 0.1
+    done
+    local api_url
+    api_url=$(cat "$TEST_DATA_DIR/github-stub.url")
+    local identity_dir="$TEST_DATA_DIR/identity-configs"
+    mkdir -p "$identity_dir"
+    cp "$TEST_DATA_DIR/valid-config.yml" "$identity_dir/a.yml"
+    sed 's/test-repo/other-repo/' "$TEST_DATA_DIR/valid-config.yml" > "$identity_dir/b.yml"
+    output=$(python3 "$validator" "$identity_dir" --batch --check-identities --identity-api-url "$api_url" \
+        --cache-dir "$TEST_DATA_DIR/identity-cache" 2>&1 || true)
+    local requests
+    requests=$(wc -l < "$stub_log")
+    python3 "$validator" "$identity_dir/a.yml" --check-identities --identity-api-url "$api_url" \
+        --cache-dir "$TEST_DATA_DIR/identity-cache" >/dev/null 2>&1 || true
+    kill "$stub_pid" 2>/dev/null || true
+    wait "$stub_pid" 2>/dev/null || true
+    if [ "$(echo "$output" | grep -c "team.tech_lead: @test-lead is not a GitHub user")" -eq 2 ] \
+        && ! echo "$output" | grep -q "@test-user" && [ "$requests" -eq 4 ] \
+        && [ "$(wc -l < "$stub_log")" -eq 4 ]; then
+        print_test_result "Config team identity checks" "PASS"
+    else
+        print_test_result "Config team identity checks" "FAIL" "$output"
+    fi
+
+    # Test 15: The parsed schema is snapshotted once per schema hash and reused by later runs
+    local snapshot_cache="$TEST_DATA_DIR/snapshot-cache"
+    python3 "$validator" "$TEST_DATA_DIR/valid-config.yml" --no-daemon --cache-dir "$snapshot_cache" >/dev/null 2>&1 || true
+    output=$(python3 "$validator" "$TEST_DATA_DIR/valid-config.yml" --no-daemon --cache-dir "$snapshot_cache" 2>&1 || true)
+    if [ "$(ls "$snapshot_cache/schemas" 2>/dev/null | grep -c '\.marshal$')" -eq 1 ] \
+        && echo "$output" | grep -q "validation PASSED"; then
+        print_test_result "Config schema snapshot" "PASS"
+    else
+        print_test_result "Config schema snapshot" "FAIL" "$output"
+    fi
+
+    # Test 16: Array items are checked against their item schema, and --max-errors bounds the output
+    cat > "$TEST_DATA_DIR/bad-items-config.yml" << 'EOF'
+repo_name: "test-repo"
+base_branch: "main"
+thoughts_directory: "thoughts/"
+team:
+  default_reviewers: ["@ok", "not-a-handle", 7]
+notifications:
+  email_list: ["team@example.com", "nobody"]
+EOF
+    output=$(python3 "$validator" "$TEST_DATA_DIR/bad-items-config.yml" --no-daemon --no-cache 2>&1 || true)
+    local capped
+    capped=$(python3 "$validator" "$TEST_DATA_DIR/bad-items-config.yml" --no-daemon --max-errors 2 \
+        --cache-dir "$TEST_DATA_DIR/max-errors-cache" 2>&1 || true)
+    if echo "$output" | grep -q "team.default_reviewers\[1\]: Value 'not-a-handle' doesn't match pattern" \
+        && echo "$output" | grep -q "team.default_reviewers\[2\]: Expected string, got int" \
+        && echo "$output" | grep -q "notifications.email_list\[1\]: Value 'nobody' is not a valid email" \
+        && [ "$(echo "$capped" | grep -c "team.default_reviewers")" -eq 2 ] \
+        && echo "$capped" | grep -q "stopped after 2 error(s)"; then
+        print_test_result "Config array item validation" "PASS"
+    else
+        print_test_result "Config array item validation" "FAIL" "$output $capped"
+    fi
+
+    # Test 17: Without a daemon socket or timing options, the daemon client and timings aren't loaded
+    output=$(ATRIUMN_DAEMON_SOCKET="$TEST_DATA_DIR/no-daemon.sock" python3 -X importtime "$validator" \
+        "$TEST_DATA_DIR/valid-config.yml" --cache-dir "$TEST_DATA_DIR/startup-cache" 2>&1 || true)
+    if echo "$output" | grep -q "validation PASSED" \
+        && ! echo "$output" | grep -qE "socketserver|tracemalloc"; then
+        print_test_result "Config start-up imports" "PASS"
+    else
+        print_test_result "Config start-up imports" "FAIL" "$(echo "$output" | grep -E "socketserver|tracemalloc|FAILED")"
+    fi
+
+    # Test 18: Editing a schema that lives in a relatively watched config directory rebuilds the validator
+    local schema_watch_dir="$TEST_DATA_DIR/schema-watch"
+    mkdir -p "$schema_watch_dir/configs"
+    cp "$SCRIPTS_DIR/../configs/schema.yml" "$schema_watch_dir/configs/schema.yml"
+    cp "$TEST_DATA_DIR/valid-config.yml" "$schema_watch_dir/configs/repo.yml"
+    (cd "$schema_watch_dir" && exec python3 "$validator" configs/ --schema "$schema_watch_dir/configs/schema.yml" \
+        --watch --no-cache --debounce 0.1 > watch.log 2>&1) &
+    local schema_watch_pid=$!
+    sleep 1
+    sed -i 's/allowed_values: \["main", "master", "develop", "dev"\]/allowed_values: ["trunk"]/' \
+        "$schema_watch_dir/configs/schema.yml"
+    sleep 1.5
+    kill "$schema_watch_pid" 2>/dev/null || true
+    wait "$schema_watch_pid" 2>/dev/null || true
+    if grep -q "not in allowed values \['trunk'\]" "$schema_watch_dir/watch.log" \
+        && ! grep -q "schema.yml" "$schema_watch_dir/watch.log"; then
+        print_test_result "Config watch schema rebuild" "PASS"
+    else
+        print_test_result "Config watch schema rebuild" "FAIL" "$(cat "$schema_watch_dir/watch.log")"
+    fi
+
+    # Test 19: Empty and non-mapping files fail on their own instead of aborting the batch
+    local odd_dir="$TEST_DATA_DIR/odd-configs"
+    mkdir -p "$odd_dir"
+    cp "$TEST_DATA_DIR/valid-config.yml" "$odd_dir/valid.yml"
+    : > "$odd_dir/empty.yml"
+    printf -- '- just\n- a list\n' > "$odd_dir/list.yml"
+    output=$(python3 "$validator" --batch --jobs 2 --no-cache --output json "$odd_dir" 2>&1 || true)
+    if echo "$output" | python3 -c 'import json, sys; r = json.load(sys.stdin); e = {i["config_file"].rsplit("/", 1)[-1]: i.get("error", "") for i in r["results"]}; sys.exit(0 if (r["total"], r["passed"]) == (3, 1) and "empty file" in e["empty.yml"] and "got list" in e["list.yml"] else 1)'; then
+        print_test_result "Batch validation of empty and non-mapping configs" "PASS"
+    else
+        print_test_result "Batch validation of empty and non-mapping configs" "FAIL" "$output"
+    fi
+
+    # Test 20: A config with exactly --max-errors errors is reported in full, not as truncated
+    capped=$(python3 "$validator" "$TEST_DATA_DIR/bad-items-config.yml" --no-daemon --max-errors 3 --no-cache 2>&1 || true)
+    if [ "$(echo "$capped" | grep -c "\[[12]\]: ")" -eq 3 ] && ! echo "$capped" | grep -q "stopped after"; then
+        print_test_result "Config max errors not truncated at the limit" "PASS"
+    else
+        print_test_result "Config max errors not truncated at the limit" "FAIL" "$capped"
+    fi
+
+    # Test 21: Corrupt resolved config artifacts are misses, and the artifact cache is size bounded
+    local artifact
+    for artifact in "$cache_dir"/resolved/*.json; do
+        printf '{"truncated' > "$artifact"
+    done
+    python3 "$validator" "$TEST_DATA_DIR/valid-config.yml" --resolve --cache-dir "$cache_dir" \
+        --resolved-output "$TEST_DATA_DIR/resolved-again.json" >/dev/null 2>&1 || true
+    if diff -q "$TEST_DATA_DIR/resolved.json" "$TEST_DATA_DIR/resolved-again.json" >/dev/null 2>&1 \
+        && python3 -c '
+import sys
+from pathlib import Path
+sys.path.insert(0, sys.argv[1])
+from pipeline_common import load_script
+validate_config = load_script("validate-config")
+data, configs = Path(sys.argv[2]), Path(sys.argv[1]).parent / "configs"
+validator = validate_config.ConfigValidator(configs / "schema.yml")
+resolver = validate_config.ConfigResolver(validator, configs / "default.yml", data / "bounded-cache", max_bytes=8192)
+template = (data / "valid-config.yml").read_text()
+for n in range(20):
+    config = data / "bounded-config.yml"
+    config.write_text(template.replace("test-repo", f"test-repo-{n}"))
+    resolver.resolve(config)
+sizes = [path.stat().st_size for path in resolver.cache_dir.glob("*.json")]
+sys.exit(0 if 1 < len(sizes) < 20 and sum(sizes) <= 8192 else 1)
+' "$SCRIPTS_DIR" "$TEST_DATA_DIR" 2>/dev/null; then
+        print_test_result "Resolved config cache recovery and eviction" "PASS"
+    else
+        print_test_result "Resolved config cache recovery and eviction" "FAIL" "Corrupt artifact served or cache unbounded"
+    fi
+
+    # Test 22: Identity checks back off on a Retry-After given as an HTTP date
+    local date_log="$TEST_DATA_DIR/github-stub-date.log"
+    python3 "$SCRIPT_DIR/github-api-stub.py" test-user --rate-limit --retry-after-date --log "$date_log" \
+        > "$TEST_DATA_DIR/github-stub-date.url" &
+    stub_pid=$!
+    for attempt in $(seq 50); do
+        [ -s "$TEST_DATA_DIR/github-stub-date.url" ] && break
+        sleep 0.1
+    done
+    api_url=$(cat "$TEST_DATA_DIR/github-stub-date.url")
+    output=$(python3 "$validator" "$identity_dir/a.yml" --check-identities --identity-api-url "$api_url" \
+        --cache-dir "$TEST_DATA_DIR/identity-date-cache" 2>&1 || true)
+    kill "$stub_pid" 2>/dev/null || true
+    wait "$stub_pid" 2>/dev/null || true
+    if echo "$output" | grep -q "team.tech_lead: @test-lead is not a GitHub user" \
+        && ! echo "$output" | grep -q "@test-user" && [ "$(wc -l < "$date_log")" -eq 4 ]; then
+        print_test_result "Config identity checks with an HTTP-date Retry-After" "PASS"
+    else
+        print_test_result "Config identity checks with an HTTP-date Retry-After" "FAIL" "$output"
+    fi
+
+    # Test 23: Configs with YAML dates validate and resolve like any other, just without being cached
+    local dated_dir="$TEST_DATA_DIR/dated-configs"
+    mkdir -p "$dated_dir"
+    { cat "$TEST_DATA_DIR/valid-config.yml"; echo "last_reviewed: 2025-01-01"; } > "$dated_dir/a.yml"
+    sed 's/test-repo/other-repo/' "$dated_dir/a.yml" > "$dated_dir/b.yml"
+    local single batch resolved
+    single=$(python3 "$validator" "$dated_dir/a.yml" --cache-dir "$TEST_DATA_DIR/dated-cache" 2>&1 || true)
+    batch=$(python3 "$validator" "$dated_dir" --batch --jobs 2 --cache-dir "$TEST_DATA_DIR/dated-cache" 2>&1 || true)
+    resolved=$(python3 "$validator" "$dated_dir/a.yml" --resolve --cache-dir "$TEST_DATA_DIR/dated-cache" 2>&1 || true)
+    if echo "$single" | grep -q "validation PASSED" && echo "$single" | grep -q "Unknown field (will be ignored): last_reviewed" \
+        && echo "$batch" | grep -q "2/2 passed" && echo "$resolved" | grep -q '"last_reviewed": "2025-01-01"'; then
+        print_test_result "Config with YAML dates" "PASS"
+    else
+        print_test_result "Config with YAML dates" "FAIL" "$single $batch $resolved"
+    fi
+
+    # Test 24: An unwritable cache directory only disables caching
+    local not_a_dir="$TEST_DATA_DIR/not-a-directory"
+    : > "$not_a_dir"
+    single=$(python3 "$validator" "$SCRIPTS_DIR/../configs/platform-api.yml" --cache-dir "$not_a_dir/cache" 2>&1 || true)
+    batch=$(python3 "$validator" "$SCRIPTS_DIR/../configs" --batch --report --cache-dir "$not_a_dir/cache" 2>&1 || true)
+    if echo "$single" | grep -q "validation PASSED" && echo "$batch" | grep -qE "([0-9]+)/\1 passed"; then
+        print_test_result "Config validation with an unwritable cache directory" "PASS"
+    else
+        print_test_result "Config validation with an unwritable cache directory" "FAIL" "$single $batch"
+    fi
+
+    # Test 25: Reports only show notifications for configs that set up a channel or list
+    sed '/^notifications:/,/^[a-z]/{/^notifications:/d;/^  /d;}' "$TEST_DATA_DIR/valid-config.yml" \
+        > "$TEST_DATA_DIR/no-notifications-config.yml"
+    local with_notifications without_notifications
+    with_notifications=$(python3 "$validator" "$TEST_DATA_DIR/valid-config.yml" --report --no-cache 2>&1 || true)
+    without_notifications=$(python3 "$validator" "$TEST_DATA_DIR/no-notifications-config.yml" --report \
+        --cache-dir "$TEST_DATA_DIR/notifications-cache" 2>&1 || true)
+    if echo "$with_notifications" | grep -q "Notifications: ✅" && echo "$without_notifications" | grep -q "Notifications: ❌"; then
+        print_test_result "Config report without notifications" "PASS"
+    else
+        print_test_result "Config report without notifications" "FAIL" "$without_notifications"
+    fi
+}
+
+# Test decision record management script
+test_decision_record_management() {
+    echo
+    echo -e "${BLUE}Testing Decision Record Management Script${NC}"
+    echo "==========================================="
+    
+    local manager="$SCRIPTS_DIR/manage-decision-record.py"
+    local record="$TEST_DATA_DIR/decisions/pipeline-issue-1.md"
+    local work="$TEST_DATA_DIR/decisions/work.md"
+    local output
+    
+    # Test 1: Analysis counts sections and phases
+    output=$(python3 "$manager" "$record" --action analyze 2>&1 || true)
+    if echo "$output" | grep -q "Completed Phases: 1/2" && echo "$output" | grep -q "Sections: 4" \
+        && echo "$output" | grep -q "Subsections: 1" && echo "$output" | grep -q "Lines: 23"; then
+        print_test_result "Decision record analysis" "PASS"
+    else
+        print_test_result "Decision record analysis" "FAIL" "Unexpected analysis output"
+    fi
+    
+    # Test 2: Compression wraps only completed phases
+    cp "$record" "$work"
+    python3 "$manager" "$work" --action compress >/dev/null 2>&1 || true
+    if [ "$(grep -c "<summary>📋 Phase Summary" "$work")" -eq 1 ] \
+        && grep -q "^## Planning Phase (Starting)$" "$work" \
+        && grep -q "^- \*\*Document\*\*: \`thoughts/shared/research/issue-1.md\`$" "$work"; then
+        print_test_result "Decision record compression" "PASS"
+    else
+        print_test_result "Decision record compression" "FAIL" "Completed phase not compressed as expected"
+    fi
+    
+    # Test 3: Repeated compression never re-wraps collapsed phases
+    cp "$work" "$work.compressed"
+    python3 "$manager" "$work" --action compress >/dev/null 2>&1 || true
+    if diff -q "$work" "$work.compressed" >/dev/null 2>&1; then
+        print_test_result "Decision record compression is idempotent" "PASS"
+    else
+        print_test_result "Decision record compression is idempotent" "FAIL" "Collapsed phase was wrapped again"
+    fi
+    
+    # Test 4: Incremental compression skips unchanged records and compresses only new phases
+    output=$(python3 "$manager" "$work" --action compress --incremental 2>&1 || true)
+    printf '\n## Planning Phase (Complete ✅)\n- **Status**: Plan approved\n' >> "$work"
+    python3 "$manager" "$work" --action compress --incremental >/dev/null 2>&1 || true
+    if echo "$output" | grep -q "No newly completed phases" \
+        && [ "$(grep -c "<summary>📋 Phase Summary" "$work")" -eq 2 ]; then
+        print_test_result "Decision record incremental compression" "PASS"
+    else
+        print_test_result "Decision record incremental compression" "FAIL" "Unexpected incremental compression result"
+    fi
+    
+    # Test 5: Summarization archives completed phases
+    cp "$record" "$work"
+    python3 "$manager" "$work" --action summarize >/dev/null 2>&1 || true
+    if grep -q "^## Archived Sections$" "$work" && ! grep -q "Finding one" "$work" \
+        && grep -q "Finding one" "$TEST_DATA_DIR/decisions/work-archive/research-phase-details.md" 2>/dev/null; then
+        print_test_result "Decision record summarization" "PASS"
+    else
+        print_test_result "Decision record summarization" "FAIL" "Completed phase not archived as expected"
+    fi
+    
+    # Test 6: Restore brings back the original record
+    python3 "$manager" "$work" --action restore >/dev/null 2>&1 || true
+    if diff -q "$record" "$work" >/dev/null 2>&1; then
+        print_test_result "Decision record restore" "PASS"
+    else
+        print_test_result "Decision record restore" "FAIL" "Restored record differs from original"
+    fi
+    
+    # Test 7: Backups are deduplicated snapshots listed from the manifest
+    local snapshots
+    snapshots=$(python3 "$manager" "$work" --action backups 2>/dev/null | wc -l)
+    python3 "$manager" "$work" --action gc --keep-backups 1 >/dev/null 2>&1 || true
+    if [ "$snapshots" -ge 2 ] && [ "$(python3 "$manager" "$work" --action backups 2>/dev/null | wc -l)" -eq 1 ] \
+        && [ ! -e "$TEST_DATA_DIR/decisions/work-archive/decision-record-backup-"* ]; then
+        print_test_result "Decision record backup store" "PASS"
+    else
+        print_test_result "Decision record backup store" "FAIL" "Unexpected backup snapshots"
+    fi
+    
+    # Test 8: Concurrent updates keep the record and its backups consistent
+    output=$(python3 "$SCRIPT_DIR/stress-decision-record.py" "$record" --workers 8 --rounds 2 2>&1 || true)
+    if echo "$output" | grep -q "stress test PASSED"; then
+        print_test_result "Decision record concurrent updates" "PASS"
+    else
+        print_test_result "Decision record concurrent updates" "FAIL" "$output"
+    fi
+    
+    # Test 9: Tree mode maintains every record once and skips unchanged ones afterwards
+    local tree="$TEST_DATA_DIR/decision-tree"
+    mkdir -p "$tree/nested"
+    cp "$record" "$tree/pipeline-issue-1.md"
+    cp "$record" "$tree/nested/pipeline-issue-2.md"
+    local first second
+    first=$(python3 "$manager" "$tree" --tree --jobs 2 2>/dev/null || true)
+    second=$(python3 "$manager" "$tree" --tree 2>/dev/null || true)
+    if echo "$first" | python3 -c 'import json, sys; r = json.load(sys.stdin); sys.exit(0 if (r["total"], r["processed"], r["failed"]) == (2, 2, 0) else 1)' \
+        && echo "$second" | python3 -c 'import json, sys; r = json.load(sys.stdin); sys.exit(0 if (r["skipped"], r["bytes_reclaimed"]) == (2, 0) else 1)'; then
+        print_test_result "Decision record tree maintenance" "PASS"
+    else
+        print_test_result "Decision record tree maintenance" "FAIL" "Unexpected tree summary"
+    fi
+    
+    # Test 10: Watch mode compresses a record once its phase is marked complete
+    local watch_dir="$TEST_DATA_DIR/decision-watch"
+    mkdir -p "$watch_dir"
+    {
+        printf '# Decision Record\n\n## Research Phase\n'
+        seq 1 160 | sed 's/^/- Finding /'
+        printf '\n## Planning Phase\n- **Status**: in progress\n'
+    } > "$watch_dir/record.md"
+    python3 "$manager" "$watch_dir" --watch --debounce 0.1 > "$TEST_DATA_DIR/decision-watch.log" 2>&1 &
+    local watch_pid=$!
+    sleep 1
+    sed -i 's/^## Research Phase$/## Research Phase (Complete ✅)/' "$watch_dir/record.md"
+    sleep 1.5
+    kill "$watch_pid" 2>/dev/null || true
+    wait "$watch_pid" 2>/dev/null || true
+    if grep -q "record.md: compressed" "$TEST_DATA_DIR/decision-watch.log" \
+        && [ "$(grep -c "record.md" "$TEST_DATA_DIR/decision-watch.log")" -eq 1 ] \
+        && grep -q "<summary>📋 Phase Summary" "$watch_dir/record.md"; then
+        print_test_result "Decision record watch mode" "PASS"
+    else
+        print_test_result "Decision record watch mode" "FAIL" "$(cat "$TEST_DATA_DIR/decision-watch.log")"
+    fi
+    
+    # Test 11: Stage timings cover the record rewrite and its backup
+    cp "$record" "$work"
+    output=$(python3 "$manager" "$work" --action compress --timings 2>&1 >/dev/null || true)
+    if echo "$output" | python3 -c 'import json, sys; r = json.load(sys.stdin); sys.exit(0 if {"lock_wait", "backup", "rewrite", "index"} <= {s["name"] for s in r["stages"]} else 1)'; then
+        print_test_result "Decision record stage timings" "PASS"
+    else
+        print_test_result "Decision record stage timings" "FAIL" "$output"
+    fi
+    
+    # Test 12: Budget summarization keeps priority sections and archives the rest
+    local budgeted="$TEST_DATA_DIR/decisions/budgeted.md"
+    {
+        printf '# Decision Record\n\n## Issue Context\n- **Issue**: #7\n\n'
+        printf '## Research Phase (Complete ✅)\n- **Status**: Validation passed\n'
+        seq 1 300 | sed 's/^/- Finding /'
+        printf '\n## Planning Phase\n- **Status**: in progress\n'
+    } > "$budgeted"
+    python3 "$manager" "$budgeted" --auto --budget-tokens 200 >/dev/null 2>&1 || true
+    if [ "$(wc -c < "$budgeted")" -le 800 ] && grep -q "^- \*\*Issue\*\*: #7$" "$budgeted" \
+        && grep -q "^- \*\*Status\*\*: in progress$" "$budgeted" \
+        && grep -q "^- \*\*Status\*\*: Validation passed$" "$budgeted" && ! grep -q "Finding 150" "$budgeted" \
+        && grep -q "^- Finding 150$" "$TEST_DATA_DIR/decisions/budgeted-archive/budget-"*.md 2>/dev/null; then
+        print_test_result "Decision record budget summarization" "PASS"
+    else
+        print_test_result "Decision record budget summarization" "FAIL" "$(cat "$budgeted")"
+    fi
+    
+    # Test 13: --get-section reads one section through an index rebuilt when the record changes
+    cp "$record" "$work"
+    local section
+    section=$(python3 "$manager" "$work" --get-section "Research Phase" 2>&1 || true)
+    sed -i 's/^- \*\*Title\*\*: Test Issue$/- **Title**: Renamed Issue/' "$work"
+    if echo "$section" | head -1 | grep -q "^## Research Phase (Complete ✅)$" \
+        && echo "$section" | grep -q "Finding two" && ! echo "$section" | grep -q "Planning Phase" \
+        && [ -f "$TEST_DATA_DIR/decisions/work-archive/section-index.json" ] \
+        && python3 "$manager" "$work" --get-section "Issue Context" 2>&1 | grep -q "Renamed Issue" \
+        && ! python3 "$manager" "$work" --get-section "Missing Phase" >/dev/null 2>&1; then
+        print_test_result "Decision record section lookup" "PASS"
+    else
+        print_test_result "Decision record section lookup" "FAIL" "$section"
+    fi
+    
+    # Test 14: Retention during saves also deletes the objects only dropped snapshots used
+    local retained="$TEST_DATA_DIR/decisions/retained.md"
+    cp "$record" "$retained"
+    local save
+    for save in $(seq 20); do
+        printf '\n## Note %s\n- **Status**: save %s\n' "$save" "$save" >> "$retained"
+        python3 "$manager" "$retained" --action compress --keep-backups 2 >/dev/null 2>&1 || true
+    done
+    if python3 -c '
+import json, sys
+from pathlib import Path
+store = Path(sys.argv[1])
+snapshots = json.load(open(store / "manifest.json"))["snapshots"]
+referenced = {digest for snap in snapshots for digest in snap["chunks"]}
+objects = {path.name for path in (store / "objects").glob("*/*")}
+sys.exit(0 if len(snapshots) == 2 and objects == referenced else 1)
+' "$TEST_DATA_DIR/decisions/retained-archive/backups" 2>/dev/null; then
+        print_test_result "Decision record backup retention reclaims objects" "PASS"
+    else
+        print_test_result "Decision record backup retention reclaims objects" "FAIL" "Unreferenced backup objects left behind"
+    fi
+    
+    # Test 15: A completed final phase keeps its trailing newline inside the collapsed details
+    cp "$record" "$work"
+    printf '\n## Planning Phase (Complete ✅)\n- **Status**: Plan approved\n' >> "$work"
+    python3 "$manager" "$work" --action compress --incremental >/dev/null 2>&1 || true
+    if python3 -c 'import sys; sys.exit(0 if open(sys.argv[1]).read().endswith("Plan approved\n\n</details>\n</details>\n") else 1)' "$work"; then
+        print_test_result "Decision record compression of the final phase" "PASS"
+    else
+        print_test_result "Decision record compression of the final phase" "FAIL" "Trailing newline moved"
+    fi
+    
+    # Test 16: CRLF records keep CRLF line endings when compressed, and stay collapsed
+    local crlf="$TEST_DATA_DIR/decisions/crlf.md"
+    sed 's/$/\r/' "$record" > "$crlf"
+    python3 "$manager" "$crlf" --action compress --incremental >/dev/null 2>&1 || true
+    cp "$crlf" "$crlf.compressed"
+    python3 "$manager" "$crlf" --action compress >/dev/null 2>&1 || true
+    if [ "$(grep -c "<summary>📋 Phase Summary" "$crlf")" -eq 1 ] && ! grep -qv $'\r$' "$crlf" \
+        && diff -q "$crlf" "$crlf.compressed" >/dev/null 2>&1; then
+        print_test_result "Decision record compression keeps CRLF line endings" "PASS"
+    else
+        print_test_result "Decision record compression keeps CRLF line endings" "FAIL" "Mixed line endings or phase wrapped again"
+    fi
+    
+    # Test 17: Tree mode reports unreadable and vanished records as failed and carries on
+    local broken="$TEST_DATA_DIR/decision-tree-broken"
+    mkdir -p "$broken"
+    cp "$record" "$broken/pipeline-issue-1.md"
+    printf '## Research Phase\n\xff\xfe\n' > "$broken/binary.md"
+    ln -sf "$broken/missing-target" "$broken/dangling.md"
+    output=$(python3 "$manager" "$broken" --tree 2>/dev/null || true)
+    if echo "$output" | python3 -c 'import json, sys; r = json.load(sys.stdin); sys.exit(0 if (r["total"], r["failed"], r["actions"].get("error")) == (3, 2, 2) else 1)' 2>/dev/null; then
+        print_test_result "Decision record tree maintenance with broken records" "PASS"
+    else
+        print_test_result "Decision record tree maintenance with broken records" "FAIL" "$output"
+    fi
+    
+    # Test 18: A record over budget with nothing that can be dropped is reported, not mistaken for fitting
+    local flat="$TEST_DATA_DIR/decisions/flat.md"
+    for save in $(seq 40); do
+        echo "A note in a record without any sections." >> "$flat"
+    done
+    local auto
+    auto=$(python3 "$manager" "$flat" --auto --budget-bytes 500 2>&1 || true)
+    output=$(python3 "$manager" "$flat" --action summarize --budget-bytes 500 2>&1 || true)
+    if echo "$auto" | grep -q "can't be reduced to fit" && echo "$output" | grep -q "can't be reduced to its 500 byte budget" \
+        && ! echo "$output" | grep -q "already fits"; then
+        print_test_result "Decision record budget that cannot be met" "PASS"
+    else
+        print_test_result "Decision record budget that cannot be met" "FAIL" "$auto $output"
+    fi
+}
+
+test_decision_analytics() {
+    echo
+    echo -e "${BLUE}Testing Decision Record Analytics${NC}"
+    echo "=================================="
+    
+    local analytics="$SCRIPTS_DIR/decision-analytics.py"
+    local db="$TEST_DATA_DIR/analytics.sqlite"
+    local fleet="$TEST_DATA_DIR/fleet"
+    local template="$SCRIPT_DIR/../templates/decision-record-template.md"
+    local output
+    
+    mkdir -p "$fleet/repo-a" "$fleet/repo-b"
+    sed -e 's/{repo_name}/repo-a/; s/{research_start_date}/2025-08-01T09:00:00/; s/{research_completion_date}/2025-08-01T15:00:00/; s/{planning_start_date}/2025-08-02/' \
+        "$template" > "$fleet/repo-a/pipeline-issue-1.md"
+    sed -e 's/{repo_name}/repo-b/; s/{research_start_date}/2025-08-01T09:00:00/; s/{research_completion_date}/2025-08-01T11:00:00/' \
+        "$template" > "$fleet/repo-b/pipeline-issue-2.md"
+    
+    # Test 1: Records are indexed once and only changed or deleted records are updated afterwards
+    local first second
+    first=$(python3 "$analytics" --db "$db" index "$fleet" 2>&1 || true)
+    printf '\n## Lessons Learned\n- Keep phases small\n' >> "$fleet/repo-a/pipeline-issue-1.md"
+    cp "$fleet/repo-b/pipeline-issue-2.md" "$fleet/repo-b/pipeline-issue-3.md"
+    rm "$fleet/repo-b/pipeline-issue-2.md"
+    second=$(python3 "$analytics" --db "$db" index "$fleet" 2>&1 || true)
+    if echo "$first" | grep -q "Indexed 2 record(s), 0 unchanged" \
+        && echo "$second" | grep -q "Indexed 2 record(s), 0 unchanged, 1 removed"; then
+        print_test_result "Analytics incremental indexing" "PASS"
+    else
+        print_test_result "Analytics incremental indexing" "FAIL" "$first / $second"
+    fi
+    
+    # Test 2: Aggregate reports come from the index
+    output=$(python3 "$analytics" --db "$db" report phases --output json 2>&1 || true)
+    if echo "$output" | python3 -c 'import json, sys; r = {p["phase"]: p for p in json.load(sys.stdin)}; sys.exit(0 if (r["Research Phase"]["avg_hours"], r["Research Phase"]["completed"], r["Planning Phase"]["in_progress"]) == (4.0, 2, 1) else 1)' \
+        && python3 "$analytics" --db "$db" report stalled --days 1 2>&1 | grep -q "repo-a .*Planning Phase"; then
+        print_test_result "Analytics phase reports" "PASS"
+    else
+        print_test_result "Analytics phase reports" "FAIL" "$output"
+    fi
+    
+    # Test 3: Records that vanish before they are read are skipped, not fatal to the update
+    ln -sf "$fleet/missing-target" "$fleet/repo-b/pipeline-issue-4.md"
+    output=$(python3 "$analytics" --db "$db" index "$fleet" 2>&1 || true)
+    rm -f "$fleet/repo-b/pipeline-issue-4.md"
+    if echo "$output" | grep -q "0 removed, 1 skipped"; then
+        print_test_result "Analytics indexing with vanished records" "PASS"
+    else
+        print_test_result "Analytics indexing with vanished records" "FAIL" "$output"
+    fi
+}
+
+test_pipeline_daemon() {
+    echo
+    echo -e "${BLUE}Testing Pipeline Daemon${NC}"
+    echo "========================"
+    
+    local daemon="$SCRIPTS_DIR/pipeline-daemon.py"
+    local validator="$SCRIPTS_DIR/validate-config.py"
+    local config="$TEST_DATA_DIR/valid-config.yml"
+    
+    python3 "$daemon" >/dev/null 2>&1 &
+    local daemon_pid=$!
+    local attempt
+    for attempt in $(seq 50); do
+        python3 "$daemon" --status >/dev/null 2>&1 && break
+        sleep 0.1
+    done
+    
+    # Test 1: CLI results served by the daemon match in-process results
+    local served in_process
+    served=$(python3 "$validator" "$config" --output json --no-cache 2>/dev/null || true)
+    in_process=$(python3 "$validator" "$config" --output json --no-cache --no-daemon 2>/dev/null || true)
+    if [ -n "$served" ] && [ "$served" = "$in_process" ] \
+        && python3 "$daemon" --status 2>/dev/null | grep -q "Requests served: [2-9]"; then
+        print_test_result "Daemon serves validation requests" "PASS"
+    else
+        print_test_result "Daemon serves validation requests" "FAIL" "Daemon result missing or different"
+    fi
+    
+    # Test 2: Decision record analysis goes through the daemon too
+    if python3 "$SCRIPTS_DIR/manage-decision-record.py" "$TEST_DATA_DIR/decisions/pipeline-issue-1.md" 2>/dev/null | grep -q "Lines: 23"; then
+        print_test_result "Daemon serves decision record analysis" "PASS"
+    else
+        print_test_result "Daemon serves decision record analysis" "FAIL" "Unexpected analysis through daemon"
+    fi
+    
+    # Test 3: CLIs fall back to in-process work once the daemon is stopped
+    python3 "$daemon" --stop >/dev/null 2>&1 || kill "$daemon_pid" 2>/dev/null || true
+    wait "$daemon_pid" 2>/dev/null || true
+    if [ ! -S "$ATRIUMN_CACHE_DIR/daemon.sock" ] \
+        && python3 "$validator" "$config" --no-cache 2>/dev/null | grep -q "validation PASSED"; then
+        print_test_result "CLI falls back without daemon" "PASS"
+    else
+        print_test_result "CLI falls back without daemon" "FAIL" "Validation failed after daemon stopped"
+    fi
+}
+
 # Test script help functionality
 test_help_functionality() {
     echo
@@ -438,6 +1258,11 @@ main() {
     test_help_functionality
     test_research_validation
     test_plan_validation
+    test_document_validation
+    test_config_validation
+    test_decision_record_management
+    test_decision_analytics
+    test_pipeline_daemon
     
     cleanup
     print_summary